@@ -0,0 +1,39 @@
+"""
+Fill ledger throughput: record N alternating grid fills and report per-fill cost and
+history memory.
+
+Run: python -m benchmarks.bench_ledger
+"""
+import time
+import random
+
+from src.bot.state import BotPhase
+from src.bot.ledger import FillLedger
+
+def bench(n: int = 1_000_000, levels: int = 20):
+    rng = random.Random(7)
+    ledger = FillLedger(fee_rate=0.001)
+    index = levels // 2
+    side = BotPhase.BUY
+
+    start = time.perf_counter()
+    for i in range(n):
+        price = 100.0 * (1.01 ** index)
+        ledger.record_fill(side, price, 0.01, index, timestamp=float(i))
+        if side == BotPhase.BUY:
+            index = min(index + 1, levels)
+            side = BotPhase.SELL
+        else:
+            index = max(index - 1 - rng.randint(0, 1), 0)
+            side = BotPhase.BUY
+    elapsed = time.perf_counter() - start
+
+    columns = (ledger.timestamps, ledger.sides, ledger.prices, ledger.qtys,
+               ledger.grid_indexes, ledger.fees, ledger.realized)
+    history_bytes = sum(c.itemsize * len(c) for c in columns)
+    print(f"{n} fills in {elapsed:.2f} s ({elapsed / n * 1e6:.2f} us/fill), "
+          f"history {history_bytes / n:.0f} B/fill, realized {ledger.realized_pnl:.2f}, "
+          f"open lots {len(ledger.open_lots())}")
+
+if __name__ == "__main__":
+    bench()
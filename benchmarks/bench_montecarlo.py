@@ -0,0 +1,24 @@
+"""
+Monte Carlo stress test throughput: one grid config over 100k one-day paths of 1-minute prices.
+
+Run: python -m benchmarks.bench_montecarlo
+"""
+import time
+
+from src.core.config import GridConfig
+from src.sim.montecarlo import GBM, JumpDiffusion, stress_test
+
+def bench(paths: int = 100_000, steps: int = 24 * 60):
+    config = GridConfig(grid_intervals=20, range_pct_bottom=-0.05, range_pct_top=0.05)
+    for model in (GBM(0.0008), JumpDiffusion(0.0008, jump_rate=0.001, jump_std=0.01)):
+        start = time.perf_counter()
+        result = stress_test(config, model, paths, steps, seed=11)
+        elapsed = time.perf_counter() - start
+        pct = result.percentiles((5, 50, 95))
+        print(f"{type(model).__name__}: {paths} paths x {steps} steps in {elapsed:.1f} s "
+              f"({elapsed / (paths * steps) * 1e9:.0f} ns/path-step), "
+              f"PnL p5/p50/p95 {pct['pnl'][5]:.3f}/{pct['pnl'][50]:.3f}/{pct['pnl'][95]:.3f}, "
+              f"P(loss) {result.loss_probability():.2%}")
+
+if __name__ == "__main__":
+    bench()
@@ -0,0 +1,38 @@
+"""
+Order-ack latency: REST placement/cancel vs the persistent WebSocket API connection,
+against the local stand-ins (so only transport overhead is measured).
+
+Run: python -m benchmarks.bench_order_ack
+"""
+import time
+
+from src.exchange.binance import BinanceSpotAdapter
+from src.exchange.binance_ws import BinanceWebSocketAdapter
+from tests.binance_standin import BinanceStandIn
+
+def _latencies(adapter, n: int):
+    samples = []
+    for i in range(n):
+        start = time.perf_counter()
+        order_id = adapter.place_limit_order("BTCUSDT", "BUY", price=90.0, qty=0.1, client_order_id=f"gb_bench_{i}")
+        samples.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        adapter.cancel_order("BTCUSDT", order_id)
+        samples.append(time.perf_counter() - start)
+    return sorted(samples)
+
+def bench(n: int = 1000):
+    with BinanceStandIn() as standin:
+        rest = BinanceSpotAdapter(api_key="key", api_secret="secret", base_url=standin.base_url)
+        ws = BinanceWebSocketAdapter(api_key="key", api_secret="secret", base_url=standin.base_url, ws_url=standin.ws_url)
+        # Warm-up: connection setup is not part of the steady state
+        _latencies(ws, 10)
+        for name, adapter in (("REST", rest), ("WebSocket", ws)):
+            samples = _latencies(adapter, n)
+            p50 = samples[len(samples) // 2]
+            p99 = samples[int(len(samples) * 0.99)]
+            print(f"{name:>9}: {len(samples)} acks, p50 {p50 * 1e3:.2f} ms, p99 {p99 * 1e3:.2f} ms, max {samples[-1] * 1e3:.2f} ms")
+        ws.close()
+
+if __name__ == "__main__":
+    bench()
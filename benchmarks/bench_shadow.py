@@ -0,0 +1,32 @@
+"""
+Shadow grid overhead: feeding tick prices to 100 paper grids with different spacings.
+
+Run: python -m benchmarks.bench_shadow
+"""
+import math
+import time
+
+from src.core.config import GridConfig
+from src.exchange.base import SymbolRules
+from src.bot.shadow import ShadowGrid
+
+def bench(num_shadows: int = 100, ticks: int = 20_000):
+    rules = SymbolRules(0.01, 0.00001, 0.0, 0.0)
+    shadows = [
+        ShadowGrid(f"g{i}", GridConfig(grid_intervals=4 + i, trailing=i % 2 == 0), rules, p0=100.0)
+        for i in range(num_shadows)
+    ]
+    prices = [100.0 * (1 + 0.05 * math.sin(i / 50.0) + 0.002 * math.sin(i * 1.7)) for i in range(ticks)]
+
+    start = time.perf_counter()
+    for price in prices:
+        for shadow in shadows:
+            shadow.on_price(price)
+    elapsed = time.perf_counter() - start
+
+    fills = sum(s.result().fills for s in shadows)
+    print(f"{ticks} ticks x {num_shadows} shadows in {elapsed:.2f} s "
+          f"({elapsed / (ticks * num_shadows) * 1e6:.2f} us per shadow tick, {fills} paper fills)")
+
+if __name__ == "__main__":
+    bench()
@@ -0,0 +1,87 @@
+"""
+One-shot startup benchmark: import-time budget and cold-to-order-placed wall time
+for `python -m src.main --run-once` against the local stand-in, with and without a
+startup snapshot.
+
+Run: python -m benchmarks.bench_startup
+"""
+import os
+import re
+import sys
+import time
+import tempfile
+import subprocess
+
+from tests.binance_standin import BinanceStandIn
+
+# Cumulative import time budget for src.main (microseconds). requests (~100 ms on a cold
+# interpreter) and the optional features are imported on first use, outside this budget.
+IMPORT_BUDGET_US = 150_000
+
+CONFIG = """grid:
+  symbol: "BTCUSDT"
+  mode: "LONG"
+  initial_capital_amount: 1000.0
+  range_pct_bottom: -0.10
+  range_pct_top: 0.10
+  grid_intervals: 20
+dry_run: false
+"""
+
+def import_time_us() -> int:
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import src.main"],
+        capture_output=True, text=True, check=True,
+    ).stderr
+    for line in out.splitlines():
+        m = re.match(r"import time:\s+\d+ \|\s+(\d+) \| src\.main$", line)
+        if m:
+            return int(m.group(1))
+    raise RuntimeError("src.main not found in -X importtime output")
+
+def run_once(workdir: str, base_url: str) -> float:
+    env = dict(os.environ)
+    env.update({
+        "EXCHANGE_API_KEY": "key",
+        "EXCHANGE_API_SECRET": "secret",
+        "EXCHANGE_BASE_URL": base_url,
+    })
+    state = os.path.join(workdir, "state.json")
+    if os.path.exists(state):
+        os.remove(state)
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-m", "src.main", "--run-once",
+         "--config", os.path.join(workdir, "config.yaml"), "--state", state],
+        env=env, capture_output=True, check=True,
+    )
+    return time.perf_counter() - start
+
+def bench(runs: int = 5):
+    us = import_time_us()
+    status = "OK" if us <= IMPORT_BUDGET_US else "OVER BUDGET"
+    print(f"import src.main: {us / 1000:.1f} ms (budget {IMPORT_BUDGET_US / 1000:.0f} ms) {status}")
+
+    with tempfile.TemporaryDirectory() as tmp, BinanceStandIn() as standin:
+        with open(os.path.join(tmp, "config.yaml"), "w") as f:
+            f.write(CONFIG)
+        snapshot = os.path.join(tmp, "state.json.snapshot")
+
+        cold = []
+        for _ in range(runs):
+            if os.path.exists(snapshot):
+                os.remove(snapshot)
+            cold.append(run_once(tmp, standin.base_url))
+        info_calls = sum(1 for _, p in standin.paths if p == "/api/v3/exchangeInfo")
+
+        warm = [run_once(tmp, standin.base_url) for _ in range(runs)]
+        warm_info = sum(1 for _, p in standin.paths if p == "/api/v3/exchangeInfo") - info_calls
+
+        assert len(standin.orders) == 2 * runs, "every run should place exactly one order"
+
+    print(f"cold-to-order-placed: no snapshot {min(cold) * 1000:.0f} ms, "
+          f"snapshot {min(warm) * 1000:.0f} ms (best of {runs})")
+    print(f"exchangeInfo calls: no snapshot {info_calls}, snapshot {warm_info}")
+
+if __name__ == "__main__":
+    bench()
@@ -0,0 +1,58 @@
+"""
+State persistence benchmark: JSON vs compact binary encode/decode and file round-trips,
+plus per-object memory for slotted state classes.
+
+Run: python -m benchmarks.bench_state
+"""
+import os
+import sys
+import json
+import timeit
+import tempfile
+import tracemalloc
+from dataclasses import asdict
+
+from src.bot.state import GridState, BotPhase, BotStateRole, ActiveOrder
+from src.bot.persistence import save_state, load_state, encode_state, decode_state
+
+def sample_state() -> GridState:
+    return GridState(
+        phase=BotPhase.SELL,
+        state=BotStateRole.WAITING_ORDER_FILL,
+        p0_reference_price=50000.0,
+        active_order=ActiveOrder("123456789", BotPhase.SELL, 50123.45, 0.00123, 11, "OPEN"),
+        last_filled_index=10,
+        realized_pnl=12.345,
+        estimated_balances={"BTC": 0.5, "USDT": 1000.0},
+    )
+
+def bench(n: int = 20_000):
+    state = sample_state()
+    json_blob = json.dumps(asdict(state))
+    bin_blob = encode_state(state)
+    print(f"size: json {len(json_blob)} B, binary {len(bin_blob)} B")
+
+    enc_json = timeit.timeit(lambda: json.dumps(asdict(state)), number=n) / n
+    enc_bin = timeit.timeit(lambda: encode_state(state), number=n) / n
+    print(f"encode: json {enc_json * 1e6:.1f} us, binary {enc_bin * 1e6:.1f} us")
+
+    dec_bin = timeit.timeit(lambda: decode_state(bin_blob), number=n) / n
+    print(f"decode binary: {dec_bin * 1e6:.1f} us")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in ("state.json", "state.bin"):
+            path = os.path.join(tmp, name)
+            save = timeit.timeit(lambda: save_state(state, path), number=2000) / 2000
+            load = timeit.timeit(lambda: load_state(path), number=2000) / 2000
+            print(f"{name}: save {save * 1e6:.1f} us, load {load * 1e6:.1f} us")
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    fleet = [sample_state() for _ in range(10_000)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"memory per bot state (incl. order + balances): {(after - before) / len(fleet):.0f} B")
+    print(f"sys.getsizeof(GridState): {sys.getsizeof(fleet[0])} B, ActiveOrder: {sys.getsizeof(fleet[0].active_order)} B")
+
+if __name__ == "__main__":
+    bench()
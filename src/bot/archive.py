@@ -0,0 +1,243 @@
+"""
+Append-only columnar archive of order events, partitioned per symbol and UTC day,
+and streaming reports over it.
+"""
+import os
+import sys
+import time
+import struct
+import logging
+import threading
+from array import array
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+EVENTS = ("placed", "filled", "closed", "repriced")
+SIDES = ("BUY", "SELL")
+
+# Column name -> struct/array type code (stored little-endian)
+COLUMNS = {
+    "time_ms": "q",
+    "event": "b",
+    "side": "b",
+    "price": "d",
+    "qty": "d",
+    "level": "q",
+    "fee": "d",
+    "realized_pnl": "d",
+}
+
+# Rows read per column at a time by reports
+CHUNK_ROWS = 65536
+
+# Columns read by build_report
+_REPORT_COLUMNS = ["event", "side", "price", "qty", "level", "fee", "realized_pnl"]
+
+def _day(time_ms: int) -> str:
+    return datetime.fromtimestamp(time_ms / 1000, tz=timezone.utc).strftime("%Y-%m-%d")
+
+class FillArchive:
+    """
+    Every order event of every grid, one row per event, under
+    directory/SYMBOL/YYYY-MM-DD/<column>.bin. Each column is a raw little-endian file,
+    so recording an event is a handful of small appends and reports read only the
+    columns they need, chunk by chunk.
+    A crash between column appends leaves columns of unequal length; the partition is
+    truncated to its complete rows before the next append, and readers ignore the tail.
+    Safe to share between the bots of one process.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._checked = set()
+        self._lock = threading.Lock()
+
+    def _partition(self, symbol: str, day: str) -> str:
+        return os.path.join(self.directory, symbol, day)
+
+    def _repair(self, path: str):
+        os.makedirs(path, exist_ok=True)
+        rows = partition_rows(path)
+        for column, code in COLUMNS.items():
+            column_path = os.path.join(path, f"{column}.bin")
+            size = rows * struct.calcsize(code)
+            if os.path.exists(column_path) and os.path.getsize(column_path) != size:
+                with open(column_path, "r+b") as f:
+                    f.truncate(size)
+
+    def record(
+        self,
+        symbol: str,
+        event: str,
+        side: str,
+        price: float,
+        qty: float,
+        level: int,
+        fee: float = 0.0,
+        realized_pnl: float = 0.0,
+        time_ms: Optional[int] = None
+    ):
+        time_ms = int(time.time() * 1000) if time_ms is None else time_ms
+        values = {
+            "time_ms": time_ms,
+            "event": EVENTS.index(event),
+            "side": SIDES.index(side),
+            "price": price,
+            "qty": qty,
+            "level": level,
+            "fee": fee,
+            "realized_pnl": realized_pnl,
+        }
+        path = self._partition(symbol, _day(time_ms))
+        with self._lock:
+            if path not in self._checked:
+                self._repair(path)
+                self._checked.add(path)
+            for column, code in COLUMNS.items():
+                with open(os.path.join(path, f"{column}.bin"), "ab") as f:
+                    f.write(struct.pack(f"<{code}", values[column]))
+
+def partition_rows(path: str) -> int:
+    """Complete rows of a partition: the shortest column wins."""
+    rows = []
+    for column, code in COLUMNS.items():
+        column_path = os.path.join(path, f"{column}.bin")
+        size = os.path.getsize(column_path) if os.path.exists(column_path) else 0
+        rows.append(size // struct.calcsize(code))
+    return min(rows)
+
+def iter_partitions(
+    directory: str,
+    symbols: Optional[List[str]] = None,
+    start_day: Optional[str] = None,
+    end_day: Optional[str] = None
+) -> Iterator[Tuple[str, str, str]]:
+    """(symbol, day, path) of every partition in [start_day, end_day], oldest day first."""
+    if not os.path.isdir(directory):
+        return
+    partitions = []
+    for symbol in sorted(os.listdir(directory)):
+        if symbols and symbol not in symbols:
+            continue
+        symbol_dir = os.path.join(directory, symbol)
+        if not os.path.isdir(symbol_dir):
+            continue
+        for day in os.listdir(symbol_dir):
+            if (start_day and day < start_day) or (end_day and day > end_day):
+                continue
+            partitions.append((day, symbol, os.path.join(symbol_dir, day)))
+    for day, symbol, path in sorted(partitions):
+        yield symbol, day, path
+
+def iter_chunks(path: str, columns: List[str], chunk_rows: int = CHUNK_ROWS) -> Iterator[Dict[str, array]]:
+    """Yields the partition's complete rows as arrays of at most chunk_rows per column."""
+    rows = partition_rows(path)
+    files = {c: open(os.path.join(path, f"{c}.bin"), "rb") for c in columns}
+    try:
+        done = 0
+        while done < rows:
+            count = min(chunk_rows, rows - done)
+            chunk = {}
+            for column, f in files.items():
+                values = array(COLUMNS[column])
+                values.fromfile(f, count)
+                if sys.byteorder == "big":
+                    values.byteswap()
+                chunk[column] = values
+            done += count
+            yield chunk
+    finally:
+        for f in files.values():
+            f.close()
+
+@dataclass
+class SymbolReport:
+    fills: int = 0
+    buys: int = 0
+    sells: int = 0
+    placed: int = 0
+    closed: int = 0
+    repriced: int = 0
+    turnover: float = 0.0
+    fees: float = 0.0
+    realized_pnl: float = 0.0
+    fills_per_level: Counter = field(default_factory=Counter)
+
+@dataclass
+class ArchiveReport:
+    symbols: Dict[str, SymbolReport] = field(default_factory=dict)
+    # (day, cumulative realized PnL of all symbols at the end of that day)
+    pnl_curve: List[Tuple[str, float]] = field(default_factory=list)
+
+def build_report(
+    directory: str,
+    symbols: Optional[List[str]] = None,
+    start_day: Optional[str] = None,
+    end_day: Optional[str] = None,
+    chunk_rows: int = CHUNK_ROWS
+) -> ArchiveReport:
+    """
+    Streams the archive once, day by day, keeping only running totals: memory is bounded
+    by chunk_rows and the number of symbols, levels and days, not by the number of events.
+    """
+    report = ArchiveReport()
+    filled = EVENTS.index("filled")
+    buy = SIDES.index("BUY")
+    cumulative = 0.0
+    for symbol, day, path in iter_partitions(directory, symbols, start_day, end_day):
+        totals = report.symbols.setdefault(symbol, SymbolReport())
+        for chunk in iter_chunks(path, _REPORT_COLUMNS, chunk_rows):
+            for event, side, price, qty, level, fee, pnl in zip(
+                chunk["event"], chunk["side"], chunk["price"], chunk["qty"],
+                chunk["level"], chunk["fee"], chunk["realized_pnl"]
+            ):
+                if event != filled:
+                    # placed / closed / repriced counters
+                    name = EVENTS[event]
+                    setattr(totals, name, getattr(totals, name) + 1)
+                    continue
+                totals.fills += 1
+                if side == buy:
+                    totals.buys += 1
+                else:
+                    totals.sells += 1
+                totals.turnover += price * qty
+                totals.fees += fee
+                totals.realized_pnl += pnl
+                totals.fills_per_level[level] += 1
+                cumulative += pnl
+        if report.pnl_curve and report.pnl_curve[-1][0] == day:
+            report.pnl_curve[-1] = (day, cumulative)
+        else:
+            report.pnl_curve.append((day, cumulative))
+    return report
+
+def format_report(report: ArchiveReport) -> str:
+    lines = [f"{'symbol':<14}{'fills':>8}{'buys':>8}{'sells':>8}{'turnover':>16}{'fees':>12}{'realized_pnl':>14}"]
+    total = SymbolReport()
+    for symbol, r in sorted(report.symbols.items()):
+        lines.append(
+            f"{symbol:<14}{r.fills:>8}{r.buys:>8}{r.sells:>8}{r.turnover:>16.2f}{r.fees:>12.4f}{r.realized_pnl:>14.4f}"
+        )
+        total.fills += r.fills
+        total.buys += r.buys
+        total.sells += r.sells
+        total.turnover += r.turnover
+        total.fees += r.fees
+        total.realized_pnl += r.realized_pnl
+    lines.append(
+        f"{'TOTAL':<14}{total.fills:>8}{total.buys:>8}{total.sells:>8}"
+        f"{total.turnover:>16.2f}{total.fees:>12.4f}{total.realized_pnl:>14.4f}"
+    )
+    for symbol, r in sorted(report.symbols.items()):
+        if r.fills_per_level:
+            levels = " ".join(f"{level}:{count}" for level, count in sorted(r.fills_per_level.items()))
+            lines.append(f"{symbol} fills per level: {levels}")
+    if report.pnl_curve:
+        lines.append("Cumulative realized PnL by day:")
+        lines.extend(f"  {day} {pnl:.4f}" for day, pnl in report.pnl_curve)
+    return "\n".join(lines)
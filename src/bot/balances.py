@@ -0,0 +1,116 @@
+import time
+import logging
+import threading
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+class BalanceLedger:
+    """
+    Account balances kept locally from the bot's own order events, so pre-trade checks
+    never need an /api/v3/account call.
+    Placing an order moves its cost from free to locked; a fill spends the locked amount
+    and credits the received asset net of the trading fee (charged in the received asset,
+    as Binance does without BNB fee payment); a cancel unlocks it.
+    Exchange totals are re-read only every reconcile_interval_s, or sooner once marked
+    stale (e.g. after the exchange rejected an order for insufficient balance).
+    """
+
+    def __init__(self, reconcile_interval_s: float = 3600.0, tolerance: float = 1e-8):
+        self.reconcile_interval_s = reconcile_interval_s
+        self.tolerance = tolerance
+        self._free: Dict[str, float] = {}
+        self._locked: Dict[str, float] = {}
+        # order_id -> (asset, amount) locked by that order
+        self._reservations: Dict[str, Tuple[str, float]] = {}
+        self._last_reconcile: Optional[float] = None
+        self._stale = True
+        self._lock = threading.Lock()
+
+    @property
+    def seeded(self) -> bool:
+        return self._last_reconcile is not None
+
+    def free(self, asset: str) -> float:
+        return self._free.get(asset, 0.0)
+
+    def locked(self, asset: str) -> float:
+        return self._locked.get(asset, 0.0)
+
+    def totals(self) -> Dict[str, float]:
+        with self._lock:
+            assets = set(self._free) | set(self._locked)
+            return {a: self._free.get(a, 0.0) + self._locked.get(a, 0.0) for a in sorted(assets)}
+
+    def _add(self, book: Dict[str, float], asset: str, amount: float):
+        book[asset] = book.get(asset, 0.0) + amount
+
+    def reserve(self, order_id: str, base: str, quote: str, side: str, price: float, qty: float):
+        """
+        Locks the cost of a newly placed order: quote for a BUY, base for a SELL.
+        Reserving an order again replaces its earlier reservation.
+        """
+        self.release(order_id)
+        asset, amount = (quote, price * qty) if side == "BUY" else (base, qty)
+        with self._lock:
+            self._add(self._free, asset, -amount)
+            self._add(self._locked, asset, amount)
+            self._reservations[order_id] = (asset, amount)
+
+    def release(self, order_id: str):
+        """Unlocks a canceled order's reservation (no-op for unknown orders)."""
+        with self._lock:
+            reservation = self._reservations.pop(order_id, None)
+            if reservation:
+                asset, amount = reservation
+                self._add(self._locked, asset, -amount)
+                self._add(self._free, asset, amount)
+
+    def fill(self, order_id: str, base: str, quote: str, side: str, price: float, qty: float, fee_rate: float):
+        """Books a full fill. Orders placed before the ledger was seeded spend from free."""
+        with self._lock:
+            reservation = self._reservations.pop(order_id, None)
+            if reservation:
+                asset, amount = reservation
+                self._add(self._locked, asset, -amount)
+            else:
+                asset, amount = (quote, price * qty) if side == "BUY" else (base, qty)
+                self._add(self._free, asset, -amount)
+            if side == "BUY":
+                self._add(self._free, base, qty * (1 - fee_rate))
+            else:
+                self._add(self._free, quote, price * qty * (1 - fee_rate))
+
+    def mark_stale(self):
+        self._stale = True
+
+    def reconcile_due(self, now: Optional[float] = None) -> bool:
+        if self._stale or self._last_reconcile is None:
+            return True
+        now = time.time() if now is None else now
+        return now - self._last_reconcile >= self.reconcile_interval_s
+
+    def reconcile(self, exchange_totals: Dict[str, float]) -> Dict[str, float]:
+        """
+        Resets to the exchange's per-asset totals, keeping the bot's reservations locked.
+        Returns the per-asset drift (exchange - local) beyond tolerance.
+        """
+        local = self.totals()
+        drift = {}
+        for asset in set(local) | set(exchange_totals):
+            delta = exchange_totals.get(asset, 0.0) - local.get(asset, 0.0)
+            if abs(delta) > self.tolerance:
+                drift[asset] = delta
+        if drift and self.seeded:
+            logger.warning(f"Balance ledger drifted from the exchange, resyncing: {drift}")
+
+        with self._lock:
+            self._locked = {}
+            for asset, amount in self._reservations.values():
+                self._add(self._locked, asset, amount)
+            self._free = {a: t - self._locked.get(a, 0.0) for a, t in exchange_totals.items()}
+            for asset, amount in self._locked.items():
+                self._free.setdefault(asset, -amount)
+            self._last_reconcile = time.time()
+            self._stale = False
+        return drift
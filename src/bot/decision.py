@@ -1,3 +1,7 @@
+import math
+import time
+import random
+import hashlib
 import logging
 from typing import List, Optional
 from src.bot.state import GridState, BotPhase, BotStateRole, OrderIntent
@@ -5,6 +9,27 @@ from src.core.math import calculate_base_qty_for_long, calculate_base_qty_for_sh
 
 logger = logging.getLogger(__name__)
 
+# Binance newClientOrderId: ^[.A-Z:/a-z0-9_-]{1,36}$
+CLIENT_ORDER_ID_MAX_LEN = 36
+
+def make_client_order_id(symbol: str, level: int, seq: int) -> str:
+    """
+    Deterministic client order id for the seq-th order of a grid, placed at absolute
+    level `level`: a retry of the same placement always carries the same id.
+    """
+    client_id = f"gb_{symbol}_{level}_{seq}"
+    if len(client_id) > CLIENT_ORDER_ID_MAX_LEN:
+        client_id = "gb_" + hashlib.sha1(client_id.encode("utf-8")).hexdigest()[:CLIENT_ORDER_ID_MAX_LEN - 3]
+    return client_id
+
+def initial_order_seq() -> int:
+    """
+    First order sequence number of a new grid state. Millisecond time plus a random
+    component, so states created back to back (or by a restarted bot whose state file
+    was lost) never reuse each other's client order ids.
+    """
+    return int(time.time() * 1000) * 1_000_000 + random.randrange(1_000_000)
+
 def determine_initial_grid_index(current_price: float, levels: List[float], phase: BotPhase) -> int:
     """Finds the best starting level index based on the initial price."""
     n = len(levels) - 1
@@ -28,6 +53,17 @@ def determine_initial_grid_index(current_price: float, levels: List[float], phas
                 return i
         return n
 
+def calculate_order_qty(mode: str, capital: float, n_intervals: int, order_price: float) -> float:
+    """Un-rounded base quantity for one grid order in the given mode."""
+    if mode == "LONG":
+        # Quote capital split
+        return calculate_base_qty_for_long(capital, n_intervals, order_price)
+    elif mode == "SHORT_INVERTED":
+        # Base capital split
+        return calculate_base_qty_for_short_inverted(capital, n_intervals)
+    else:
+        raise ValueError(f"Unknown mode: {mode}")
+
 def get_next_order_intent(
     state: GridState, 
     current_price: float, 
@@ -75,14 +111,7 @@ def get_next_order_intent(
     # Actually, if we use target_index clamps, an out of range price just waits unless we hit the ceiling limit order.
     
     # Calculate order quantities
-    if mode == "LONG":
-        # Quote capital split
-        raw_qty = calculate_base_qty_for_long(capital, n_intervals, order_price)
-    elif mode == "SHORT_INVERTED":
-        # Base capital split
-        raw_qty = calculate_base_qty_for_short_inverted(capital, n_intervals)
-    else:
-        raise ValueError(f"Unknown mode: {mode}")
+    raw_qty = calculate_order_qty(mode, capital, n_intervals, order_price)
 
     # For now, we return un-rounded qty depending on where tick/step rounding goes.
     # Typically, the Exchange layer will apply round_tick_size and round_step_size.
@@ -95,6 +124,12 @@ def get_next_order_intent(
         grid_index=target_index
     )
 
+def is_order_funded(side: BotPhase, price: float, qty: float, free_base: float, free_quote: float) -> bool:
+    """Pre-trade check: a BUY spends price * qty of the quote asset, a SELL qty of the base."""
+    if side == BotPhase.BUY:
+        return free_quote >= price * qty
+    return free_base >= qty
+
 def transition_state_on_fill(state: GridState, filled_index: int, realized_pnl: float = 0.0) -> GridState:
     """Returns a newly mutated state after an order fills."""
     # Flip phase
@@ -107,3 +142,27 @@ def transition_state_on_fill(state: GridState, filled_index: int, realized_pnl:
     state.realized_pnl += realized_pnl
     
     return state
+
+def calculate_trailing_shift(state: GridState, current_price: float, levels, ratio: float) -> int:
+    """
+    Whole levels a trailing grid must shift so the bot is no longer blocked at an edge.
+    Returns 0 when the next adjacent level is inside the grid. Otherwise shifts at least
+    far enough to bring that level back in, and far enough to bring price back in range.
+    """
+    if state.last_filled_index is None or state.active_order is not None:
+        return 0
+
+    n_intervals = len(levels) - 1
+    target_index = state.last_filled_index - 1 if state.phase == BotPhase.BUY else state.last_filled_index + 1
+
+    if target_index > n_intervals:
+        shift = target_index - n_intervals
+        if current_price > levels[-1]:
+            shift = max(shift, math.ceil(math.log(current_price / levels[-1]) / math.log(ratio)))
+        return shift
+    if target_index < 0:
+        shift = target_index
+        if current_price < levels[0]:
+            shift = min(shift, -math.ceil(math.log(levels[0] / current_price) / math.log(ratio)))
+        return shift
+    return 0
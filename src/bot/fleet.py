@@ -0,0 +1,189 @@
+import os
+import time
+import logging
+import multiprocessing
+from typing import Callable, Dict, List, Optional
+
+from src.core.config import AppConfig
+from src.core.eventlog import setup_logging
+from src.exchange.base import ExchangeInterface
+from src.exchange.ratelimit import SharedRateBudget, RateLimitedExchange
+from src.bot.loop import GridBotOrchestrator
+from src.bot.reconcile import initialize_bots, reconcile_bots
+from src.bot.balances import BalanceLedger
+from src.bot.archive import FillArchive
+from src.bot.scheduler import TickScheduler, DEFAULT_TICK_WORKERS
+
+logger = logging.getLogger(__name__)
+
+ExchangeFactory = Callable[[AppConfig], ExchangeInterface]
+
+STOP_POLL_SECONDS = 0.5
+
+def binance_exchange_factory(config: AppConfig) -> ExchangeInterface:
+    """Default factory: one Binance adapter per worker process."""
+    from src.exchange.binance import BinanceSpotAdapter
+    exchange = BinanceSpotAdapter(
+        api_key=config.api_key or "",
+        api_secret=config.api_secret or "",
+        base_url=os.environ.get("EXCHANGE_BASE_URL")
+    )
+    if not config.dry_run:
+        exchange.start_time_sync()
+    return exchange
+
+def binance_ws_exchange_factory(config: AppConfig) -> ExchangeInterface:
+    """Like binance_exchange_factory, with order calls over the WebSocket API."""
+    from src.exchange.binance_ws import BinanceWebSocketAdapter
+    exchange = BinanceWebSocketAdapter(
+        api_key=config.api_key or "",
+        api_secret=config.api_secret or "",
+        base_url=os.environ.get("EXCHANGE_BASE_URL"),
+        ws_url=os.environ.get("EXCHANGE_WS_URL")
+    )
+    if not config.dry_run:
+        exchange.start_time_sync()
+    return exchange
+
+def state_file_for(state_dir: str, symbol: str) -> str:
+    return os.path.join(state_dir, f"{symbol}.json")
+
+def event_log_for(event_log: str, worker_id: int) -> str:
+    """Per-worker event file: rotation is not safe with several processes on one file."""
+    root, ext = os.path.splitext(event_log)
+    return f"{root}.worker{worker_id}{ext}"
+
+def shard_configs(configs: List[AppConfig], num_workers: int) -> List[List[AppConfig]]:
+    """Round-robin symbols across at most num_workers non-empty shards."""
+    num_workers = max(1, min(num_workers, len(configs)))
+    shards: List[List[AppConfig]] = [[] for _ in range(num_workers)]
+    for i, config in enumerate(configs):
+        shards[i % num_workers].append(config)
+    return shards
+
+def run_worker(
+    worker_id: int,
+    configs: List[AppConfig],
+    state_dir: str,
+    budget: SharedRateBudget,
+    stop_flag,
+    exchange_factory: ExchangeFactory,
+    event_log: Optional[str] = None,
+    tick_workers: int = DEFAULT_TICK_WORKERS,
+    archive_dir: Optional[str] = None
+):
+    """
+    Worker process entry point: runs every grid of its shard on one rate-limited
+    exchange, ticked by a TickScheduler on tick_workers threads. Each bot resumes from
+    its own state file, so a restarted worker picks up exactly where the failed one
+    left off.
+    """
+    # A forked child inherits the queue handler but not the parent's listener thread
+    setup_logging(logging.getLogger().level, event_log=event_log_for(event_log, worker_id) if event_log else None)
+    exchange = RateLimitedExchange(exchange_factory(configs[0]), budget)
+    # One balance ledger per worker: its grids trade from the same account
+    balances = None if configs[0].dry_run else BalanceLedger()
+    # Partitions are per symbol, so workers never append to the same files
+    archive = FillArchive(archive_dir) if archive_dir else None
+    bots = [
+        GridBotOrchestrator(
+            config, exchange, state_file=state_file_for(state_dir, config.grid.symbol), balances=balances,
+            archive=archive
+        )
+        for config in configs
+    ]
+    # Resume every grid at once and catch up on fills that happened while down
+    initialize_bots(bots)
+    reconcile_bots(bots, exchange)
+    logger.info(f"Worker {worker_id} (pid {os.getpid()}) running {[b.symbol for b in bots]}")
+
+    scheduler = TickScheduler(max_workers=tick_workers)
+    for bot in bots:
+        scheduler.add(bot.symbol, bot.execute_tick, lambda bot=bot: bot.config.grid.check_interval_minutes * 60)
+    try:
+        # Short waits keep shutdown responsive without a cross-process condition variable,
+        # which a killed worker could leave in a state that blocks the supervisor
+        scheduler.run(lambda: bool(stop_flag.value), poll_s=STOP_POLL_SECONDS)
+    finally:
+        scheduler.shutdown()
+
+class FleetSupervisor:
+    """
+    Shards a fleet of grids across worker processes (one per core by default), restarts
+    workers that die, and makes all workers share one exchange request-weight budget.
+    """
+
+    def __init__(
+        self,
+        configs: List[AppConfig],
+        state_dir: str,
+        num_workers: Optional[int] = None,
+        budget: Optional[SharedRateBudget] = None,
+        exchange_factory: ExchangeFactory = binance_exchange_factory,
+        restart_backoff_seconds: float = 5.0,
+        event_log: Optional[str] = None,
+        tick_workers: int = DEFAULT_TICK_WORKERS,
+        archive_dir: Optional[str] = None
+    ):
+        self.state_dir = state_dir
+        self.shards = shard_configs(configs, num_workers or os.cpu_count() or 1)
+        self.budget = budget or SharedRateBudget()
+        self.exchange_factory = exchange_factory
+        self.restart_backoff_seconds = restart_backoff_seconds
+        self.event_log = event_log
+        self.tick_workers = tick_workers
+        self.archive_dir = archive_dir
+
+        self.stop_flag = multiprocessing.Value("b", 0, lock=False)
+        self.processes: Dict[int, multiprocessing.Process] = {}
+        self.restarts: Dict[int, int] = {i: 0 for i in range(len(self.shards))}
+        self._next_restart: Dict[int, float] = {}
+
+    def _spawn(self, worker_id: int):
+        process = multiprocessing.Process(
+            target=run_worker,
+            args=(worker_id, self.shards[worker_id], self.state_dir, self.budget,
+                  self.stop_flag, self.exchange_factory, self.event_log, self.tick_workers, self.archive_dir),
+            name=f"gridbot-worker-{worker_id}",
+            daemon=True
+        )
+        process.start()
+        self.processes[worker_id] = process
+
+    def start(self):
+        os.makedirs(self.state_dir, exist_ok=True)
+        for worker_id in range(len(self.shards)):
+            self._spawn(worker_id)
+        logger.info(f"Fleet started: {sum(len(s) for s in self.shards)} grids on {len(self.shards)} workers")
+
+    def supervise_once(self):
+        """Restarts dead workers, with a backoff after each failure."""
+        now = time.monotonic()
+        for worker_id, process in list(self.processes.items()):
+            if process.is_alive() or self.stop_flag.value:
+                continue
+            if worker_id not in self._next_restart:
+                logger.warning(f"Worker {worker_id} exited with code {process.exitcode}. Scheduling restart.")
+                self._next_restart[worker_id] = now + self.restart_backoff_seconds
+            if now >= self._next_restart[worker_id]:
+                del self._next_restart[worker_id]
+                self.restarts[worker_id] += 1
+                logger.info(f"Restarting worker {worker_id} (restart #{self.restarts[worker_id]})")
+                self._spawn(worker_id)
+
+    def run(self, poll_seconds: float = 1.0):
+        """Blocks supervising workers until stop() is called or interrupted."""
+        self.start()
+        try:
+            while not self.stop_flag.value:
+                self.supervise_once()
+                time.sleep(poll_seconds)
+        finally:
+            self.stop()
+
+    def stop(self, timeout: float = 10.0):
+        self.stop_flag.value = 1
+        for process in self.processes.values():
+            process.join(timeout)
+            if process.is_alive():
+                process.terminate()
@@ -0,0 +1,169 @@
+import time
+from array import array
+from collections import deque
+from typing import Callable, Dict, Deque, List, Optional, Iterable
+
+from src.bot.state import BotPhase, OpenLot
+
+class _Lot:
+    __slots__ = ("side", "qty", "price", "fee_per_unit", "exit_index")
+
+    def __init__(self, side: BotPhase, qty: float, price: float, fee_per_unit: float, exit_index: int):
+        self.side = side
+        self.qty = qty
+        self.price = price
+        self.fee_per_unit = fee_per_unit
+        self.exit_index = exit_index
+
+def exit_index_for(side: BotPhase, grid_index: int) -> int:
+    """Grid level at which a lot opened by this fill is expected to close."""
+    return grid_index + 1 if side == BotPhase.BUY else grid_index - 1
+
+class FillLedger:
+    """
+    Append-only fill history with incremental FIFO lot matching.
+
+    Every fill is stored in typed array columns. Open lots are indexed both per expected
+    exit level and globally in FIFO order, so a closing fill first matches the lot opened
+    one level away (the grid round-trip) and otherwise the oldest open lot. Lots drained
+    through one index are lazily discarded from the other, keeping matching amortized O(1).
+    Fees are charged at fee_rate on every fill's notional; entry fees stay attached to
+    the lot and are realized when it closes. Realized PnL, fees, inventory and open cost
+    are running totals, so no query rescans the history.
+    """
+
+    def __init__(self, fee_rate: float = 0.0):
+        self.fee_rate = fee_rate
+
+        # Fill history columns
+        self.timestamps = array("d")
+        self.sides = array("b")  # +1 BUY, -1 SELL
+        self.prices = array("d")
+        self.qtys = array("d")
+        self.grid_indexes = array("q")
+        self.fees = array("d")
+        self.realized = array("d")
+
+        # Open lots
+        self._fifo: Deque[_Lot] = deque()
+        self._by_exit: Dict[int, Deque[_Lot]] = {}
+
+        # Running totals
+        self.realized_pnl = 0.0
+        self.fees_paid = 0.0
+        self.inventory = 0.0  # signed base qty: > 0 long lots, < 0 short lots
+        self._open_cost = 0.0  # sum(entry price * remaining qty)
+        self._open_fees = 0.0  # entry fees attached to remaining qty
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+    @classmethod
+    def from_open_lots(cls, fee_rate: float, lots: Iterable[OpenLot]) -> "FillLedger":
+        """Rebuilds a ledger from persisted open lots (history is not restored)."""
+        ledger = cls(fee_rate)
+        for lot in lots:
+            ledger._open(_Lot(lot.side, lot.qty, lot.price, lot.fee_per_unit, lot.exit_index))
+        return ledger
+
+    def open_lots(self) -> List[OpenLot]:
+        """Open lots in FIFO order, for persistence."""
+        return [
+            OpenLot(side=lot.side, qty=lot.qty, price=lot.price,
+                    fee_per_unit=lot.fee_per_unit, exit_index=lot.exit_index)
+            for lot in self._fifo if lot.qty > 0
+        ]
+
+    def rebase_levels(self, remap: Callable[[int], int]):
+        """Maps open lots' exit levels onto a rebuilt grid and re-indexes them."""
+        self._fifo = deque(lot for lot in self._fifo if lot.qty > 0)
+        self._by_exit = {}
+        for lot in self._fifo:
+            lot.exit_index = remap(lot.exit_index)
+            self._by_exit.setdefault(lot.exit_index, deque()).append(lot)
+
+    def record_fill(
+        self,
+        side: BotPhase,
+        price: float,
+        qty: float,
+        grid_index: int,
+        timestamp: Optional[float] = None
+    ) -> float:
+        """Records a fill, matches it against open lots and returns the realized PnL delta."""
+        fee_per_unit = price * self.fee_rate
+        remaining = qty
+        realized = -fee_per_unit * qty  # the exit fee is part of the closing PnL
+
+        # Close opposite-side lots: same-level round-trip first, then oldest
+        level_lots = self._by_exit.get(grid_index)
+        while remaining > 0:
+            lot = self._next_lot(level_lots, side)
+            if lot is None:
+                lot = self._next_lot(self._fifo, side)
+            if lot is None:
+                break
+
+            matched = min(lot.qty, remaining)
+            direction = 1.0 if lot.side == BotPhase.BUY else -1.0
+            realized += direction * (price - lot.price) * matched - lot.fee_per_unit * matched
+
+            lot.qty -= matched
+            remaining -= matched
+            self.inventory -= direction * matched
+            self._open_cost -= lot.price * matched
+            self._open_fees -= lot.fee_per_unit * matched
+
+        opening_qty = remaining
+        if opening_qty > 0:
+            # Opening fee is not realized yet; it stays on the lot
+            realized += fee_per_unit * opening_qty
+            self._open(_Lot(side, opening_qty, price, fee_per_unit, exit_index_for(side, grid_index)))
+
+        while self._fifo and self._fifo[0].qty <= 0:
+            self._fifo.popleft()
+        if not self._fifo:
+            # Flat: drop accumulated float residue
+            self.inventory = 0.0
+            self._open_cost = 0.0
+            self._open_fees = 0.0
+            self._by_exit.clear()
+
+        fee = fee_per_unit * qty
+        self.fees_paid += fee
+        self.realized_pnl += realized
+
+        self.timestamps.append(time.time() if timestamp is None else timestamp)
+        self.sides.append(1 if side == BotPhase.BUY else -1)
+        self.prices.append(price)
+        self.qtys.append(qty)
+        self.grid_indexes.append(grid_index)
+        self.fees.append(fee)
+        self.realized.append(realized)
+        return realized
+
+    def unrealized_pnl(self, mark_price: float) -> float:
+        """Mark-to-market PnL of open lots, net of their entry fees."""
+        if self.inventory > 0:
+            return mark_price * self.inventory - self._open_cost - self._open_fees
+        if self.inventory < 0:
+            return self._open_cost + mark_price * self.inventory - self._open_fees
+        return 0.0
+
+    def _open(self, lot: _Lot):
+        self._fifo.append(lot)
+        self._by_exit.setdefault(lot.exit_index, deque()).append(lot)
+        direction = 1.0 if lot.side == BotPhase.BUY else -1.0
+        self.inventory += direction * lot.qty
+        self._open_cost += lot.price * lot.qty
+        self._open_fees += lot.fee_per_unit * lot.qty
+
+    def _next_lot(self, lots: Optional[Deque[_Lot]], closing_side: BotPhase) -> Optional[_Lot]:
+        """Front lot of the queue that the closing side can match, discarding drained lots."""
+        if not lots:
+            return None
+        while lots and lots[0].qty <= 0:
+            lots.popleft()
+        if not lots or lots[0].side == closing_side:
+            return None
+        return lots[0]
@@ -1,19 +1,48 @@
+import math
 import time
 import logging
-from typing import Optional
+import threading
+from typing import TYPE_CHECKING, Callable, List, Optional, Tuple
 
-from src.core.config import AppConfig
-from src.exchange.base import ExchangeInterface, SymbolRules
+from src.core.config import AppConfig, ConfigError
+from src.exchange.base import ExchangeInterface, SymbolRules, ExchangeError, OrderStatusUnknown, symbol_assets
+from src.exchange.paper import PaperExchange
 from src.bot.state import GridState, BotPhase, BotStateRole, ActiveOrder
-from src.core.math import build_grid, round_tick_size, round_step_size
+from src.core.math import build_grid, round_tick_size, round_step_size, GridLadder, MathError
 from src.bot.persistence import save_state, load_state
-from src.bot.decision import get_next_order_intent, transition_state_on_fill
+from src.bot.decision import (
+    get_next_order_intent, transition_state_on_fill, calculate_order_qty, calculate_trailing_shift,
+    is_order_funded, make_client_order_id, initial_order_seq
+)
+from src.bot.balances import BalanceLedger
+from src.bot.snapshot import StartupSnapshot
+from src.bot.ledger import FillLedger
+from src.bot.reload import ConfigChange, ConfigWatcher, check_reload, GRID_GEOMETRY_FIELDS
+from src.core.eventlog import log_event
+
+if TYPE_CHECKING:
+    # Optional features: imported where used, so one-shot runs skip them
+    from src.bot.archive import FillArchive
+    from src.bot.shadow import ShadowGrid, ShadowResult
 
 logger = logging.getLogger(__name__)
 
+# How often execute_tick logs the shadow grids' comparative PnL
+SHADOW_REPORT_INTERVAL_S = 3600.0
+
 class GridBotOrchestrator:
-    def __init__(self, config: AppConfig, exchange: ExchangeInterface, state_file: str = "state.json"):
+    def __init__(
+        self,
+        config: AppConfig,
+        exchange: ExchangeInterface,
+        state_file: str = "state.json",
+        balances: Optional[BalanceLedger] = None,
+        archive: Optional["FillArchive"] = None
+    ):
         self.config = config
+        if config.dry_run and not isinstance(exchange, PaperExchange):
+            # Dry-run orders go to a local paper book; the exchange only serves market data
+            exchange = PaperExchange(exchange)
         self.exchange = exchange
         self.state_file = state_file
         
@@ -21,18 +50,39 @@ class GridBotOrchestrator:
         self.mode = config.grid.mode
         
         self.state: Optional[GridState] = None
-        self.levels: list[float] = []
+        self.levels: Optional[GridLadder] = None
         self.rules: Optional[SymbolRules] = None
+        self.ledger = FillLedger(config.grid.fee_rate)
+        # Account balances for pre-trade checks; may be shared by the bots of one account
+        self.balances = balances
+        # Every order event is appended here when set
+        self.archive = archive
+        # Paper grids fed with this bot's tick prices (see attach_shadows)
+        self.shadows: List["ShadowGrid"] = []
+        self._shadow_baseline: Optional["ShadowResult"] = None
+        self._next_shadow_report = 0.0
         
+        self.config_watcher: Optional[ConfigWatcher] = None
+        # Traded range seen since the last order status lookup (wall clock, seconds)
+        self._last_status_check = 0.0
+        self._range_low: Optional[float] = None
+        self._range_high: Optional[float] = None
         self.running = False
 
-    def initialize(self):
-        """Loads state or initializes a new one based on current market."""
+    def initialize(self, snapshot: Optional[StartupSnapshot] = None):
+        """
+        Loads state or initializes a new one based on current market.
+        A startup snapshot, when given, supplies cached rules and grid levels and is
+        refreshed in place with whatever had to be fetched or rebuilt.
+        """
         logger.info(f"Initializing GridBot for {self.symbol} in {self.mode} mode")
         
         try:
             # Fetch rules needed for everything
-            self.rules = self.exchange.get_symbol_rules(self.symbol)
+            if snapshot and snapshot.rules:
+                self.rules = snapshot.rules
+            else:
+                self.rules = self.exchange.get_symbol_rules(self.symbol)
             logger.info(f"Rules: tick={self.rules.tick_size}, step={self.rules.step_size}")
             
             # Load persistence
@@ -40,6 +90,7 @@ class GridBotOrchestrator:
             if loaded_state:
                 logger.info(f"Resuming existing state from {self.state_file}")
                 self.state = loaded_state
+                self.ledger = FillLedger.from_open_lots(self.config.grid.fee_rate, loaded_state.open_lots)
             else:
                 logger.info("Creating new state. Fetching market price...")
                 p0 = self.exchange.get_price(self.symbol)
@@ -49,48 +100,73 @@ class GridBotOrchestrator:
                 self.state = GridState(
                     phase=initial_phase, 
                     state=BotStateRole.IDLE,
-                    p0_reference_price=p0
+                    p0_reference_price=p0,
+                    # A recreated state must not reuse its predecessor's client order ids
+                    order_seq=initial_order_seq()
                 )
                 
             # Build grid mathematically based on P0
             if self.state.p0_reference_price <= 0:
                 raise ValueError("GridState loaded without a valid p0_reference_price.")
                 
-            self.levels = build_grid(
-                self.state.p0_reference_price, 
-                self.config.grid.range_pct_bottom, 
-                self.config.grid.range_pct_top, 
-                self.config.grid.grid_intervals
-            )
+            if snapshot and snapshot.levels and snapshot.p0_reference_price == self.state.p0_reference_price:
+                base_levels = snapshot.levels
+            else:
+                base_levels = build_grid(
+                    self.state.p0_reference_price, 
+                    self.config.grid.range_pct_bottom, 
+                    self.config.grid.range_pct_top, 
+                    self.config.grid.grid_intervals
+                )
+            # Trailing shifts are replayed from the persisted offset
+            self.levels = GridLadder(base_levels, offset=self.state.grid_offset)
+            
+            if snapshot:
+                snapshot.rules = self.rules
+                snapshot.p0_reference_price = self.state.p0_reference_price
+                snapshot.levels = base_levels
             logger.info(f"Built grid with {len(self.levels)} levels. Bottom: {self.levels[0]}, Top: {self.levels[-1]}")
+            if self.config.shadows:
+                self.attach_shadows()
             
         except Exception as e:
             logger.error(f"Initialization failed: {e}")
             raise
 
+    @property
+    def assets(self) -> Tuple[str, str]:
+        """(base, quote) assets of the traded symbol, as reported by the exchange."""
+        return symbol_assets(self.symbol, self.rules)
+
     def execute_tick(self):
         """Single tick iteration: fetch price, poll orders, make decisions."""
         current_price = self.exchange.get_price(self.symbol)
-        logger.debug(f"[TICK] {self.symbol} price: {current_price}")
+        logger.debug("[TICK] %s price: %s", self.symbol, current_price)
+        self._track_price(current_price)
+        if self.shadows:
+            self._feed_shadows(current_price)
+        if self.balances and self.balances.reconcile_due():
+            self.reconcile_balances()
         
         # 1. State: check existing order status
+        if self.state.active_order and self.state.active_order.status == "UNKNOWN":
+            self.resolve_unknown_order()
         if self.state.active_order:
-            status = self.exchange.get_order_status(self.symbol, self.state.active_order.order_id)
-            logger.debug(f"Active order {self.state.active_order.order_id} status: {status}")
+            if self._order_may_have_filled(self.state.active_order):
+                status = self.exchange.get_order_status(self.symbol, self.state.active_order.order_id)
+                self._reset_price_range(current_price)
+            else:
+                # Price never reached the order since the last lookup: it is still resting
+                status = "OPEN"
+            logger.debug("Active order %s status: %s", self.state.active_order.order_id, status)
             
             if status == "FILLED":
-                logger.info(f"Order FIlled! {self.state.active_order.side} at {self.state.active_order.price}")
-                # We do simple PnL locally in memory
-                # But wait, transition state handles phase flips.
-                self.state = transition_state_on_fill(self.state, self.state.active_order.grid_index)
-                save_state(self.state, self.state_file)
+                self.apply_fill()
             elif status in ("CANCELED", "REJECTED"):
-                logger.warning("Order Canceled/Rejected. Reverting to IDLE.")
-                self.state.active_order = None
-                self.state.state = BotStateRole.IDLE
-                save_state(self.state, self.state_file)
+                self.drop_active_order(status)
             else:
-                # Still OPEN
+                # Still OPEN: follow the grid if its level moved (re-centering, config reload)
+                self._reprice_if_moved()
                 return
                 
         # 2. State: place new order if IDLE
@@ -103,6 +179,18 @@ class GridBotOrchestrator:
                 capital=self.config.grid.initial_capital_amount
             )
             
+            if intent is None and self.config.grid.trailing:
+                shift = calculate_trailing_shift(self.state, current_price, self.levels, self.levels.ratio)
+                if shift:
+                    self.shift_grid(shift)
+                    intent = get_next_order_intent(
+                        state=self.state,
+                        current_price=current_price,
+                        levels=self.levels,
+                        mode=self.mode,
+                        capital=self.config.grid.initial_capital_amount
+                    )
+            
             if intent:
                 # Round to exchange tick sizes
                 p = round_tick_size(intent.price, self.rules.tick_size)
@@ -110,43 +198,439 @@ class GridBotOrchestrator:
                 
                 notional = p * q
                 if notional < self.rules.min_notional or q < self.rules.min_qty:
-                    logger.warning(f"Calculated intent below minimums. p={p}, q={q}, not={notional}. Skipping.")
+                    log_event(
+                        logger, "intent_skipped", logging.WARNING, symbol=self.symbol, side=intent.side.value,
+                        price=p, qty=q, notional=notional, reason="below exchange minimums"
+                    )
                     return
                     
                 # We are safe to place.
-                logger.info(f"Placing new {intent.side} order at {p} (qty: {q})")
+                log_event(
+                    logger, "intent", symbol=self.symbol, side=intent.side.value,
+                    price=p, qty=q, grid_index=intent.grid_index
+                )
                 
-                if self.config.dry_run:
-                    # Fake order id
-                    oid = f"dry_run_{int(time.time()*1000)}"
-                    logger.info("[DRY RUN] Order logic passed perfectly. Skipped exchange submission.")
-                else:
-                    oid = self.exchange.place_limit_order(self.symbol, intent.side.value, p, q)
+                if self.balances and self.balances.seeded:
+                    base, quote = self.assets
+                    if not is_order_funded(intent.side, p, q, self.balances.free(base), self.balances.free(quote)):
+                        log_event(
+                            logger, "intent_skipped", logging.WARNING, symbol=self.symbol, side=intent.side.value,
+                            price=p, qty=q, reason="insufficient free balance"
+                        )
+                        return
                 
-                # Update local DB state
-                self.state.active_order = ActiveOrder(
-                    order_id=oid,
+                # In dry-run this is the paper engine, never the real order endpoint
+                client_order_id = make_client_order_id(
+                    self.symbol, self.state.grid_offset + intent.grid_index, self.state.order_seq
+                )
+                order = ActiveOrder(
+                    order_id="",
                     side=intent.side,
                     price=p,
                     qty=q,
                     grid_index=intent.grid_index,
-                    status="OPEN"
+                    status="OPEN",
+                    client_order_id=client_order_id
                 )
+                try:
+                    order.order_id = self.exchange.place_limit_order(
+                        self.symbol, intent.side.value, p, q, client_order_id=client_order_id
+                    )
+                except OrderStatusUnknown as e:
+                    # The order may exist: keep it under its client id and resolve it next tick
+                    order.status = "UNKNOWN"
+                    log_event(
+                        logger, "order_unknown", logging.WARNING, symbol=self.symbol,
+                        client_order_id=client_order_id, error=str(e)
+                    )
+                except ExchangeError:
+                    # Local balances may be wrong (e.g. insufficient balance); re-read them next tick
+                    if self.balances:
+                        self.balances.mark_stale()
+                    raise
+                if self.balances:
+                    if order.order_id:
+                        self.balances.reserve(order.order_id, *self.assets, intent.side.value, p, q)
+                    else:
+                        self.balances.mark_stale()
+                
+                # Update local DB state
+                self.state.active_order = order
+                self.state.order_seq += 1
                 self.state.state = BotStateRole.WAITING_ORDER_FILL
+                self._book_balances()
                 save_state(self.state, self.state_file)
+                self._reset_price_range(current_price)
+                if order.order_id:
+                    self._archive("placed", order)
+                    log_event(
+                        logger, "order_placed", symbol=self.symbol, order_id=order.order_id, side=intent.side.value,
+                        price=p, qty=q, grid_index=intent.grid_index, client_order_id=client_order_id,
+                        dry_run=self.config.dry_run
+                    )
             else:
                 logger.debug("No viable target intent evaluated. Waiting for price movement or range recovery.")
 
+    def apply_fill(self, update_balances: bool = True):
+        """
+        Books the active order as filled and flips the grid to its next phase.
+        update_balances=False is for fills already reflected in freshly read exchange balances.
+        """
+        order = self.state.active_order
+        # FIFO-match the fill against open lots for fee-aware realized PnL
+        # Ledger levels are absolute so lots stay matched across trailing shifts
+        level = self.state.grid_offset + order.grid_index
+        pnl = self.ledger.record_fill(order.side, order.price, order.qty, level)
+        self.state.open_lots = self.ledger.open_lots()
+        self._archive("filled", order, fee=order.price * order.qty * self.config.grid.fee_rate, realized_pnl=pnl)
+        if self.balances and update_balances:
+            self.balances.fill(
+                order.order_id, *self.assets, order.side.value, order.price, order.qty, self.config.grid.fee_rate
+            )
+        self.state = transition_state_on_fill(self.state, order.grid_index, realized_pnl=pnl)
+        self._book_balances()
+        save_state(self.state, self.state_file)
+        log_event(
+            logger, "order_filled", symbol=self.symbol, order_id=order.order_id,
+            side=order.side.value, price=order.price, qty=order.qty, grid_index=order.grid_index,
+            realized_pnl=pnl, phase=self.state.phase.value
+        )
+
+    def resolve_unknown_order(self) -> bool:
+        """
+        Looks up an order whose placement got no definite answer by its client id.
+        Found: it becomes a regular open order. Not found: it was never placed and the
+        bot goes IDLE. Returns True when the order exists.
+        """
+        order = self.state.active_order
+        order_id = self.exchange.find_order(self.symbol, order.client_order_id)
+        if order_id is None:
+            self.drop_active_order("NOT_FOUND")
+            return False
+        order.order_id = order_id
+        order.status = "OPEN"
+        if self.balances:
+            self.balances.reserve(order_id, *self.assets, order.side.value, order.price, order.qty)
+        self._book_balances()
+        save_state(self.state, self.state_file)
+        # Its status is unknown too: look it up on this tick
+        self._last_status_check = 0.0
+        self._archive("placed", order)
+        log_event(
+            logger, "order_placed", symbol=self.symbol, order_id=order_id, side=order.side.value,
+            price=order.price, qty=order.qty, grid_index=order.grid_index,
+            client_order_id=order.client_order_id, dry_run=self.config.dry_run
+        )
+        return True
+
+    def drop_active_order(self, status: str):
+        """Forgets an active order the exchange closed without a fill; the bot goes IDLE."""
+        log_event(
+            logger, "order_closed", logging.WARNING, symbol=self.symbol,
+            order_id=self.state.active_order.order_id, status=status
+        )
+        if self.balances:
+            self.balances.release(self.state.active_order.order_id)
+        if self.state.active_order.order_id:
+            # An UNKNOWN order that was never placed has nothing to archive
+            self._archive("closed", self.state.active_order)
+        self.state.active_order = None
+        self.state.state = BotStateRole.IDLE
+        self._book_balances()
+        save_state(self.state, self.state_file)
+
+    def reconcile_balances(self):
+        """Resyncs the balance ledger with the exchange's account totals (one account call)."""
+        drift = self.balances.reconcile(self.exchange.get_balances())
+        if drift:
+            log_event(logger, "balance_drift", logging.WARNING, symbol=self.symbol, drift=drift)
+        self._book_balances()
+
+    def _archive(self, event: str, order: ActiveOrder, fee: float = 0.0, realized_pnl: float = 0.0):
+        if self.archive:
+            # Absolute level, so fills per level stay comparable across trailing shifts
+            self.archive.record(
+                self.symbol, event, order.side.value, order.price, order.qty,
+                self.state.grid_offset + order.grid_index, fee=fee, realized_pnl=realized_pnl
+            )
+
+    def attach_shadows(self):
+        """
+        (Re)starts one ShadowGrid per config.shadows entry, anchored at this grid's P0 so
+        results differ by config only. PnL is compared from this point on: the live grid's
+        figures are reported relative to a baseline taken now.
+        """
+        self._start_shadows(self._build_shadows(self.config))
+
+    def _build_shadows(self, config: AppConfig) -> List["ShadowGrid"]:
+        from src.bot.shadow import ShadowGrid
+        p0 = self.state.p0_reference_price
+        return [ShadowGrid(name, grid, self.rules, p0) for name, grid in config.shadows.items()]
+
+    def _start_shadows(self, shadows: List["ShadowGrid"]):
+        self.shadows = shadows
+        self._shadow_baseline = None
+        self._next_shadow_report = time.time() + SHADOW_REPORT_INTERVAL_S
+        logger.info(f"Attached {len(self.shadows)} shadow grids: {[s.name for s in self.shadows]}")
+
+    def _live_result(self, mark: Optional[float]) -> "ShadowResult":
+        from src.bot.shadow import ShadowResult
+        return ShadowResult(
+            name="live",
+            fills=len(self.ledger),
+            realized_pnl=self.ledger.realized_pnl,
+            unrealized_pnl=self.ledger.unrealized_pnl(mark) if mark is not None else 0.0,
+            fees=self.ledger.fees_paid,
+        )
+
+    def _feed_shadows(self, price: float):
+        if self._shadow_baseline is None:
+            self._shadow_baseline = self._live_result(price)
+        for shadow in self.shadows:
+            shadow.on_price(price)
+        if time.time() >= self._next_shadow_report:
+            self._next_shadow_report = time.time() + SHADOW_REPORT_INTERVAL_S
+            for r in self.shadow_report():
+                log_event(
+                    logger, "shadow_report", symbol=self.symbol, grid=r.name, fills=r.fills,
+                    realized_pnl=r.realized_pnl, unrealized_pnl=r.unrealized_pnl, fees=r.fees, total_pnl=r.total_pnl
+                )
+
+    def shadow_report(self) -> List["ShadowResult"]:
+        """The live grid's PnL since the shadows were attached, followed by every shadow's."""
+        if not self.shadows or self._shadow_baseline is None:
+            return []
+        from src.bot.shadow import ShadowResult
+        mark = self.shadows[0].last_price
+        live, base = self._live_result(mark), self._shadow_baseline
+        results = [ShadowResult(
+            name="live",
+            fills=live.fills - base.fills,
+            realized_pnl=live.realized_pnl - base.realized_pnl,
+            unrealized_pnl=live.unrealized_pnl - base.unrealized_pnl,
+            fees=live.fees - base.fees,
+        )]
+        return results + [shadow.result() for shadow in self.shadows]
+
+    def _book_balances(self):
+        if self.balances and self.balances.seeded:
+            self.state.estimated_balances = self.balances.totals()
+
+    def _track_price(self, price: float):
+        self._range_low = price if self._range_low is None else min(self._range_low, price)
+        self._range_high = price if self._range_high is None else max(self._range_high, price)
+
+    def _reset_price_range(self, price: float):
+        self._last_status_check = time.time()
+        self._range_low = self._range_high = price
+
+    def _order_may_have_filled(self, order: ActiveOrder) -> bool:
+        """
+        True unless the traded range since the last status lookup provably stayed on the
+        far side of the order price. The range comes from sampled tick prices, widened by
+        exchange klines where available; a lookup is forced every forced_status_check_minutes.
+        """
+        force_after = self.config.grid.forced_status_check_minutes * 60
+        if time.time() - self._last_status_check >= force_after:
+            return True
+        if self._crossed(order, self._range_low, self._range_high):
+            return True
+            
+        try:
+            traded = self.exchange.get_price_range(self.symbol, int(self._last_status_check * 1000))
+        except ExchangeError as e:
+            logger.debug("Price range unavailable (%s); checking order status", e)
+            return True
+        if traded is None:
+            # Tick samples only: a wick between ticks is picked up by the forced lookup
+            return False
+        return self._crossed(order, *traded)
+
+    @staticmethod
+    def _crossed(order: ActiveOrder, low: Optional[float], high: Optional[float]) -> bool:
+        if low is None or high is None:
+            return True
+        if order.side == BotPhase.BUY:
+            return low <= order.price
+        return high >= order.price
+
+    def shift_grid(self, shift: int):
+        """Slides the grid by whole levels and re-bases the state's level indexes."""
+        self.levels.shift(shift)
+        self.state.grid_offset += shift
+        if self.state.last_filled_index is not None:
+            self.state.last_filled_index -= shift
+        if self.state.active_order:
+            self.state.active_order.grid_index -= shift
+        logger.info(
+            f"Trailing grid shifted {shift:+d} levels (offset {self.state.grid_offset}). "
+            f"Bottom: {self.levels[0]}, Top: {self.levels[-1]}"
+        )
+        save_state(self.state, self.state_file)
+
+    def _reprice_if_moved(self):
+        """Reprices the resting order when its grid level no longer matches its price."""
+        order = self.state.active_order
+        if not 0 <= order.grid_index < len(self.levels):
+            return
+            
+        p = round_tick_size(self.levels[order.grid_index], self.rules.tick_size)
+        # Tolerate float noise between equivalent grids when there is no tick size
+        if abs(p - order.price) <= max(self.rules.tick_size / 2, order.price * 1e-9):
+            return
+            
+        raw_qty = calculate_order_qty(self.mode, self.config.grid.initial_capital_amount, len(self.levels) - 1, p)
+        q = round_step_size(raw_qty, self.rules.step_size)
+        if p * q < self.rules.min_notional or q < self.rules.min_qty:
+            logger.warning(f"Repriced order below minimums. p={p}, q={q}. Keeping order at {order.price}.")
+            return
+        self.reprice_active_order(p, q)
+
+    def reprice_active_order(self, price: float, qty: float) -> bool:
+        """
+        Moves the active order to a new price/qty with one atomic cancel-replace, so
+        there is no window without a resting order. Returns False if the exchange
+        refused; the old order's status is then resolved on the next tick.
+        """
+        order = self.state.active_order
+        logger.info(f"Repricing {order.side} order {order.order_id}: {order.price} -> {price} (qty: {qty})")
+        
+        client_order_id = make_client_order_id(
+            self.symbol, self.state.grid_offset + order.grid_index, self.state.order_seq
+        )
+        try:
+            new_id = self.exchange.cancel_replace_order(
+                self.symbol, order.order_id, order.side.value, price, qty, client_order_id=client_order_id
+            )
+        except ExchangeError as e:
+            logger.warning(f"Cancel-replace of {order.order_id} failed: {e}. Will re-check its status.")
+            # The old order may be gone (cancelled, filled, or cancelled without its replacement):
+            # look it up on the next tick instead of trusting the price range
+            self._last_status_check = 0.0
+            return False
+        if self.balances:
+            self.balances.release(order.order_id)
+            self.balances.reserve(new_id, *self.assets, order.side.value, price, qty)
+                
+        order.order_id = new_id
+        order.client_order_id = client_order_id
+        order.price = price
+        order.qty = qty
+        order.status = "OPEN"
+        self.state.order_seq += 1
+        save_state(self.state, self.state_file)
+        self._archive("repriced", order)
+        log_event(logger, "order_repriced", symbol=self.symbol, order_id=new_id, side=order.side.value, price=price, qty=qty)
+        return True
+
+    def apply_config(self, new_config: AppConfig) -> List[ConfigChange]:
+        """
+        Applies a reloaded config to the running bot. Unsafe changes raise ConfigError
+        and leave the bot untouched; safe ones take effect in place, and the grid is
+        rebuilt only when its geometry changed. The new grid and shadows are built before
+        anything is swapped, so a config they reject also leaves the bot untouched.
+        """
+        changes = check_reload(self.config, new_config)
+        if not changes:
+            return changes
+            
+        changed_fields = {c.field for c in changes}
+        try:
+            commit_grid = self._prepare_grid(new_config) if changed_fields & set(GRID_GEOMETRY_FIELDS) else None
+            shadows = self._build_shadows(new_config) if "shadows" in changed_fields else None
+        except MathError as e:
+            raise ConfigError(f"Config reload rejected: {e}") from e
+
+        self.config = new_config
+        self.ledger.fee_rate = new_config.grid.fee_rate
+        if commit_grid:
+            commit_grid()
+        if shadows is not None:
+            self._start_shadows(shadows)
+            
+        for c in changes:
+            logger.info(f"Config reloaded: {c.field} {c.old} -> {c.new}")
+        save_state(self.state, self.state_file)
+        return changes
+
+    def _prepare_grid(self, config: AppConfig) -> Callable[[], None]:
+        """
+        Builds the levels of config's grid around P0 and maps every level index onto the
+        nearest new level. Returns the function that swaps them in; nothing changes before.
+        """
+        old_levels = self.levels
+        old_offset = self.state.grid_offset
+        base_levels = build_grid(
+            self.state.p0_reference_price,
+            config.grid.range_pct_bottom,
+            config.grid.range_pct_top,
+            config.grid.grid_intervals
+        )
+        new_levels = GridLadder(base_levels)
+        log_ratio = math.log(new_levels.ratio)
+        
+        def nearest(price: float) -> int:
+            return round(math.log(price / base_levels[0]) / log_ratio)
+            
+        last_filled_index = None
+        if self.state.last_filled_index is not None:
+            last_filled_index = nearest(old_levels.level_price(old_offset + self.state.last_filled_index))
+        # The order keeps resting; the next tick cancel-replaces it onto its new level
+        order_index = nearest(self.state.active_order.price) if self.state.active_order else None
+        exit_indices = {
+            level: nearest(old_levels.level_price(level))
+            for level in {lot.exit_index for lot in self.ledger.open_lots()}
+        }
+
+        def commit():
+            self.state.last_filled_index = last_filled_index
+            if self.state.active_order:
+                self.state.active_order.grid_index = order_index
+            self.ledger.rebase_levels(exit_indices.__getitem__)
+            self.state.open_lots = self.ledger.open_lots()
+            self.levels = new_levels
+            self.state.grid_offset = 0
+            logger.info(f"Rebuilt grid with {len(self.levels)} levels. Bottom: {self.levels[0]}, Top: {self.levels[-1]}")
+        return commit
+
+    def _check_config_reload(self):
+        if not self.config_watcher:
+            return
+        try:
+            new_config = self.config_watcher.poll()
+            if new_config:
+                self.apply_config(new_config)
+        except ConfigError as e:
+            logger.error(f"{e} Keeping the running configuration.")
+        except Exception as e:
+            logger.error(f"Config reload failed: {e}. Keeping the running configuration.", exc_info=True)
+
     def run_loop(self):
-        """Infinite loop wrapper for production use."""
+        """
+        Infinite loop wrapper for production use. Between ticks it waits on the config
+        watcher's wakeup, so a SIGHUP or config edit is applied within moments; the next
+        tick still runs one (possibly reloaded) check interval after the last.
+        """
         self.running = True
         logger.info(f"Starting GridBot loop every {self.config.grid.check_interval_minutes} minutes.")
-        interval_seconds = self.config.grid.check_interval_minutes * 60
+        wakeup = self.config_watcher.wakeup if self.config_watcher else threading.Event()
+        if self.config_watcher:
+            self.config_watcher.start()
+        last_tick: Optional[float] = None
         
-        while self.running:
-            try:
-                self.execute_tick()
-            except Exception as e:
-                logger.error(f"Error during tick: {e}", exc_info=True)
-                
-            time.sleep(interval_seconds)
+        try:
+            while self.running:
+                wakeup.clear()
+                self._check_config_reload()
+                # Re-read every iteration so a reloaded check interval applies immediately
+                interval_s = self.config.grid.check_interval_minutes * 60
+                if last_tick is None or time.monotonic() - last_tick >= interval_s:
+                    last_tick = time.monotonic()
+                    try:
+                        self.execute_tick()
+                    except Exception as e:
+                        logger.error(f"Error during tick: {e}", exc_info=True)
+                wakeup.wait(max(0.0, last_tick + interval_s - time.monotonic()))
+        finally:
+            if self.config_watcher:
+                self.config_watcher.stop()
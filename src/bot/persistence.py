@@ -1,26 +1,202 @@
 import os
 import json
+import struct
 import logging
 from dataclasses import asdict
-from typing import Optional
-from src.bot.state import GridState, BotPhase, BotStateRole, ActiveOrder
+from typing import Optional, Dict, List
+from src.bot.state import GridState, BotPhase, BotStateRole, ActiveOrder, OpenLot
 
 logger = logging.getLogger(__name__)
 
+# --- Compact binary format ---
+# Layout: MAGIC | u16 version | repeated fields of (u8 tag, u32 length, payload).
+# Readers skip tags they do not know, so new fields can be appended without breaking
+# older binaries; removed fields simply stop being written. Bump the version only for
+# changes that alter the meaning of an existing tag.
+BINARY_MAGIC = b"GRDS"
+BINARY_VERSION = 1
+BINARY_EXTENSIONS = (".bin", ".grds")
+
+_HEADER = struct.Struct("<4sH")
+_FIELD = struct.Struct("<BI")
+_U8 = struct.Struct("<B")
+_I64 = struct.Struct("<q")
+_F64 = struct.Struct("<d")
+_STR_LEN = struct.Struct("<H")
+_ORDER_NUMS = struct.Struct("<Bddq")
+_LOT = struct.Struct("<Bdddq")
+
+_TAG_PHASE = 1
+_TAG_STATE = 2
+_TAG_P0 = 3
+_TAG_LAST_FILLED_INDEX = 4
+_TAG_REALIZED_PNL = 5
+_TAG_BALANCE = 6
+_TAG_ACTIVE_ORDER = 7
+_TAG_OPEN_LOT = 8
+_TAG_GRID_OFFSET = 9
+_TAG_ORDER_SEQ = 10
+
+_PHASES = (BotPhase.BUY, BotPhase.SELL)
+_ROLES = (BotStateRole.IDLE, BotStateRole.WAITING_ORDER_FILL)
+
+class StateFormatError(Exception):
+    """Raised when a binary state payload is malformed or from an unsupported version."""
+    pass
+
+def _pack_str(value: str) -> bytes:
+    raw = value.encode("utf-8")
+    return _STR_LEN.pack(len(raw)) + raw
+
+def _unpack_str(buf: bytes, offset: int):
+    (length,) = _STR_LEN.unpack_from(buf, offset)
+    start = offset + _STR_LEN.size
+    return buf[start:start + length].decode("utf-8"), start + length
+
+def _field(tag: int, payload: bytes) -> bytes:
+    return _FIELD.pack(tag, len(payload)) + payload
+
+def encode_state(state: GridState) -> bytes:
+    """Serializes a GridState into the compact versioned binary format."""
+    parts = [
+        _HEADER.pack(BINARY_MAGIC, BINARY_VERSION),
+        _field(_TAG_PHASE, _U8.pack(_PHASES.index(state.phase))),
+        _field(_TAG_STATE, _U8.pack(_ROLES.index(state.state))),
+        _field(_TAG_P0, _F64.pack(state.p0_reference_price)),
+        _field(_TAG_REALIZED_PNL, _F64.pack(state.realized_pnl)),
+    ]
+    if state.grid_offset:
+        parts.append(_field(_TAG_GRID_OFFSET, _I64.pack(state.grid_offset)))
+    if state.order_seq:
+        parts.append(_field(_TAG_ORDER_SEQ, _I64.pack(state.order_seq)))
+    if state.last_filled_index is not None:
+        parts.append(_field(_TAG_LAST_FILLED_INDEX, _I64.pack(state.last_filled_index)))
+    for asset, amount in state.estimated_balances.items():
+        parts.append(_field(_TAG_BALANCE, _pack_str(asset) + _F64.pack(amount)))
+    order = state.active_order
+    if order is not None:
+        payload = (
+            _pack_str(order.order_id)
+            + _ORDER_NUMS.pack(_PHASES.index(order.side), order.price, order.qty, order.grid_index)
+            + _pack_str(order.status)
+        )
+        if order.client_order_id is not None:
+            # Appended after status: older readers ignore the trailing bytes
+            payload += _pack_str(order.client_order_id)
+        parts.append(_field(_TAG_ACTIVE_ORDER, payload))
+    for lot in state.open_lots:
+        parts.append(_field(_TAG_OPEN_LOT, _LOT.pack(
+            _PHASES.index(lot.side), lot.qty, lot.price, lot.fee_per_unit, lot.exit_index
+        )))
+    return b"".join(parts)
+
+def _decode_active_order(payload: bytes) -> ActiveOrder:
+    order_id, offset = _unpack_str(payload, 0)
+    side, price, qty, grid_index = _ORDER_NUMS.unpack_from(payload, offset)
+    status, offset = _unpack_str(payload, offset + _ORDER_NUMS.size)
+    client_order_id = _unpack_str(payload, offset)[0] if offset < len(payload) else None
+    return ActiveOrder(
+        order_id=order_id,
+        side=_PHASES[side],
+        price=price,
+        qty=qty,
+        grid_index=grid_index,
+        status=status,
+        client_order_id=client_order_id
+    )
+
+def decode_state(buf: bytes) -> GridState:
+    """Rebuilds a GridState from encode_state output, skipping unknown fields."""
+    if len(buf) < _HEADER.size:
+        raise StateFormatError("Binary state payload is truncated.")
+    magic, version = _HEADER.unpack_from(buf, 0)
+    if magic != BINARY_MAGIC:
+        raise StateFormatError("Not a GridState binary payload (bad magic).")
+    if version > BINARY_VERSION:
+        raise StateFormatError(f"Binary state version {version} is newer than supported {BINARY_VERSION}.")
+
+    phase = None
+    role = None
+    p0 = 0.0
+    last_filled_index: Optional[int] = None
+    realized_pnl = 0.0
+    balances: Dict[str, float] = {}
+    active_order: Optional[ActiveOrder] = None
+    open_lots: List[OpenLot] = []
+    grid_offset = 0
+    order_seq = 0
+
+    offset = _HEADER.size
+    end = len(buf)
+    while offset < end:
+        tag, length = _FIELD.unpack_from(buf, offset)
+        offset += _FIELD.size
+        payload = buf[offset:offset + length]
+        if len(payload) != length:
+            raise StateFormatError(f"Binary state field {tag} is truncated.")
+        offset += length
+
+        if tag == _TAG_PHASE:
+            phase = _PHASES[payload[0]]
+        elif tag == _TAG_STATE:
+            role = _ROLES[payload[0]]
+        elif tag == _TAG_P0:
+            (p0,) = _F64.unpack(payload)
+        elif tag == _TAG_LAST_FILLED_INDEX:
+            (last_filled_index,) = _I64.unpack(payload)
+        elif tag == _TAG_REALIZED_PNL:
+            (realized_pnl,) = _F64.unpack(payload)
+        elif tag == _TAG_BALANCE:
+            asset, pos = _unpack_str(payload, 0)
+            (balances[asset],) = _F64.unpack_from(payload, pos)
+        elif tag == _TAG_ACTIVE_ORDER:
+            active_order = _decode_active_order(payload)
+        elif tag == _TAG_GRID_OFFSET:
+            (grid_offset,) = _I64.unpack(payload)
+        elif tag == _TAG_ORDER_SEQ:
+            (order_seq,) = _I64.unpack(payload)
+        elif tag == _TAG_OPEN_LOT:
+            side, qty, price, fee_per_unit, exit_index = _LOT.unpack(payload)
+            open_lots.append(OpenLot(_PHASES[side], qty, price, fee_per_unit, exit_index))
+        # Unknown tags come from newer writers: skip them
+
+    if phase is None or role is None:
+        raise StateFormatError("Binary state is missing required phase/state fields.")
+
+    return GridState(
+        phase=phase,
+        state=role,
+        p0_reference_price=p0,
+        active_order=active_order,
+        last_filled_index=last_filled_index,
+        realized_pnl=realized_pnl,
+        estimated_balances=balances,
+        open_lots=open_lots,
+        grid_offset=grid_offset,
+        order_seq=order_seq
+    )
+
+def _is_binary_path(filepath: str) -> bool:
+    return filepath.endswith(BINARY_EXTENSIONS)
+
 def save_state(state: GridState, filepath: str):
     """
-    Saves the GridState to a JSON file atomically.
+    Saves the GridState atomically. Paths ending in .bin/.grds use the compact binary
+    format; anything else is written as human-readable JSON.
     Writes to a .tmp file first, then renames to avoid corruption on crash.
     """
     tmp_path = f"{filepath}.tmp"
-    
-    # Custom encoder for enums or just convert to dict
-    state_dict = asdict(state)
-    
+
     try:
-        with open(tmp_path, "w", encoding="utf-8") as f:
-            json.dump(state_dict, f, indent=4)
-        
+        if _is_binary_path(filepath):
+            with open(tmp_path, "wb") as f:
+                f.write(encode_state(state))
+        else:
+            # Custom encoder for enums or just convert to dict
+            state_dict = asdict(state)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(state_dict, f, indent=4)
+
         # Atomic replace
         os.replace(tmp_path, filepath)
     except Exception as e:
@@ -29,16 +205,20 @@ def save_state(state: GridState, filepath: str):
 
 def load_state(filepath: str) -> Optional[GridState]:
     """
-    Loads GridState from a JSON file.
+    Loads GridState from a JSON or binary state file (chosen by extension).
     Returns None if file does not exist.
     """
     if not os.path.exists(filepath):
         return None
-        
+
     try:
+        if _is_binary_path(filepath):
+            with open(filepath, "rb") as f:
+                return decode_state(f.read())
+
         with open(filepath, "r", encoding="utf-8") as f:
             data = json.load(f)
-            
+
         # Reconstruct ActiveOrder if present
         active_order = None
         if data.get("active_order"):
@@ -49,9 +229,10 @@ def load_state(filepath: str) -> Optional[GridState]:
                 price=float(ao_data["price"]),
                 qty=float(ao_data["qty"]),
                 grid_index=int(ao_data["grid_index"]),
-                status=ao_data.get("status", "NEW")
+                status=ao_data.get("status", "NEW"),
+                client_order_id=ao_data.get("client_order_id")
             )
-            
+
         state = GridState(
             phase=BotPhase(data["phase"]),
             state=BotStateRole(data["state"]),
@@ -59,10 +240,29 @@ def load_state(filepath: str) -> Optional[GridState]:
             active_order=active_order,
             last_filled_index=data.get("last_filled_index"),
             realized_pnl=float(data.get("realized_pnl", 0.0)),
-            estimated_balances=data.get("estimated_balances", {})
+            estimated_balances=data.get("estimated_balances", {}),
+            open_lots=[
+                OpenLot(
+                    side=BotPhase(lot["side"]),
+                    qty=float(lot["qty"]),
+                    price=float(lot["price"]),
+                    fee_per_unit=float(lot.get("fee_per_unit", 0.0)),
+                    exit_index=int(lot["exit_index"])
+                )
+                for lot in data.get("open_lots", [])
+            ],
+            grid_offset=int(data.get("grid_offset", 0)),
+            order_seq=int(data.get("order_seq", 0))
         )
         return state
-        
+
     except Exception as e:
         logger.error(f"Failed to load state from {filepath}: {e}")
         raise
+
+def export_state_json(source_path: str, target_path: str):
+    """Converts any state file (binary or JSON) into a human-readable JSON export."""
+    state = load_state(source_path)
+    if state is None:
+        raise FileNotFoundError(source_path)
+    save_state(state, target_path)
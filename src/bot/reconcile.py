@@ -0,0 +1,137 @@
+import os
+import logging
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence
+
+from src.core.eventlog import log_event
+from src.exchange.base import ExchangeInterface, ExchangeError, OpenOrder, Trade
+from src.bot.loop import GridBotOrchestrator
+from src.bot.persistence import save_state
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 16
+
+# Trades shortly before the last state save are included to absorb clock skew
+TRADES_LOOKBACK_MARGIN_MS = 60_000
+
+@dataclass
+class ReconcileReport:
+    symbol: str
+    # idle | open | filled | closed | skipped | failed
+    outcome: str
+    unknown_open_orders: List[str] = field(default_factory=list)
+
+def _state_saved_ms(bot: GridBotOrchestrator) -> int:
+    try:
+        return int(os.path.getmtime(bot.state_file) * 1000)
+    except OSError:
+        return 0
+
+def reconcile_bot(
+    bot: GridBotOrchestrator,
+    open_orders: List[OpenOrder],
+    trades: List[Trade],
+    balances: Optional[Dict[str, float]]
+) -> ReconcileReport:
+    """
+    Applies what happened on the exchange while the bot was down to its persisted state.
+    The active order is still resting if it is among the open orders; if not, the
+    account's trades show whether it filled, and only when they do not cover its full
+    quantity is its status queried. An order whose placement got no answer is first
+    looked up by client id. Open orders the state does not know are reported, never
+    touched.
+    """
+    state = bot.state
+    if state.active_order and state.active_order.status == "UNKNOWN":
+        # Placement never got an answer: find out by client id whether the order exists
+        bot.resolve_unknown_order()
+    order = state.active_order
+    resting = {o.order_id for o in open_orders}
+    unknown = sorted(resting - {order.order_id}) if order else sorted(resting)
+    if unknown:
+        logger.warning(f"{bot.symbol}: open orders not tracked by the bot state: {unknown}")
+
+    outcome = "idle"
+    if order and order.order_id in resting:
+        outcome = "open"
+        if bot.balances:
+            bot.balances.reserve(order.order_id, *bot.assets, order.side.value, order.price, order.qty)
+    elif order:
+        executed = sum(t.qty for t in trades if t.order_id == order.order_id)
+        if executed >= order.qty * (1 - 1e-9):
+            status = "FILLED"
+        else:
+            status = bot.exchange.get_order_status(bot.symbol, order.order_id)
+        if status == "FILLED":
+            # The balances read for this reconciliation already include the fill
+            bot.apply_fill(update_balances=balances is None)
+            outcome = "filled"
+        elif status in ("CANCELED", "REJECTED"):
+            bot.drop_active_order(status)
+            outcome = "closed"
+        else:
+            outcome = "open"
+
+    if bot.balances and bot.balances.seeded:
+        bot.state.estimated_balances = bot.balances.totals()
+    elif balances is not None:
+        bot.state.estimated_balances = dict(balances)
+    save_state(bot.state, bot.state_file)
+    log_event(logger, "reconciled", symbol=bot.symbol, outcome=outcome, unknown_open_orders=len(unknown))
+    return ReconcileReport(bot.symbol, outcome, unknown)
+
+def initialize_bots(bots: Sequence[GridBotOrchestrator], max_workers: int = DEFAULT_MAX_WORKERS):
+    """Runs initialize() for all bots concurrently (rules and price lookups overlap)."""
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bot-init") as pool:
+        for future in [pool.submit(bot.initialize) for bot in bots]:
+            future.result()
+
+def reconcile_bots(
+    bots: Sequence[GridBotOrchestrator],
+    exchange: ExchangeInterface,
+    max_workers: int = DEFAULT_MAX_WORKERS
+) -> List[ReconcileReport]:
+    """
+    Reconciles initialized bots with the exchange before the loop starts. Balances (once),
+    open orders per symbol and trades since each state file was last saved are fetched
+    concurrently, then every bot is reconciled in parallel. Dry-run bots are skipped;
+    a bot whose lookups fail is left for its first tick to resolve.
+    """
+    reports = {bot.symbol: ReconcileReport(bot.symbol, "skipped") for bot in bots}
+    live = [bot for bot in bots if not bot.config.dry_run]
+    if not live:
+        return list(reports.values())
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="reconcile") as pool:
+        balances_future = pool.submit(exchange.get_balances)
+        orders_futures = {bot.symbol: pool.submit(exchange.get_open_orders, bot.symbol) for bot in live}
+        trades_futures = {
+            bot.symbol: pool.submit(
+                exchange.get_recent_trades, bot.symbol, _state_saved_ms(bot) - TRADES_LOOKBACK_MARGIN_MS
+            )
+            for bot in live if bot.state.active_order
+        }
+
+        try:
+            balances = balances_future.result()
+        except ExchangeError as e:
+            logger.warning(f"Balance lookup failed during reconciliation: {e}")
+            balances = None
+        if balances is not None:
+            # Seed each shared balance ledger once, before the bots reserve their resting orders
+            for ledger in {id(b.balances): b.balances for b in live if b.balances}.values():
+                ledger.reconcile(balances)
+
+        def reconcile(bot: GridBotOrchestrator) -> ReconcileReport:
+            try:
+                trades = trades_futures[bot.symbol].result() if bot.symbol in trades_futures else []
+                return reconcile_bot(bot, orders_futures[bot.symbol].result(), trades, balances)
+            except ExchangeError as e:
+                logger.warning(f"{bot.symbol}: startup reconciliation failed ({e}); first tick will resolve it")
+                return ReconcileReport(bot.symbol, "failed")
+
+        for report in pool.map(reconcile, live):
+            reports[report.symbol] = report
+    return list(reports.values())
@@ -0,0 +1,134 @@
+import os
+import signal
+import logging
+import threading
+from dataclasses import dataclass, fields
+from typing import Any, List, Optional
+
+from src.core.config import AppConfig, ConfigError, load_config
+
+logger = logging.getLogger(__name__)
+
+# Changes that cannot be applied to a running bot, with the reason reported to the operator
+UNSAFE_FIELDS = {
+    "symbol": "changing the symbol means a different bot; start a new one with its own state file",
+    "mode": "switching LONG/SHORT_INVERTED would invert the meaning of the persisted phase and lots",
+    "initial_capital_asset": "the capital asset must match the inventory the bot already holds",
+    "dry_run": "switching between dry-run and live requires a restart",
+    "api_key": "exchange credentials are bound to the running adapter; restart to rotate keys",
+    "api_secret": "exchange credentials are bound to the running adapter; restart to rotate keys",
+}
+
+# Safe changes that require the grid levels to be rebuilt
+GRID_GEOMETRY_FIELDS = ("range_pct_bottom", "range_pct_top", "grid_intervals")
+
+# How often the watch thread checks the config file's mtime
+FILE_POLL_INTERVAL_S = 1.0
+
+@dataclass
+class ConfigChange:
+    field: str
+    old: Any
+    new: Any
+
+def diff_configs(old: AppConfig, new: AppConfig) -> List[ConfigChange]:
+    """Field-level differences between two configs (grid fields unprefixed)."""
+    changes = []
+    for f in fields(old.grid):
+        before, after = getattr(old.grid, f.name), getattr(new.grid, f.name)
+        if before != after:
+            changes.append(ConfigChange(f.name, before, after))
+    for f in fields(old):
+        if f.name == "grid":
+            continue
+        before, after = getattr(old, f.name), getattr(new, f.name)
+        if before != after:
+            changes.append(ConfigChange(f.name, before, after))
+    return changes
+
+def check_reload(old: AppConfig, new: AppConfig) -> List[ConfigChange]:
+    """Returns the changes if all of them are safe to apply live, else raises ConfigError."""
+    changes = diff_configs(old, new)
+    rejected = [f"{c.field}: {UNSAFE_FIELDS[c.field]}" for c in changes if c.field in UNSAFE_FIELDS]
+    if rejected:
+        raise ConfigError("Config reload rejected. " + "; ".join(rejected))
+    return changes
+
+class ConfigWatcher:
+    """
+    Detects config file edits (mtime polling) or an explicit reload request (SIGHUP)
+    and returns the freshly loaded config for the orchestrator to apply. Both set
+    wakeup, so a loop waiting on it applies the reload without waiting for its next tick.
+    """
+
+    def __init__(self, config_path: str, cli_dry_run: bool, watch_file: bool = True):
+        self.config_path = config_path
+        self.cli_dry_run = cli_dry_run
+        self.watch_file = watch_file
+        self.reload_requested = False
+        self.wakeup = threading.Event()
+        self._mtime = self._current_mtime()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _current_mtime(self) -> Optional[float]:
+        try:
+            return os.stat(self.config_path).st_mtime
+        except OSError:
+            return None
+
+    def _file_changed(self) -> bool:
+        mtime = self._current_mtime()
+        return self.watch_file and mtime is not None and mtime != self._mtime
+
+    def install_signal_handler(self, signum: Optional[int] = None):
+        """Requests a reload on SIGHUP (where the platform has it)."""
+        if signum is None:
+            signum = getattr(signal, "SIGHUP", None)
+            if signum is None:
+                return
+        signal.signal(signum, lambda *_: self.request_reload())
+
+    def start(self, poll_interval_s: float = FILE_POLL_INTERVAL_S):
+        """Starts a daemon thread that sets wakeup when the config file changes."""
+        if not self.watch_file or self._thread:
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._watch, args=(poll_interval_s,), name="config-watcher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def _watch(self, poll_interval_s: float):
+        while not self._stopped.wait(poll_interval_s):
+            if self._file_changed():
+                self.wakeup.set()
+
+    def request_reload(self):
+        self.reload_requested = True
+        self.wakeup.set()
+
+    def poll(self) -> Optional[AppConfig]:
+        """
+        Returns a newly loaded config if a reload is due, else None. A file that cannot be
+        read or parsed raises ConfigError, so a typo never takes down the running bot.
+        """
+        if not (self._file_changed() or self.reload_requested):
+            return None
+
+        self.reload_requested = False
+        self._mtime = self._current_mtime()
+        logger.info(f"Reloading configuration from {self.config_path}")
+        try:
+            return load_config(self.config_path, self.cli_dry_run)
+        except ConfigError:
+            raise
+        except Exception as e:
+            # YAML syntax errors, unreadable files, values of the wrong type...
+            raise ConfigError(f"Cannot load {self.config_path}: {e}") from e
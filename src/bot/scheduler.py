@@ -0,0 +1,173 @@
+import time
+import heapq
+import random
+import logging
+import itertools
+import threading
+from collections import deque
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.core.eventlog import log_event
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TICK_WORKERS = 8
+
+@dataclass
+class _Task:
+    fn: Callable[[], None]
+    interval_s: Callable[[], float]
+    # Sequence number of this task's live heap entry; older entries are skipped
+    seq: int = -1
+
+class TickScheduler:
+    """
+    Central timer heap for a fleet of grids. Each task has one entry keyed by its next due
+    time, so dispatching a due tick and rescheduling it cost O(log n) regardless of how
+    many grids are registered. Due ticks run on a bounded thread pool; a task is only
+    rescheduled once its tick finished, so a grid never ticks concurrently with itself.
+
+    First ticks are spread uniformly over startup_spread_s (at most one interval) and every
+    later one is jittered by +/- jitter of the interval, so grids sharing an interval
+    drift apart instead of firing in bursts.
+    Lag (start time - due time) is kept for the last lag_window ticks.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_TICK_WORKERS,
+        jitter: float = 0.1,
+        startup_spread_s: float = 5.0,
+        lag_window: int = 1000,
+        clock: Callable[[], float] = time.monotonic,
+        seed: Optional[int] = None
+    ):
+        self.max_workers = max_workers
+        self.jitter = jitter
+        self.startup_spread_s = startup_spread_s
+        self.clock = clock
+        self._rng = random.Random(seed)
+        # (due, seq, key)
+        self._heap: List[Tuple[float, int, str]] = []
+        self._tasks: Dict[str, _Task] = {}
+        self._seq = itertools.count()
+        self._in_flight = 0
+        self._cond = threading.Condition()
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="tick")
+        self._lags = deque(maxlen=lag_window)
+        self.ticks = 0
+        self.max_lag = 0.0
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def _push(self, key: str, task: _Task, due: float):
+        task.seq = next(self._seq)
+        heapq.heappush(self._heap, (due, task.seq, key))
+        self._cond.notify_all()
+
+    def _live(self, entry: Tuple[float, int, str]) -> bool:
+        task = self._tasks.get(entry[2])
+        return task is not None and task.seq == entry[1]
+
+    def add(self, key: str, fn: Callable[[], None], interval_s: Callable[[], float], first_due: Optional[float] = None):
+        """Registers a periodic task; interval_s is re-read after every tick (config reloads)."""
+        with self._cond:
+            if first_due is None:
+                first_due = self.clock() + self._rng.uniform(0, min(interval_s(), self.startup_spread_s))
+            task = _Task(fn, interval_s)
+            self._tasks[key] = task
+            self._push(key, task, first_due)
+
+    def remove(self, key: str):
+        """Unregisters a task; a tick already running finishes but is not rescheduled."""
+        with self._cond:
+            self._tasks.pop(key, None)
+
+    def next_due(self) -> Optional[float]:
+        with self._cond:
+            while self._heap and not self._live(self._heap[0]):
+                heapq.heappop(self._heap)
+            return self._heap[0][0] if self._heap else None
+
+    def run_pending(self) -> int:
+        """Dispatches due ticks while pool slots are free. Returns how many were dispatched."""
+        dispatched = 0
+        with self._cond:
+            now = self.clock()
+            while self._heap and self._in_flight < self.max_workers:
+                due, seq, key = self._heap[0]
+                if not self._live(self._heap[0]):
+                    heapq.heappop(self._heap)
+                    continue
+                if due > now:
+                    break
+                heapq.heappop(self._heap)
+                task = self._tasks[key]
+                # No live entry while the tick runs: it cannot be dispatched twice
+                task.seq = -1
+                self._in_flight += 1
+                self._pool.submit(self._run, key, task, due)
+                dispatched += 1
+        return dispatched
+
+    def _run(self, key: str, task: _Task, due: float):
+        started = self.clock()
+        try:
+            task.fn()
+        except Exception as e:
+            logger.error(f"Tick failed for {key}: {e}", exc_info=True)
+        finally:
+            with self._cond:
+                lag = max(0.0, started - due)
+                self._lags.append(lag)
+                self.ticks += 1
+                self.max_lag = max(self.max_lag, lag)
+                self._in_flight -= 1
+                if self._tasks.get(key) is task:
+                    interval = task.interval_s()
+                    self._push(key, task, started + interval * (1 + self._rng.uniform(-self.jitter, self.jitter)))
+                else:
+                    self._cond.notify_all()
+
+    def lag_stats(self) -> Dict[str, float]:
+        with self._cond:
+            lags = sorted(self._lags)
+        if not lags:
+            return {"ticks": self.ticks, "p50_s": 0.0, "p99_s": 0.0, "max_s": self.max_lag}
+        return {
+            "ticks": self.ticks,
+            "p50_s": lags[len(lags) // 2],
+            "p99_s": lags[min(len(lags) - 1, int(len(lags) * 0.99))],
+            "max_s": self.max_lag,
+        }
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """Blocks until no tick is running."""
+        with self._cond:
+            return self._cond.wait_for(lambda: self._in_flight == 0, timeout)
+
+    def run(self, should_stop: Callable[[], bool], poll_s: float = 0.5, report_interval_s: float = 60.0):
+        """
+        Dispatches ticks until should_stop() returns True. Waits are capped at poll_s so
+        the stop condition (e.g. a cross-process flag) is checked regularly.
+        """
+        next_report = self.clock() + report_interval_s
+        while not should_stop():
+            self.run_pending()
+            now = self.clock()
+            if now >= next_report:
+                log_event(logger, "scheduler_lag", tasks=len(self), **self.lag_stats())
+                next_report = now + report_interval_s
+            with self._cond:
+                due = self.next_due()
+                wait = poll_s if due is None or self._in_flight >= self.max_workers else due - now
+                if wait > 0:
+                    self._cond.wait(min(poll_s, wait))
+
+    def shutdown(self, wait: bool = True):
+        with self._cond:
+            self._tasks.clear()
+        self._pool.shutdown(wait=wait)
@@ -0,0 +1,111 @@
+import logging
+from dataclasses import dataclass
+from typing import Optional
+
+from src.core.config import GridConfig
+from src.core.math import build_grid, round_tick_size, round_step_size, GridLadder
+from src.exchange.base import SymbolRules
+from src.bot.state import GridState, BotPhase, BotStateRole, ActiveOrder
+from src.bot.decision import get_next_order_intent, transition_state_on_fill, calculate_trailing_shift
+from src.bot.ledger import FillLedger
+from src.core.eventlog import log_event
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class ShadowResult:
+    """PnL of one grid since the shadows were attached, marked at the last price."""
+    name: str
+    fills: int
+    realized_pnl: float
+    unrealized_pnl: float
+    fees: float
+
+    @property
+    def total_pnl(self) -> float:
+        return self.realized_pnl + self.unrealized_pnl
+
+class ShadowGrid:
+    """
+    A candidate grid config traded on paper from the live bot's price feed.
+    It runs the live decision logic (intents, trailing shifts, fill transitions, rounding
+    and exchange minimums) and the same fee-aware FIFO ledger, but its single resting
+    order lives here and fills with MockExchange's rule: a BUY once a fed price is at or
+    below it, a SELL once one is at or above it. Only tick prices are seen, so a wick
+    between two ticks is missed. It never touches the exchange, and a tick where its
+    order is not reached is two comparisons.
+    """
+
+    def __init__(self, name: str, grid: GridConfig, rules: SymbolRules, p0: float):
+        self.name = name
+        self.grid = grid
+        self.rules = rules
+        self.levels = GridLadder(build_grid(p0, grid.range_pct_bottom, grid.range_pct_top, grid.grid_intervals))
+        initial_phase = BotPhase.BUY if grid.mode == "LONG" else BotPhase.SELL
+        self.state = GridState(phase=initial_phase, state=BotStateRole.IDLE, p0_reference_price=p0)
+        self.ledger = FillLedger(grid.fee_rate)
+        self.last_price: Optional[float] = None
+        # A non-trailing grid blocked at an edge stays blocked: skip re-evaluating it
+        self._blocked = False
+
+    def on_price(self, price: float):
+        self.last_price = price
+        order = self.state.active_order
+        if order is not None:
+            if order.side == BotPhase.BUY:
+                if price > order.price:
+                    return
+            elif price < order.price:
+                return
+            self._fill(order)
+        if not self._blocked:
+            self._place(price)
+
+    def _fill(self, order: ActiveOrder):
+        level = self.state.grid_offset + order.grid_index
+        pnl = self.ledger.record_fill(order.side, order.price, order.qty, level)
+        self.state = transition_state_on_fill(self.state, order.grid_index, realized_pnl=pnl)
+        log_event(
+            logger, "shadow_fill", logging.DEBUG, shadow=self.name, side=order.side.value,
+            price=order.price, qty=order.qty, grid_index=order.grid_index, realized_pnl=pnl
+        )
+
+    def _place(self, price: float):
+        capital = self.grid.initial_capital_amount
+        intent = get_next_order_intent(self.state, price, self.levels, self.grid.mode, capital)
+        if intent is None and self.grid.trailing:
+            shift = calculate_trailing_shift(self.state, price, self.levels, self.levels.ratio)
+            if shift:
+                self.levels.shift(shift)
+                self.state.grid_offset += shift
+                self.state.last_filled_index -= shift
+                intent = get_next_order_intent(self.state, price, self.levels, self.grid.mode, capital)
+        if intent is None:
+            self._blocked = self.state.last_filled_index is not None and not self.grid.trailing
+            return
+        p = round_tick_size(intent.price, self.rules.tick_size)
+        q = round_step_size(intent.qty, self.rules.step_size)
+        if p * q < self.rules.min_notional or q < self.rules.min_qty:
+            return
+        self.state.active_order = ActiveOrder(
+            order_id="", side=intent.side, price=p, qty=q, grid_index=intent.grid_index, status="OPEN"
+        )
+        self.state.state = BotStateRole.WAITING_ORDER_FILL
+
+    def result(self) -> ShadowResult:
+        mark = self.last_price
+        return ShadowResult(
+            name=self.name,
+            fills=len(self.ledger),
+            realized_pnl=self.ledger.realized_pnl,
+            unrealized_pnl=self.ledger.unrealized_pnl(mark) if mark is not None else 0.0,
+            fees=self.ledger.fees_paid,
+        )
+
+def format_shadow_report(results) -> str:
+    lines = [f"{'grid':<20}{'fills':>8}{'realized':>14}{'unrealized':>14}{'fees':>12}{'total':>14}"]
+    for r in results:
+        lines.append(
+            f"{r.name:<20}{r.fills:>8}{r.realized_pnl:>14.4f}{r.unrealized_pnl:>14.4f}{r.fees:>12.4f}{r.total_pnl:>14.4f}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,79 @@
+import os
+import json
+import time
+import hashlib
+import logging
+from dataclasses import dataclass, field, asdict
+from typing import Optional, List, Dict, Any
+
+from src.exchange.base import SymbolRules
+
+logger = logging.getLogger(__name__)
+
+# Bump when the snapshot layout or anything it caches changes meaning
+SNAPSHOT_VERSION = 2
+DEFAULT_MAX_AGE_SECONDS = 24 * 60 * 60
+
+@dataclass
+class StartupSnapshot:
+    """
+    Everything a one-shot run would otherwise recompute or refetch on startup:
+    the parsed config, the symbol rules and the grid levels for a given P0.
+    """
+    key: str
+    created_at: float
+    raw_config: Dict[str, Any]
+    rules: Optional[SymbolRules] = None
+    p0_reference_price: float = 0.0
+    levels: List[float] = field(default_factory=list)
+
+def snapshot_key(config_path: Optional[str]) -> str:
+    """Hashes the raw config file bytes; any edit to the config invalidates the snapshot."""
+    digest = hashlib.sha256(f"gridbot-snapshot-v{SNAPSHOT_VERSION}".encode("utf-8"))
+    if config_path:
+        with open(config_path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+def load_snapshot(
+    filepath: str,
+    key: str,
+    max_age_seconds: float = DEFAULT_MAX_AGE_SECONDS
+) -> Optional[StartupSnapshot]:
+    """Returns the cached snapshot if it matches key and is fresh enough, else None."""
+    if not os.path.exists(filepath):
+        return None
+    try:
+        with open(filepath, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable startup snapshot {filepath}: {e}")
+        return None
+
+    if data.get("key") != key:
+        logger.info("Startup snapshot is for a different config. Rebuilding.")
+        return None
+    if time.time() - float(data.get("created_at", 0.0)) > max_age_seconds:
+        logger.info("Startup snapshot expired. Rebuilding.")
+        return None
+
+    rules = SymbolRules(**data["rules"]) if data.get("rules") else None
+    return StartupSnapshot(
+        key=data["key"],
+        created_at=float(data["created_at"]),
+        raw_config=data.get("raw_config", {}),
+        rules=rules,
+        p0_reference_price=float(data.get("p0_reference_price", 0.0)),
+        levels=[float(p) for p in data.get("levels", [])]
+    )
+
+def save_snapshot(snapshot: StartupSnapshot, filepath: str):
+    """
+    Writes the snapshot atomically. The file may hold secrets copied from the config,
+    so it is created owner-readable only.
+    """
+    tmp_path = f"{filepath}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(asdict(snapshot), f)
+    os.replace(tmp_path, filepath)
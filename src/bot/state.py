@@ -1,6 +1,6 @@
 from enum import Enum
 from dataclasses import dataclass, field
-from typing import Optional, Dict
+from typing import Optional, Dict, List
 
 class BotPhase(str, Enum):
     BUY = "BUY"
@@ -10,23 +10,34 @@ class BotStateRole(str, Enum):
     IDLE = "IDLE"
     WAITING_ORDER_FILL = "WAITING_ORDER_FILL"
 
-@dataclass
+@dataclass(slots=True)
 class OrderIntent:
     side: BotPhase
     price: float
     qty: float
     grid_index: int
 
-@dataclass
+@dataclass(slots=True)
 class ActiveOrder:
     order_id: str
     side: BotPhase
     price: float
     qty: float
     grid_index: int
+    # UNKNOWN: placement got no definite answer; order_id is empty until resolved by client id
     status: str = "NEW"
+    client_order_id: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
+class OpenLot:
+    """A filled position not yet matched by an opposite fill (see FillLedger)."""
+    side: BotPhase
+    qty: float
+    price: float
+    fee_per_unit: float
+    exit_index: int
+
+@dataclass(slots=True)
 class GridState:
     phase: BotPhase
     state: BotStateRole
@@ -35,3 +46,8 @@ class GridState:
     last_filled_index: Optional[int] = None
     realized_pnl: float = 0.0
     estimated_balances: Dict[str, float] = field(default_factory=dict)
+    open_lots: List[OpenLot] = field(default_factory=list)
+    # Whole levels the trailing grid has shifted from its original P0 range
+    grid_offset: int = 0
+    # Orders placed so far; part of each order's client id
+    order_seq: int = 0
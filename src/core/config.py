@@ -1,8 +1,6 @@
 import os
-import yaml
-from dataclasses import dataclass
-from typing import Optional
-from dotenv import load_dotenv
+from dataclasses import dataclass, field
+from typing import Optional, Dict, Any, List
 
 class ConfigError(Exception):
     pass
@@ -18,6 +16,11 @@ class GridConfig:
     grid_intervals: int = 20
     check_interval_minutes: int = 5
     fee_rate: float = 0.001
+    # Shift the grid by whole levels instead of idling when price leaves the range
+    trailing: bool = False
+    # Open orders are only polled when the traded range since the last check reached
+    # their price, but at least this often (0 polls every tick)
+    forced_status_check_minutes: float = 30.0
 
 @dataclass
 class AppConfig:
@@ -25,32 +28,41 @@ class AppConfig:
     dry_run: bool = True
     api_key: Optional[str] = None
     api_secret: Optional[str] = None
+    # Candidate grids traded on paper from this bot's price feed, by name (see ShadowGrid)
+    shadows: Dict[str, GridConfig] = field(default_factory=dict)
 
 def load_config(config_path: Optional[str], cli_dry_run: bool) -> AppConfig:
+    return build_config(read_config_file(config_path), cli_dry_run)
+
+def read_config_file(config_path: Optional[str]) -> Dict[str, Any]:
+    """Parses the YAML config file into a plain dict (empty if no path given)."""
+    if not config_path:
+        return {}
+    # Imported lazily: yaml is a noticeable share of cold start for one-shot runs
+    import yaml
+    with open(config_path, "r", encoding="utf-8") as file:
+        return yaml.safe_load(file) or {}
+
+def build_config(raw_yaml: Dict[str, Any], cli_dry_run: bool) -> AppConfig:
+    """Builds and validates an AppConfig from parsed YAML plus env/CLI overrides."""
     # 1. Load env vars
+    from dotenv import load_dotenv
     load_dotenv()
     
-    # 2. Load yaml config if provided
-    raw_yaml = {}
-    if config_path:
-        with open(config_path, "r", encoding="utf-8") as file:
-            raw_yaml = yaml.safe_load(file) or {}
-    
+    # 2. Grid section from the parsed yaml
     grid_data = raw_yaml.get("grid", {})
-    grid_config = GridConfig(
-        symbol=grid_data.get("symbol", "BTCUSDT"),
-        mode=grid_data.get("mode", "LONG"),
-        initial_capital_amount=float(grid_data.get("initial_capital_amount", 100.0)),
-        initial_capital_asset=grid_data.get("initial_capital_asset", "USDT"),
-        range_pct_bottom=float(grid_data.get("range_pct_bottom", -0.10)),
-        range_pct_top=float(grid_data.get("range_pct_top", 0.10)),
-        grid_intervals=int(grid_data.get("grid_intervals", 20)),
-        check_interval_minutes=int(grid_data.get("check_interval_minutes", 5)),
-        fee_rate=float(grid_data.get("fee_rate", 0.001))
-    )
+    grid_config = _build_grid_config(grid_data)
     
     app_config = AppConfig(grid=grid_config)
     
+    # Shadow entries override the grid section, like fleet entries
+    for i, entry in enumerate(raw_yaml.get("shadows") or []):
+        entry = dict(entry)
+        name = str(entry.pop("name", f"shadow{i + 1}"))
+        if name in app_config.shadows:
+            raise ConfigError(f"Shadow grid names must be unique, duplicated: {name}")
+        app_config.shadows[name] = _build_grid_config({**grid_data, **entry})
+    
     # 3. CLI dry_run overrides default and config
     # We default dry_run to true for safety, but check env/cli
     app_config.dry_run = True
@@ -69,25 +81,76 @@ def load_config(config_path: Optional[str], cli_dry_run: bool) -> AppConfig:
     
     return app_config
 
+def _build_grid_config(grid_data: Dict[str, Any]) -> GridConfig:
+    return GridConfig(
+        symbol=grid_data.get("symbol", "BTCUSDT"),
+        mode=grid_data.get("mode", "LONG"),
+        initial_capital_amount=float(grid_data.get("initial_capital_amount", 100.0)),
+        initial_capital_asset=grid_data.get("initial_capital_asset", "USDT"),
+        range_pct_bottom=float(grid_data.get("range_pct_bottom", -0.10)),
+        range_pct_top=float(grid_data.get("range_pct_top", 0.10)),
+        grid_intervals=int(grid_data.get("grid_intervals", 20)),
+        check_interval_minutes=int(grid_data.get("check_interval_minutes", 5)),
+        fee_rate=float(grid_data.get("fee_rate", 0.001)),
+        trailing=bool(grid_data.get("trailing", False)),
+        forced_status_check_minutes=float(grid_data.get("forced_status_check_minutes", 30.0))
+    )
+
+def load_fleet_config(config_path: Optional[str], cli_dry_run: bool) -> List[AppConfig]:
+    """
+    Loads one AppConfig per grid. A `fleet:` list in the YAML holds per-symbol entries
+    that override the shared `grid:` section; without it the single grid is returned.
+    """
+    raw_yaml = read_config_file(config_path)
+    entries = raw_yaml.get("fleet")
+    if not entries:
+        return [build_config(raw_yaml, cli_dry_run)]
+        
+    base_grid = raw_yaml.get("grid", {})
+    configs = []
+    for entry in entries:
+        raw_entry = dict(raw_yaml)
+        raw_entry["grid"] = {**base_grid, **entry}
+        configs.append(build_config(raw_entry, cli_dry_run))
+        
+    symbols = [c.grid.symbol for c in configs]
+    duplicates = sorted({s for s in symbols if symbols.count(s) > 1})
+    if duplicates:
+        raise ConfigError(f"Fleet symbols must be unique, duplicated: {duplicates}")
+    return configs
+
 def validate_config(config: AppConfig):
     # Missing secrets logic
     if not config.dry_run and (not config.api_key or not config.api_secret):
         print("WARNING: API keys missing. Yielding safely to dry-run mode.")
         config.dry_run = True
 
+    validate_grid_config(config.grid)
+    for name, shadow in config.shadows.items():
+        if shadow.symbol != config.grid.symbol:
+            raise ConfigError(f"Shadow grid {name} must trade {config.grid.symbol}, got {shadow.symbol}")
+        validate_grid_config(shadow)
+
+def validate_grid_config(grid: GridConfig):
     # Mode validation
     valid_modes = ["LONG", "SHORT_INVERTED"]
-    if config.grid.mode not in valid_modes:
-        raise ConfigError(f"Mode must be one of {valid_modes}, got {config.grid.mode}")
+    if grid.mode not in valid_modes:
+        raise ConfigError(f"Mode must be one of {valid_modes}, got {grid.mode}")
 
     # Capital validation
-    if config.grid.initial_capital_amount <= 0:
+    if grid.initial_capital_amount <= 0:
         raise ConfigError("Initial capital amount must be completely > 0.")
         
     # Grid intervals validation
-    if config.grid.grid_intervals < 2:
+    if grid.grid_intervals < 2:
         raise ConfigError("Grid intervals must be >= 2.")
 
     # Range validation
-    if config.grid.range_pct_bottom >= config.grid.range_pct_top:
-        raise ConfigError(f"range_pct_bottom ({config.grid.range_pct_bottom}) must be < range_pct_top ({config.grid.range_pct_top})")
+    if grid.range_pct_bottom >= grid.range_pct_top:
+        raise ConfigError(f"range_pct_bottom ({grid.range_pct_bottom}) must be < range_pct_top ({grid.range_pct_top})")
+
+    if grid.range_pct_bottom <= -1:
+        raise ConfigError(f"range_pct_bottom ({grid.range_pct_bottom}) must be > -1: the bottom price must stay above 0")
+
+    if grid.forced_status_check_minutes < 0:
+        raise ConfigError("forced_status_check_minutes must be >= 0.")
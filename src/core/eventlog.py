@@ -0,0 +1,131 @@
+"""
+Structured event logging off the tick thread.
+Records are queued as-is and formatted by a background listener, which writes
+human-readable console output and rotated JSON-lines event files.
+"""
+import json
+import queue
+import atexit
+import logging
+import logging.handlers
+from typing import Any, Dict, List, Optional
+
+DEFAULT_QUEUE_SIZE = 10000
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+DEFAULT_BACKUP_COUNT = 5
+
+TEXT_FORMAT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+TEXT_DATEFMT = "%Y-%m-%d %H:%M:%S"
+
+class _KeyValues:
+    """Renders event fields as `k=v` only if a text handler actually formats the record."""
+    __slots__ = ("fields",)
+
+    def __init__(self, fields: Dict[str, Any]):
+        self.fields = fields
+
+    def __str__(self) -> str:
+        return " ".join(f"{k}={v}" for k, v in self.fields.items())
+
+def log_event(logger: logging.Logger, event: str, level: int = logging.INFO, **fields):
+    """
+    Emits a structured event. Nothing is formatted on the caller's thread: the text
+    message and the JSON line are both built by the background listener.
+    """
+    if logger.isEnabledFor(level):
+        logger.log(level, "%s %s", event, _KeyValues(fields), extra={"event": event, "fields": fields})
+
+class JsonLinesFormatter(logging.Formatter):
+    """One JSON object per record: time, level, logger, event, fields, message."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": round(record.created, 6),
+            "level": record.levelname,
+            "logger": record.name,
+        }
+        event = getattr(record, "event", None)
+        if event:
+            entry["event"] = event
+            entry.update(record.fields)
+        else:
+            entry["msg"] = record.getMessage()
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """
+    Non-blocking queue handler. When the listener falls behind (slow disk) new records
+    are dropped and counted rather than blocking the tick; the count is reported once
+    the queue drains.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The base class formats here, on the caller's thread. Records stay in-process,
+        # so they are passed through untouched and formatted by the listener instead.
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            return
+        if self.dropped and self.queue.qsize() < self.queue.maxsize // 2:
+            dropped, self.dropped = self.dropped, 0
+            warning = logging.LogRecord(
+                "src.core.eventlog", logging.WARNING, __file__, 0,
+                "Log queue overflowed; dropped %d records", (dropped,), None
+            )
+            try:
+                self.queue.put_nowait(warning)
+            except queue.Full:
+                self.dropped += dropped
+
+class EventLogListener(logging.handlers.QueueListener):
+    """QueueListener whose stop() may be called more than once (explicitly and at exit)."""
+
+    def stop(self):
+        if self._thread is not None:
+            super().stop()
+
+def setup_logging(
+    level: int = logging.INFO,
+    event_log: Optional[str] = None,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+    backup_count: int = DEFAULT_BACKUP_COUNT,
+    queue_size: int = DEFAULT_QUEUE_SIZE
+) -> EventLogListener:
+    """
+    Routes all logging through a bounded queue to a background listener thread.
+    Console output keeps the plain text format; `event_log`, when set, receives
+    every record as JSON lines with size-based rotation.
+    Returns the started listener; it is stopped (and flushed) at interpreter exit.
+    """
+    console = logging.StreamHandler()
+    console.setFormatter(logging.Formatter(TEXT_FORMAT, datefmt=TEXT_DATEFMT))
+    handlers: List[logging.Handler] = [console]
+    if event_log:
+        rotating = logging.handlers.RotatingFileHandler(
+            event_log, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8"
+        )
+        rotating.setFormatter(JsonLinesFormatter())
+        handlers.append(rotating)
+
+    log_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+    listener = EventLogListener(log_queue, *handlers, respect_handler_level=True)
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(BoundedQueueHandler(log_queue))
+    root.setLevel(level)
+
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
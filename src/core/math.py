@@ -79,3 +79,59 @@ def round_tick_size(price: float, tick_size: float) -> float:
     precision = max(0, -int(math.floor(math.log10(tick_size))))
     rounded = round(price / tick_size) * tick_size
     return round(rounded, precision)
+
+class GridLadder:
+    """
+    Geometric grid levels held in a fixed-size ring buffer.
+    Indexes like a list of N+1 prices (levels[0] is the bottom, levels[-1] the top).
+    shift(k) slides the window by k whole levels (up if k > 0), computing only the k
+    levels that enter the window instead of rebuilding the grid.
+    """
+
+    def __init__(self, base_levels: List[float], offset: int = 0):
+        if len(base_levels) < 2:
+            raise MathError("A grid ladder needs at least 2 levels.")
+        self._bottom = base_levels[0]
+        self.ratio = (base_levels[-1] / base_levels[0]) ** (1.0 / (len(base_levels) - 1))
+        self._buf = list(base_levels)
+        self._head = 0
+        self.offset = 0
+        if offset:
+            self.shift(offset)
+
+    def __len__(self) -> int:
+        return len(self._buf)
+
+    def __getitem__(self, i: int) -> float:
+        size = len(self._buf)
+        if i < 0:
+            i += size
+        if not 0 <= i < size:
+            raise IndexError("grid level index out of range")
+        return self._buf[(self._head + i) % size]
+
+    def __iter__(self):
+        size = len(self._buf)
+        for i in range(size):
+            yield self._buf[(self._head + i) % size]
+
+    def level_price(self, absolute_index: int) -> float:
+        """Price of a level counted from the original (offset 0) bottom."""
+        return self._bottom * (self.ratio ** absolute_index)
+
+    def shift(self, k: int):
+        """Slides the window by k levels. O(min(|k|, N)) work."""
+        size = len(self._buf)
+        if abs(k) >= size:
+            self._buf = [self.level_price(self.offset + k + i) for i in range(size)]
+            self._head = 0
+        elif k > 0:
+            for j in range(k):
+                # The slot leaving at the bottom is reused for the new top level
+                self._buf[self._head] = self.level_price(self.offset + size + j)
+                self._head = (self._head + 1) % size
+        elif k < 0:
+            for j in range(-k):
+                self._head = (self._head - 1) % size
+                self._buf[self._head] = self.level_price(self.offset - 1 - j)
+        self.offset += k
@@ -0,0 +1,101 @@
+import os
+import time
+import signal
+import cProfile
+import pstats
+import logging
+import tracemalloc
+from typing import Optional, Callable
+
+logger = logging.getLogger(__name__)
+
+class TickProfiler:
+    """
+    Opt-in profiler for the bot loop.
+    Wraps an orchestrator's execute_tick with cProfile for the first N ticks and tracks
+    allocation growth with tracemalloc until detach(). Nothing is installed unless
+    attach() is called, so a bot without a profiler runs the untouched code path.
+    """
+
+    def __init__(self, output_dir: str, profile_ticks: int = 100, top_allocations: int = 25):
+        self.output_dir = output_dir
+        self.profile_ticks = profile_ticks
+        self.top_allocations = top_allocations
+
+        self.ticks_profiled = 0
+        self.ticks_total = 0
+        self._profiler = cProfile.Profile()
+        self._baseline: Optional[tracemalloc.Snapshot] = None
+        self._original_tick: Optional[Callable[[], None]] = None
+        self._bot = None
+        # Only tracing this profiler started is stopped by detach()
+        self._started_tracing = False
+
+    def attach(self, bot):
+        """Replaces bot.execute_tick with a profiled wrapper and starts allocation tracing."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        self._baseline = tracemalloc.take_snapshot()
+
+        self._bot = bot
+        self._original_tick = bot.execute_tick
+        bot.execute_tick = self._profiled_tick
+        logger.info(f"Profiling enabled: first {self.profile_ticks} ticks, reports in {self.output_dir}")
+
+    def detach(self):
+        """Restores the bot's own execute_tick and stops the allocation tracing attach() started."""
+        if self._bot is not None:
+            self._bot.execute_tick = self._original_tick
+            self._bot = None
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        self._baseline = None
+
+    def _profiled_tick(self):
+        self.ticks_total += 1
+        if self.ticks_profiled >= self.profile_ticks:
+            return self._original_tick()
+
+        self.ticks_profiled += 1
+        self._profiler.enable()
+        try:
+            return self._original_tick()
+        finally:
+            self._profiler.disable()
+
+    def install_signal_handler(self, signum: Optional[int] = None):
+        """Dumps reports on signal (SIGUSR1 by default, where the platform has it)."""
+        if signum is None:
+            signum = getattr(signal, "SIGUSR1", None)
+            if signum is None:
+                logger.warning("SIGUSR1 unavailable on this platform. Reports dump on exit only.")
+                return
+        signal.signal(signum, lambda *_: self.dump(reason="signal"))
+
+    def dump(self, reason: str = "exit") -> str:
+        """Writes pstats and top allocation growth reports. Returns the report directory."""
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        report_dir = os.path.join(self.output_dir, f"{stamp}-{reason}")
+        os.makedirs(report_dir, exist_ok=True)
+
+        if self.ticks_profiled:
+            self._profiler.dump_stats(os.path.join(report_dir, "ticks.pstats"))
+            with open(os.path.join(report_dir, "ticks.txt"), "w", encoding="utf-8") as f:
+                f.write(f"Profiled ticks: {self.ticks_profiled} of {self.ticks_total}\n\n")
+                stats = pstats.Stats(self._profiler, stream=f)
+                stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(40)
+
+        if tracemalloc.is_tracing() and self._baseline is not None:
+            snapshot = tracemalloc.take_snapshot()
+            growth = snapshot.compare_to(self._baseline, "lineno")
+            current, peak = tracemalloc.get_traced_memory()
+            with open(os.path.join(report_dir, "allocations.txt"), "w", encoding="utf-8") as f:
+                f.write(f"Traced memory: current={current / 1024:.1f} KiB peak={peak / 1024:.1f} KiB\n")
+                f.write(f"Top {self.top_allocations} allocation changes since attach:\n\n")
+                for stat in growth[:self.top_allocations]:
+                    f.write(f"{stat}\n")
+
+        logger.info(f"Profiling reports written to {report_dir}")
+        return report_dir
@@ -1,17 +1,72 @@
 from abc import ABC, abstractmethod
-from typing import Dict
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
+# Quote assets recognized when splitting a symbol, longest first (FDUSD before USD-style suffixes)
+QUOTE_ASSETS = ("FDUSD", "USDT", "USDC", "BUSD", "TUSD", "BTC", "ETH", "BNB", "EUR", "TRY")
+
+def split_symbol(symbol: str) -> Tuple[str, str]:
+    """
+    Guesses (base, quote) from a spot symbol name, e.g. BTCUSDT -> (BTC, USDT).
+    Only knows QUOTE_ASSETS: prefer symbol_assets, which uses the exchange's own answer.
+    """
+    for quote in QUOTE_ASSETS:
+        if symbol.endswith(quote) and len(symbol) > len(quote):
+            return symbol[:-len(quote)], quote
+    raise ValueError(f"Cannot split symbol {symbol} into base and quote assets.")
+
 @dataclass
 class SymbolRules:
     tick_size: float
     step_size: float
     min_notional: float
     min_qty: float
+    # From exchangeInfo; empty when the exchange did not report them (mocks)
+    base_asset: str = ""
+    quote_asset: str = ""
+
+def symbol_assets(symbol: str, rules: SymbolRules) -> Tuple[str, str]:
+    """(base, quote) of symbol: the assets its rules carry, else guessed from the name."""
+    if rules.base_asset and rules.quote_asset:
+        return rules.base_asset, rules.quote_asset
+    return split_symbol(symbol)
+
+@dataclass
+class OpenOrder:
+    order_id: str
+    side: str
+    price: float
+    qty: float
+
+@dataclass
+class Trade:
+    order_id: str
+    side: str
+    price: float
+    qty: float
+    time_ms: int
+
+@dataclass
+class Kline:
+    open_time_ms: int
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
 
 class ExchangeError(Exception):
     """Base exception for all exchange-related errors."""
-    pass
+    def __init__(self, message: str = "", code: Optional[int] = None):
+        super().__init__(message)
+        # Exchange-specific error code when available (e.g. Binance -1021)
+        self.code = code
+
+class OrderStatusUnknown(ExchangeError):
+    """
+    An order request got no definite answer (timeout, server error): the exchange may or
+    may not have accepted it. Resolve it by client order id before placing again.
+    """
 
 class ExchangeInterface(ABC):
     """
@@ -28,14 +83,39 @@ class ExchangeInterface(ABC):
         """Fetch trading rules like tick size, step size, and minimums."""
         pass
         
+    def get_price_range(self, symbol: str, since_ms: int) -> Optional[Tuple[float, float]]:
+        """
+        Lowest and highest traded price since since_ms (epoch milliseconds), or None
+        when the exchange cannot tell. Lets callers skip status lookups for orders
+        the price never reached.
+        """
+        return None
+
+    def get_klines(self, symbol: str, interval: str, start_ms: int, end_ms: int, limit: int) -> List[Kline]:
+        """
+        Up to limit candles of the given interval (e.g. '1m', '1h') opening in
+        [start_ms, end_ms), oldest first. Exchanges without candle history raise.
+        """
+        raise ExchangeError(f"{type(self).__name__} does not serve klines.")
+        
     @abstractmethod
-    def place_limit_order(self, symbol: str, side: str, price: float, qty: float) -> str:
+    def place_limit_order(
+        self, symbol: str, side: str, price: float, qty: float, client_order_id: Optional[str] = None
+    ) -> str:
         """
         Place a limit order.
         side is typically 'BUY' or 'SELL'.
-        Returns the exchange order_id as a string.
+        client_order_id, when given, makes the placement idempotent: an order already
+        accepted under that id is returned instead of placing a second one.
+        Returns the exchange order_id as a string. Raises OrderStatusUnknown when it
+        cannot tell whether the order was accepted.
         """
         pass
+
+    @abstractmethod
+    def find_order(self, symbol: str, client_order_id: str) -> Optional[str]:
+        """Exchange order_id of the order placed under client_order_id, or None if there is none."""
+        pass
         
     @abstractmethod
     def get_order_status(self, symbol: str, order_id: str) -> str:
@@ -50,6 +130,28 @@ class ExchangeInterface(ABC):
         """Optional: cancel a specific order."""
         pass
 
+    @abstractmethod
+    def cancel_replace_order(
+        self, symbol: str, order_id: str, side: str, price: float, qty: float, client_order_id: Optional[str] = None
+    ) -> str:
+        """
+        Atomically cancel order_id and place a new limit order (under client_order_id,
+        when given) in a single request.
+        Returns the new exchange order_id. Raises ExchangeError if either leg fails;
+        the caller should then resolve the old order's status before acting again.
+        """
+        pass
+
+    @abstractmethod
+    def get_open_orders(self, symbol: str) -> List[OpenOrder]:
+        """All orders currently resting on the book for the symbol."""
+        pass
+
+    @abstractmethod
+    def get_recent_trades(self, symbol: str, since_ms: int) -> List[Trade]:
+        """The account's own executions for the symbol since since_ms (epoch milliseconds)."""
+        pass
+
     @abstractmethod
     def get_balances(self) -> Dict[str, float]:
         """Optional: fetch asset balances for real mode."""
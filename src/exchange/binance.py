@@ -1,89 +1,377 @@
+import re
 import time
-import hmac
 import hashlib
 import logging
-from typing import Dict, Any
-import requests
+import threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Dict, Any, List, Optional, Tuple
+from urllib.parse import quote_plus
 
-from src.exchange.base import ExchangeInterface, SymbolRules, ExchangeError
+from src.exchange.base import (
+    ExchangeInterface, SymbolRules, ExchangeError, OrderStatusUnknown, OpenOrder, Trade, Kline
+)
+from src.exchange.endpoints import EndpointPool, BINANCE_ENDPOINTS
 
 logger = logging.getLogger(__name__)
 
+# Binance: "Timestamp for this request is outside of the recvWindow."
+TIMESTAMP_OUTSIDE_RECV_WINDOW = -1021
+
+# Binance: "Timeout waiting for response from backend server. Send status unknown;
+# execution status unknown." and "An unexpected response was received from the message bus.
+# Execution status unknown."
+EXECUTION_STATUS_UNKNOWN = (-1007, -1006)
+# Binance: "Order does not exist." (query by id or client id)
+ORDER_DOES_NOT_EXIST = -2013
+# Binance rejects a new order whose client id matches an open order with -2010
+DUPLICATE_ORDER_MSG = "Duplicate order sent"
+
+# Order placements that end without a definite answer are resolved and retried this often
+ORDER_PLACEMENT_ATTEMPTS = 3
+
+# Max klines per request; a full page means the range may extend past it
+KLINES_LIMIT = 1000
+
+# Reads cheap enough to hedge (request weight 2-4). A hedge is a second request the
+# shared rate budget never sees, so heavy reads (account, myTrades, openOrders) only fail over.
+HEDGED_ENDPOINTS = frozenset({"/api/v3/ticker/price", "/api/v3/order", "/api/v3/klines"})
+
+# myTrades accepts at most a 24h startTime..endTime window
+MY_TRADES_MAX_WINDOW_MS = 24 * 60 * 60 * 1000
+MY_TRADES_LIMIT = 1000
+
+# Characters urlencode leaves untouched (plus the separators build_query_string adds)
+_QUERY_UNSAFE = re.compile(r"[^A-Za-z0-9_.\-=&]")
+
+def build_query_string(params: Dict[str, Any]) -> str:
+    """
+    Encodes params in insertion order, byte-identical to urlencode / requests.
+    Values are joined as-is and the whole query is scanned once: only if some value
+    holds a character urlencode would escape (an extra '=' or '&' shows in the counts)
+    is it re-encoded with quote_plus.
+    """
+    if not params:
+        return ""
+    query = "&".join([f"{k}={v}" for k, v in params.items()])
+    if query.count("=") == len(params) and query.count("&") == len(params) - 1 and not _QUERY_UNSAFE.search(query):
+        return query
+    return "&".join(f"{k}={quote_plus(str(v))}" for k, v in params.items())
+
+def _hmac_sha256_pads(secret: bytes) -> Tuple[Any, Any]:
+    """
+    SHA-256 states with the HMAC inner and outer key pads already absorbed (RFC 2104).
+    Signing then costs two state copies, instead of re-keying or copying an hmac object.
+    """
+    block = hashlib.sha256().block_size
+    if len(secret) > block:
+        secret = hashlib.sha256(secret).digest()
+    secret = secret.ljust(block, b"\0")
+    inner = hashlib.sha256(bytes(b ^ 0x36 for b in secret))
+    outer = hashlib.sha256(bytes(b ^ 0x5C for b in secret))
+    return inner, outer
+
+class _EndpointUnavailable(ExchangeError):
+    """The request got no answer from one endpoint; another endpoint may serve it."""
+
+class _ServerError(ExchangeError):
+    """HTTP 5xx: the request reached Binance but its execution status is unknown."""
+
+def _execution_unknown(error: ExchangeError) -> bool:
+    return isinstance(error, (_EndpointUnavailable, _ServerError)) or error.code in EXECUTION_STATUS_UNKNOWN
+
 class BinanceSpotAdapter(ExchangeInterface):
     """
     Minimal adapter for Binance Spot API (V3).
+    Requests go to the healthiest of several equivalent endpoints. Reads (GET) fail over
+    to the next endpoint on network and 5xx errors, and cheap reads (HEDGED_ENDPOINTS) are
+    hedged: if the first endpoint has not answered within the pool's p95 latency, the
+    same request is sent to a second one and the first answer wins. Writes are never blindly re-sent: an order placement without a
+    definite answer is looked up by its client order id first and only retried (under
+    the same id) if Binance has no such order, so order_timeout_s can be short.
     """
     
-    def __init__(self, api_key: str = "", api_secret: str = "", testnet: bool = False):
+    def __init__(
+        self,
+        api_key: str = "",
+        api_secret: str = "",
+        testnet: bool = False,
+        base_url: Optional[str] = None,
+        recv_window_ms: int = 5000,
+        time_sync_interval_s: float = 300.0,
+        hedge_reads: bool = True,
+        timeout_s: float = 10.0,
+        order_timeout_s: float = 3.0
+    ):
         self.api_key = api_key
         self.api_secret = api_secret
         self.testnet = testnet
         
-        if testnet:
-            self.base_url = "https://testnet.binance.vision"
+        # base_url may list several equivalent endpoints, comma-separated
+        if base_url:
+            urls = [u.strip() for u in base_url.split(",") if u.strip()]
+        elif testnet:
+            urls = ["https://testnet.binance.vision"]
         else:
-            self.base_url = "https://api.binance.com"
+            urls = BINANCE_ENDPOINTS
+        self.endpoints = EndpointPool(urls)
+        self.base_url = self.endpoints.urls[0]
+        self.hedge_reads = hedge_reads
+        self.timeout_s = timeout_s
+        self.order_timeout_s = order_timeout_s
+        # Created up front: the adapter is shared by concurrent callers (startup reconciliation)
+        self._executor = (
+            ThreadPoolExecutor(max_workers=2 * len(urls), thread_name_prefix="binance-hedge")
+            if len(urls) > 1 else None
+        )
             
         self._rules_cache: Dict[str, SymbolRules] = {}
         
+        # Signing: keep the keyed HMAC pads and the fixed recvWindow field pre-encoded
+        self._hmac_pads = _hmac_sha256_pads(api_secret.encode('utf-8')) if api_secret else None
+        self.recv_window_ms = recv_window_ms
+        self._recv_window_field = f"recvWindow={recv_window_ms}"
+        
+        # Server clock offset (server - local), refreshed from /api/v3/time
+        self.time_sync_interval_s = time_sync_interval_s
+        self._time_offset_ms = 0
+        self._last_time_sync: Optional[float] = None
+        self._time_sync_stop = threading.Event()
+        self._time_sync_thread: Optional[threading.Thread] = None
+        
     def _get_timestamp(self) -> int:
-        return int(time.time() * 1000)
+        return int(time.time() * 1000) + self._time_offset_ms
         
     def _sign(self, query_string: str) -> str:
-        return hmac.new(
-            self.api_secret.encode('utf-8'),
-            query_string.encode('utf-8'),
-            hashlib.sha256
-        ).hexdigest()
+        inner_pad, outer_pad = self._hmac_pads
+        inner = inner_pad.copy()
+        inner.update(query_string.encode('utf-8'))
+        outer = outer_pad.copy()
+        outer.update(inner.digest())
+        return outer.hexdigest()
+
+    def _signed_params(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Returns a copy of params with recvWindow, timestamp and signature appended.
+        The signature covers the exact query string requests will send (insertion order);
+        the appended fields are encoded here rather than scanned.
+        """
+        timestamp = self._get_timestamp()
+        query = build_query_string(params)
+        fixed = f"{self._recv_window_field}&timestamp={timestamp}"
+        signed = dict(params)
+        signed['recvWindow'] = self.recv_window_ms
+        signed['timestamp'] = timestamp
+        signed['signature'] = self._sign(f"{query}&{fixed}" if query else fixed)
+        return signed
+
+    def sync_time(self) -> int:
+        """Measures the server clock offset via /api/v3/time and returns it in ms."""
+        t0 = time.time()
+        res = self._send("GET", "/api/v3/time", {}, {})
+        t1 = time.time()
+        # Assume the server stamped the response halfway through the round trip
+        local_mid_ms = int((t0 + t1) * 500)
+        self._time_offset_ms = int(res["serverTime"]) - local_mid_ms
+        self._last_time_sync = t1
+        logger.debug(f"Server time offset: {self._time_offset_ms} ms (rtt {(t1 - t0) * 1000:.1f} ms)")
+        return self._time_offset_ms
+
+    def start_time_sync(self):
+        """Starts a daemon thread that refreshes the server time offset periodically."""
+        if self._time_sync_thread and self._time_sync_thread.is_alive():
+            return
+        self._time_sync_stop.clear()
+        self._time_sync_thread = threading.Thread(
+            target=self._time_sync_worker, name="binance-time-sync", daemon=True
+        )
+        self._time_sync_thread.start()
+
+    def stop_time_sync(self):
+        self._time_sync_stop.set()
+        if self._time_sync_thread:
+            self._time_sync_thread.join(timeout=5)
+            self._time_sync_thread = None
 
-    def _request(self, method: str, endpoint: str, params: Dict[str, Any] = None, signed: bool = False) -> Dict[str, Any]:
+    def _time_sync_worker(self):
+        while True:
+            try:
+                self.sync_time()
+            except ExchangeError as e:
+                logger.warning(f"Server time sync failed: {e}")
+            if self._time_sync_stop.wait(self.time_sync_interval_s):
+                return
+
+    def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Dict[str, Any] = None,
+        signed: bool = False,
+        timeout_s: Optional[float] = None
+    ) -> Dict[str, Any]:
         params = params or {}
-        
-        if signed:
-            if not self.api_key or not self.api_secret:
-                raise ExchangeError("API keys required for signed requests.")
-            params['timestamp'] = self._get_timestamp()
-            # Sort params and build query string
-            query_string = "&".join([f"{k}={params[k]}" for k in sorted(params.keys())])
-            signature = self._sign(query_string)
-            params['signature'] = signature
             
         headers = {}
         if self.api_key:
             headers['X-MBX-APIKEY'] = self.api_key
             
-        url = self.base_url + endpoint
+        if not signed:
+            return self._send(method, endpoint, params, headers, timeout_s)
+            
+        if not self.api_key or not self.api_secret:
+            raise ExchangeError("API keys required for signed requests.")
+            
+        try:
+            return self._send(method, endpoint, self._signed_params(params), headers, timeout_s)
+        except ExchangeError as e:
+            if e.code != TIMESTAMP_OUTSIDE_RECV_WINDOW:
+                raise
+            # Clock drifted past recvWindow: resync once and retry with a fresh timestamp
+            logger.warning("Request timestamp rejected by Binance. Resyncing server time and retrying.")
+            self.sync_time()
+            return self._send(method, endpoint, self._signed_params(params), headers, timeout_s)
+
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        params: Dict[str, Any],
+        headers: Dict[str, str],
+        timeout_s: Optional[float] = None
+    ) -> Dict[str, Any]:
+        urls = self.endpoints.ranked()
+        if method != "GET":
+            return self._send_to(urls[0], method, endpoint, params, headers, timeout_s)
+        if self.hedge_reads and self._executor and endpoint in HEDGED_ENDPOINTS:
+            return self._send_hedged(urls, endpoint, params, headers, timeout_s)
+        
+        # Reads are idempotent: no answer or a server error from one endpoint, try the next
+        error: Optional[ExchangeError] = None
+        for url in urls:
+            try:
+                return self._send_to(url, method, endpoint, params, headers, timeout_s)
+            except (_EndpointUnavailable, _ServerError) as e:
+                error = e
+        raise error
+
+    def _send_hedged(
+        self,
+        urls: List[str],
+        endpoint: str,
+        params: Dict[str, Any],
+        headers: Dict[str, str],
+        timeout_s: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """GET with failover plus one hedge request once the p95 delay has passed."""
+        candidates = iter(urls)
+        pending = {}
+        
+        def launch() -> bool:
+            url = next(candidates, None)
+            if url is None:
+                return False
+            pending[self._executor.submit(self._send_to, url, "GET", endpoint, params, headers, timeout_s)] = url
+            return True
+        
+        launch()
+        hedged = False
+        hedge_at = time.monotonic() + self.endpoints.hedge_delay()
+        error: Optional[ExchangeError] = None
+        while pending:
+            timeout = None if hedged else max(0.0, hedge_at - time.monotonic())
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                hedged = True
+                if launch():
+                    logger.debug(f"Hedging GET {endpoint} after {timeout:.3f}s")
+                continue
+            for future in done:
+                del pending[future]
+                try:
+                    # Slower duplicates keep running and still feed the health stats
+                    return future.result()
+                except (_EndpointUnavailable, _ServerError) as e:
+                    error = e
+                    launch()
+        raise error
+
+    def _send_to(
+        self,
+        base_url: str,
+        method: str,
+        endpoint: str,
+        params: Dict[str, Any],
+        headers: Dict[str, str],
+        timeout_s: Optional[float] = None
+    ) -> Dict[str, Any]:
+        # Imported on first request, not with the module: requests alone is ~100 ms of cold start
+        import requests
+        url = base_url + endpoint
+        timeout = timeout_s or self.timeout_s
+        started = time.monotonic()
         
         try:
             if method == "GET":
-                response = requests.get(url, params=params, headers=headers, timeout=10)
+                response = requests.get(url, params=params, headers=headers, timeout=timeout)
             elif method == "POST":
                 # For POST, Binance typically expects query params for data, OR application/x-www-form-urlencoded
                 # The requests 'params' sends them as query limits which works for V3
-                response = requests.post(url, params=params, headers=headers, timeout=10)
+                response = requests.post(url, params=params, headers=headers, timeout=timeout)
             elif method == "DELETE":
-                response = requests.delete(url, params=params, headers=headers, timeout=10)
+                response = requests.delete(url, params=params, headers=headers, timeout=timeout)
             else:
                 raise ExchangeError(f"Unsupported method {method}")
                 
             data = response.json()
             
+            if response.status_code >= 500:
+                self.endpoints.record_failure(base_url)
+            else:
+                self.endpoints.record_success(base_url, time.monotonic() - started)
             if response.status_code != 200:
                 msg = data.get("msg", "Unknown error")
                 code = data.get("code", response.status_code)
                 logger.error(f"Binance API Error [{code}]: {msg}")
-                raise ExchangeError(f"Binance API Error: {msg} (Code: {code})")
+                error_type = _ServerError if response.status_code >= 500 else ExchangeError
+                raise error_type(f"Binance API Error: {msg} (Code: {code})", code=code)
                 
             return data
             
         except requests.RequestException as e:
-            logger.error(f"Request failed: {e}")
-            raise ExchangeError(f"Network error communicating with Binance: {e}")
+            self.endpoints.record_failure(base_url)
+            logger.error(f"Request to {base_url} failed: {e}")
+            raise _EndpointUnavailable(f"Network error communicating with Binance: {e}")
 
     def get_price(self, symbol: str) -> float:
         res = self._request("GET", "/api/v3/ticker/price", params={"symbol": symbol})
         return float(res["price"])
 
+    def get_price_range(self, symbol: str, since_ms: int) -> Optional[Tuple[float, float]]:
+        # 1m klines from the minute containing since_ms; one unsigned request (weight 2)
+        klines = self.get_klines(symbol, "1m", since_ms - since_ms % 60_000, None, KLINES_LIMIT)
+        if not klines or len(klines) >= KLINES_LIMIT:
+            # Nothing returned, or the window may be truncated: cannot vouch for the range
+            return None
+        return min(k.low for k in klines), max(k.high for k in klines)
+
+    def get_klines(
+        self, symbol: str, interval: str, start_ms: int, end_ms: Optional[int], limit: int = KLINES_LIMIT
+    ) -> List[Kline]:
+        params: Dict[str, Any] = {
+            "symbol": symbol,
+            "interval": interval,
+            "startTime": start_ms,
+            "limit": min(limit, KLINES_LIMIT)
+        }
+        if end_ms is not None:
+            # endTime is inclusive on Binance
+            params["endTime"] = end_ms - 1
+        res = self._request("GET", "/api/v3/klines", params=params)
+        return [
+            Kline(int(k[0]), float(k[1]), float(k[2]), float(k[3]), float(k[4]), float(k[5]))
+            for k in res
+        ]
+
     def get_symbol_rules(self, symbol: str) -> SymbolRules:
         if symbol in self._rules_cache:
             return self._rules_cache[symbol]
@@ -115,13 +403,21 @@ class BinanceSpotAdapter(ExchangeInterface):
             tick_size=tick_size,
             step_size=step_size,
             min_notional=min_notional,
-            min_qty=min_qty
+            min_qty=min_qty,
+            base_asset=symbol_data.get("baseAsset", ""),
+            quote_asset=symbol_data.get("quoteAsset", "")
         )
         self._rules_cache[symbol] = rules
         return rules
 
-    def place_limit_order(self, symbol: str, side: str, price: float, qty: float) -> str:
-        """Places a single limit order."""
+    def place_limit_order(
+        self, symbol: str, side: str, price: float, qty: float, client_order_id: Optional[str] = None
+    ) -> str:
+        """
+        Places a single limit order. With a client_order_id, an attempt that ends without
+        a definite answer is resolved by looking the id up, and retried only if Binance
+        has no order under it; OrderStatusUnknown is raised once the attempts run out.
+        """
         params = {
             "symbol": symbol,
             "side": side.upper(),
@@ -130,7 +426,46 @@ class BinanceSpotAdapter(ExchangeInterface):
             "quantity": f"{qty:.8f}", # Will be stripped to step_size later, simple pass here
             "price": f"{price:.8f}"
         }
-        res = self._request("POST", "/api/v3/order", params=params, signed=True)
+        if client_order_id is None:
+            res = self._request("POST", "/api/v3/order", params=params, signed=True, timeout_s=self.order_timeout_s)
+            return str(res["orderId"])
+        
+        params["newClientOrderId"] = client_order_id
+        error: Optional[ExchangeError] = None
+        for attempt in range(ORDER_PLACEMENT_ATTEMPTS):
+            try:
+                res = self._request(
+                    "POST", "/api/v3/order", params=params, signed=True, timeout_s=self.order_timeout_s
+                )
+                return str(res["orderId"])
+            except ExchangeError as e:
+                if not (_execution_unknown(e) or DUPLICATE_ORDER_MSG in str(e)):
+                    raise
+                error = e
+            logger.warning(f"Placement of {client_order_id} has no definite answer ({error}); looking it up")
+            try:
+                order_id = self.find_order(symbol, client_order_id)
+            except ExchangeError as e:
+                logger.warning(f"Lookup of {client_order_id} failed: {e}")
+                continue
+            if order_id is not None:
+                return order_id
+        raise OrderStatusUnknown(
+            f"Order {client_order_id} unresolved after {ORDER_PLACEMENT_ATTEMPTS} attempts: {error}",
+            code=error.code
+        )
+
+    def find_order(self, symbol: str, client_order_id: str) -> Optional[str]:
+        params = {
+            "symbol": symbol,
+            "origClientOrderId": client_order_id
+        }
+        try:
+            res = self._request("GET", "/api/v3/order", params=params, signed=True)
+        except ExchangeError as e:
+            if e.code == ORDER_DOES_NOT_EXIST:
+                return None
+            raise
         return str(res["orderId"])
 
     def get_order_status(self, symbol: str, order_id: str) -> str:
@@ -166,6 +501,58 @@ class BinanceSpotAdapter(ExchangeInterface):
             logger.warning(f"Failed to cancel order {order_id}: {e}")
             return False
 
+    def cancel_replace_order(
+        self, symbol: str, order_id: str, side: str, price: float, qty: float, client_order_id: Optional[str] = None
+    ) -> str:
+        """
+        Moves a resting order with one signed cancelReplace call instead of cancel + place.
+        Without a definite answer, the new order is looked up by client_order_id; if it is
+        not there the call fails and the caller resolves the old order as usual.
+        """
+        params = {
+            "symbol": symbol,
+            "side": side.upper(),
+            "type": "LIMIT",
+            "cancelReplaceMode": "STOP_ON_FAILURE",
+            "cancelOrderId": order_id,
+            "timeInForce": "GTC",
+            "quantity": f"{qty:.8f}",
+            "price": f"{price:.8f}"
+        }
+        if client_order_id is not None:
+            params["newClientOrderId"] = client_order_id
+        try:
+            res = self._request(
+                "POST", "/api/v3/order/cancelReplace", params=params, signed=True, timeout_s=self.order_timeout_s
+            )
+        except ExchangeError as e:
+            if client_order_id is None or not _execution_unknown(e):
+                raise
+            new_id = self.find_order(symbol, client_order_id)
+            if new_id is None:
+                raise
+            return new_id
+        return str(res["newOrderResponse"]["orderId"])
+
+    def get_open_orders(self, symbol: str) -> List[OpenOrder]:
+        res = self._request("GET", "/api/v3/openOrders", params={"symbol": symbol}, signed=True)
+        return [
+            OpenOrder(str(o["orderId"]), o["side"], float(o["price"]), float(o["origQty"]))
+            for o in res
+        ]
+
+    def get_recent_trades(self, symbol: str, since_ms: int) -> List[Trade]:
+        params: Dict[str, Any] = {"symbol": symbol, "limit": MY_TRADES_LIMIT}
+        if self._get_timestamp() - since_ms < MY_TRADES_MAX_WINDOW_MS:
+            params["startTime"] = since_ms
+        res = self._request("GET", "/api/v3/myTrades", params=params, signed=True)
+        # Without startTime the latest trades come back; keep only the requested window
+        return [
+            Trade(str(t["orderId"]), "BUY" if t["isBuyer"] else "SELL",
+                  float(t["price"]), float(t["qty"]), int(t["time"]))
+            for t in res if int(t["time"]) >= since_ms
+        ]
+
     def get_balances(self) -> Dict[str, float]:
         res = self._request("GET", "/api/v3/account", signed=True)
         balances = {}
@@ -0,0 +1,200 @@
+import json
+import time
+import logging
+import itertools
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+from typing import Any, Dict, Optional, Tuple
+
+from src.exchange.base import ExchangeError
+from src.exchange.binance import (
+    BinanceSpotAdapter, build_query_string, _EndpointUnavailable, _ServerError, TIMESTAMP_OUTSIDE_RECV_WINDOW
+)
+from src.exchange.websocket import WebSocketConnection, WebSocketClosed
+
+logger = logging.getLogger(__name__)
+
+WS_API_URL = "wss://ws-api.binance.com:443/ws-api/v3"
+WS_API_TESTNET_URL = "wss://ws-api.testnet.binance.vision/ws-api/v3"
+
+# REST order calls and their WebSocket API methods (same parameters and result bodies)
+WS_METHODS = {
+    ("POST", "/api/v3/order"): "order.place",
+    ("DELETE", "/api/v3/order"): "order.cancel",
+    ("GET", "/api/v3/order"): "order.status",
+    ("POST", "/api/v3/order/cancelReplace"): "order.cancelReplace",
+}
+
+# Sent as JSON numbers; everything else keeps the REST string formatting
+_INT_PARAMS = ("orderId", "cancelOrderId")
+
+class _NotSent(ExchangeError):
+    """The request never left this process: it is safe to send it another way."""
+
+class WebSocketApiSession:
+    """
+    One persistent connection to a JSON request/response WebSocket API, shared by all
+    callers. Requests are multiplexed by id: any number may be in flight and answers
+    are matched to their caller as they arrive, in any order. A reader thread owns the
+    receiving side. When the connection drops, in-flight requests fail as unanswered
+    and the next request reconnects, at most once per reconnect_backoff_s.
+    """
+
+    def __init__(self, url: str, connect_timeout_s: float = 5.0, reconnect_backoff_s: float = 1.0):
+        self.url = url
+        self.connect_timeout_s = connect_timeout_s
+        self.reconnect_backoff_s = reconnect_backoff_s
+        self.connects = 0
+        self._conn: Optional[WebSocketConnection] = None
+        # request id -> (answer, connection it was sent on)
+        self._pending: Dict[str, Tuple[Future, WebSocketConnection]] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._next_connect = 0.0
+
+    @property
+    def connected(self) -> bool:
+        conn = self._conn
+        return conn is not None and not conn.closed
+
+    def _connection(self) -> WebSocketConnection:
+        with self._lock:
+            if self.connected:
+                return self._conn
+            now = time.monotonic()
+            if now < self._next_connect:
+                raise _NotSent("WebSocket API reconnect backing off")
+            self._next_connect = now + self.reconnect_backoff_s
+            try:
+                conn = WebSocketConnection.connect(self.url, self.connect_timeout_s)
+            except (OSError, ValueError) as e:
+                raise _NotSent(f"WebSocket API connect failed: {e}")
+            self._conn = conn
+            self.connects += 1
+        threading.Thread(target=self._read_loop, args=(conn,), name="ws-api-reader", daemon=True).start()
+        logger.info(f"WebSocket API connected to {self.url} (connection #{self.connects})")
+        return conn
+
+    def _read_loop(self, conn: WebSocketConnection):
+        try:
+            while True:
+                message = json.loads(conn.recv())
+                pending = self._pending.pop(str(message.get("id")), None)
+                if pending is not None:
+                    pending[0].set_result(message)
+        except (WebSocketClosed, ValueError) as e:
+            if self._conn is conn:
+                logger.warning(f"WebSocket API connection lost: {e}")
+        finally:
+            conn.close()
+            with self._lock:
+                if self._conn is conn:
+                    self._conn = None
+                # Every request still waiting on this connection has lost its answer
+                for request_id, (future, sent_on) in list(self._pending.items()):
+                    if sent_on is conn:
+                        self._pending.pop(request_id, None)
+                        future.set_exception(_EndpointUnavailable("WebSocket API connection lost before the answer"))
+
+    def request(self, method: str, params: Dict[str, Any], timeout_s: float) -> Dict[str, Any]:
+        """
+        Sends one request and returns the raw response message. Raises _NotSent if the
+        request could not be written, _EndpointUnavailable if it was but got no answer.
+        """
+        conn = self._connection()
+        request_id = str(next(self._ids))
+        future: Future = Future()
+        self._pending[request_id] = (future, conn)
+        try:
+            conn.send_text(json.dumps({"id": request_id, "method": method, "params": params}))
+        except WebSocketClosed as e:
+            self._pending.pop(request_id, None)
+            raise _NotSent(f"WebSocket API send failed: {e}")
+        try:
+            return future.result(timeout_s)
+        except FutureTimeout:
+            self._pending.pop(request_id, None)
+            raise _EndpointUnavailable(f"No WebSocket API answer to {method} within {timeout_s}s")
+
+    def close(self):
+        with self._lock:
+            conn, self._conn = self._conn, None
+        if conn:
+            conn.close()
+
+class BinanceWebSocketAdapter(BinanceSpotAdapter):
+    """
+    BinanceSpotAdapter whose order calls (place, cancel, status, cancel-replace) go over
+    one persistent WebSocket API connection instead of one HTTPS request each, which
+    saves the per-call connection setup. Market data and account reads stay on REST.
+
+    Each request is signed like its REST twin (HMAC over the alphabetically sorted
+    parameters, apiKey included), so no session logon is needed. Placement ambiguity is
+    handled exactly as on REST: an unanswered or 5xx order is looked up by client id
+    before any retry. A request that could not be written to the socket (connection down,
+    reconnect backing off) is sent over REST instead.
+    """
+
+    def __init__(
+        self,
+        *args,
+        ws_url: Optional[str] = None,
+        ws_reconnect_backoff_s: float = 1.0,
+        **kwargs
+    ):
+        super().__init__(*args, **kwargs)
+        self.ws_url = ws_url or (WS_API_TESTNET_URL if self.testnet else WS_API_URL)
+        self.session = WebSocketApiSession(
+            self.ws_url, connect_timeout_s=self.order_timeout_s, reconnect_backoff_s=ws_reconnect_backoff_s
+        )
+        self.ws_requests = 0
+        self.rest_fallbacks = 0
+
+    def _ws_params(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        signed = {k: int(v) if k in _INT_PARAMS else v for k, v in params.items()}
+        signed["apiKey"] = self.api_key
+        signed["recvWindow"] = self.recv_window_ms
+        signed["timestamp"] = self._get_timestamp()
+        signed["signature"] = self._sign(build_query_string(dict(sorted(signed.items()))))
+        return signed
+
+    def _ws_request(self, method: str, params: Dict[str, Any], timeout_s: Optional[float]) -> Any:
+        message = self.session.request(method, self._ws_params(params), timeout_s or self.timeout_s)
+        self.ws_requests += 1
+        status = message.get("status", 500)
+        if status == 200:
+            return message["result"]
+        error = message.get("error", {})
+        msg, code = error.get("msg", "Unknown error"), error.get("code", status)
+        logger.error(f"Binance WebSocket API Error [{code}]: {msg}")
+        error_type = _ServerError if status >= 500 else ExchangeError
+        raise error_type(f"Binance API Error: {msg} (Code: {code})", code=code)
+
+    def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Dict[str, Any] = None,
+        signed: bool = False,
+        timeout_s: Optional[float] = None
+    ) -> Dict[str, Any]:
+        ws_method = WS_METHODS.get((method, endpoint))
+        if ws_method is None or not signed or not self.api_key or not self.api_secret:
+            return super()._request(method, endpoint, params, signed, timeout_s)
+        params = params or {}
+        try:
+            try:
+                return self._ws_request(ws_method, params, timeout_s)
+            except ExchangeError as e:
+                if e.code != TIMESTAMP_OUTSIDE_RECV_WINDOW:
+                    raise
+                logger.warning("Request timestamp rejected by Binance. Resyncing server time and retrying.")
+                self.sync_time()
+                return self._ws_request(ws_method, params, timeout_s)
+        except _NotSent as e:
+            self.rest_fallbacks += 1
+            logger.debug("Sending %s over REST: %s", ws_method, e)
+            return super()._request(method, endpoint, params, signed, timeout_s)
+
+    def close(self):
+        self.session.close()
@@ -0,0 +1,96 @@
+import time
+import threading
+from collections import deque
+from typing import Dict, List, Optional, Sequence
+
+# Equivalent Binance Spot REST hosts; all share the same per-IP limits
+BINANCE_ENDPOINTS = [
+    "https://api.binance.com",
+    "https://api1.binance.com",
+    "https://api2.binance.com",
+    "https://api3.binance.com",
+    "https://api4.binance.com",
+]
+
+class EndpointHealth:
+    """Recent latency and failure history of one base URL."""
+
+    def __init__(self, url: str, window: int):
+        self.url = url
+        self.latencies: deque = deque(maxlen=window)
+        self.ewma_latency: Optional[float] = None
+        self.consecutive_failures = 0
+        self.cooldown_until = 0.0
+
+class EndpointPool:
+    """
+    Ranks equivalent endpoints by health for failover and hedging.
+    Healthy endpoints with the lowest smoothed latency come first, endpoints that have
+    not answered yet next, and endpoints cooling down after failures last. Each
+    consecutive failure doubles the cooldown.
+    """
+
+    def __init__(
+        self,
+        urls: Sequence[str],
+        window: int = 200,
+        ewma_alpha: float = 0.2,
+        failure_cooldown_s: float = 5.0,
+        max_cooldown_s: float = 300.0,
+        default_hedge_delay_s: float = 0.3,
+        min_hedge_delay_s: float = 0.02,
+        min_samples: int = 20
+    ):
+        if not urls:
+            raise ValueError("EndpointPool needs at least one URL.")
+        self.endpoints: Dict[str, EndpointHealth] = {
+            url.rstrip("/"): EndpointHealth(url.rstrip("/"), window) for url in urls
+        }
+        self.ewma_alpha = ewma_alpha
+        self.failure_cooldown_s = failure_cooldown_s
+        self.max_cooldown_s = max_cooldown_s
+        self.default_hedge_delay_s = default_hedge_delay_s
+        self.min_hedge_delay_s = min_hedge_delay_s
+        self.min_samples = min_samples
+        self._lock = threading.Lock()
+
+    @property
+    def urls(self) -> List[str]:
+        return list(self.endpoints)
+
+    def ranked(self) -> List[str]:
+        now = time.monotonic()
+        with self._lock:
+            def score(health: EndpointHealth):
+                cooling = health.cooldown_until > now
+                latency = health.ewma_latency if health.ewma_latency is not None else float("inf")
+                return (cooling, latency)
+            # sorted is stable, so ties keep the configured order
+            return [h.url for h in sorted(self.endpoints.values(), key=score)]
+
+    def record_success(self, url: str, latency_s: float):
+        with self._lock:
+            health = self.endpoints[url]
+            health.latencies.append(latency_s)
+            if health.ewma_latency is None:
+                health.ewma_latency = latency_s
+            else:
+                health.ewma_latency += self.ewma_alpha * (latency_s - health.ewma_latency)
+            health.consecutive_failures = 0
+            health.cooldown_until = 0.0
+
+    def record_failure(self, url: str):
+        with self._lock:
+            health = self.endpoints[url]
+            health.consecutive_failures += 1
+            cooldown = self.failure_cooldown_s * 2 ** (health.consecutive_failures - 1)
+            health.cooldown_until = time.monotonic() + min(cooldown, self.max_cooldown_s)
+
+    def hedge_delay(self) -> float:
+        """p95 of recent successful latencies across the pool (a default until warmed up)."""
+        with self._lock:
+            samples = sorted(s for h in self.endpoints.values() for s in h.latencies)
+        if len(samples) < self.min_samples:
+            return self.default_hedge_delay_s
+        p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+        return max(self.min_hedge_delay_s, p95)
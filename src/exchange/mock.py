@@ -1,6 +1,7 @@
+import time
 import logging
-from typing import Dict
-from src.exchange.base import ExchangeInterface, SymbolRules, ExchangeError
+from typing import Dict, List, Optional
+from src.exchange.base import ExchangeInterface, SymbolRules, ExchangeError, OpenOrder, Trade, symbol_assets
 
 logger = logging.getLogger(__name__)
 
@@ -10,22 +11,34 @@ class MockExchange(ExchangeInterface):
     """
     def __init__(self, current_price: float = 100.0):
         self._current_price = current_price
+        # Per-symbol prices; symbols without one trade at _current_price
+        self._prices: Dict[str, float] = {}
         self._rules: Dict[str, SymbolRules] = {}
         # Stores orders by id: dict of {id: {symbol, side, price, qty, status}}
         self._orders: Dict[str, dict] = {}
+        # (symbol, client order id) -> order id
+        self._client_ids: Dict[tuple, str] = {}
         self._order_counter = 0
+        self.order_id_prefix = "mock_"
         self._balances: Dict[str, float] = {"BTC": 1.0, "USDT": 1000.0}
+        self._trades: List[Trade] = []
 
-    def set_price(self, price: float):
-        """Helper to advance simulated price."""
-        self._current_price = price
+    def set_price(self, price: float, symbol: Optional[str] = None):
+        """Helper to advance simulated price (of one symbol, or the default for all)."""
+        if symbol is None:
+            self._current_price = price
+        else:
+            self._prices[symbol] = price
 
     def add_symbol_rules(self, symbol: str, rules: SymbolRules):
         """Helper to inject rules for testing rounding."""
         self._rules[symbol] = rules
 
+    def _price(self, symbol: str) -> float:
+        return self._prices.get(symbol, self._current_price)
+
     def get_price(self, symbol: str) -> float:
-        return self._current_price
+        return self._price(symbol)
         
     def get_symbol_rules(self, symbol: str) -> SymbolRules:
         if symbol not in self._rules:
@@ -33,9 +46,16 @@ class MockExchange(ExchangeInterface):
             return SymbolRules(tick_size=0.0, step_size=0.0, min_notional=0.0, min_qty=0.0)
         return self._rules[symbol]
         
-    def place_limit_order(self, symbol: str, side: str, price: float, qty: float) -> str:
+    def place_limit_order(
+        self, symbol: str, side: str, price: float, qty: float, client_order_id: Optional[str] = None
+    ) -> str:
+        if client_order_id is not None:
+            existing = self._client_ids.get((symbol, client_order_id))
+            # Idempotent placement (see ExchangeInterface): a known client id is not placed twice
+            if existing:
+                return existing
         self._order_counter += 1
-        order_id = f"mock_{self._order_counter}"
+        order_id = f"{self.order_id_prefix}{self._order_counter}"
         self._orders[order_id] = {
             "symbol": symbol,
             "side": side,
@@ -43,6 +63,8 @@ class MockExchange(ExchangeInterface):
             "qty": qty,
             "status": "OPEN"
         }
+        if client_order_id is not None:
+            self._client_ids[(symbol, client_order_id)] = order_id
         logger.debug(f"MockExchange placed limit order {order_id}: {side} {qty} at {price}")
         return order_id
         
@@ -52,21 +74,41 @@ class MockExchange(ExchangeInterface):
         
         order = self._orders[order_id]
         
-        # Simulate fills deterministically based on price
-        if order["status"] == "OPEN":
-            if order["side"] == "BUY" and self._current_price <= order["price"]:
-                order["status"] = "FILLED"
-                # Update mock balances
-                notional = order["price"] * order["qty"]
-                self._balances["USDT"] -= notional
-                self._balances["BTC"] += order["qty"]
-            elif order["side"] == "SELL" and self._current_price >= order["price"]:
-                order["status"] = "FILLED"
-                notional = order["price"] * order["qty"]
-                self._balances["BTC"] -= order["qty"]
-                self._balances["USDT"] += notional
-                
+        self._evaluate_fill(order_id)
         return order["status"]
+
+    def find_order(self, symbol: str, client_order_id: str) -> Optional[str]:
+        return self._client_ids.get((symbol, client_order_id))
+
+    def _evaluate_fill(self, order_id: str, low: Optional[float] = None, high: Optional[float] = None):
+        """
+        Fills an open order deterministically from the current price, or from a traded
+        low/high range when one is given.
+        """
+        order = self._orders[order_id]
+        if order["status"] != "OPEN":
+            return
+        price = self._price(order["symbol"])
+        low = price if low is None else min(low, price)
+        high = price if high is None else max(high, price)
+        
+        if order["side"] == "BUY" and low <= order["price"]:
+            received, spent = order["qty"], order["price"] * order["qty"]
+        elif order["side"] == "SELL" and high >= order["price"]:
+            received, spent = order["price"] * order["qty"], order["qty"]
+        else:
+            return
+        order["status"] = "FILLED"
+        try:
+            base, quote = symbol_assets(order["symbol"], self.get_symbol_rules(order["symbol"]))
+        except ValueError:
+            # Rules without assets and a name we cannot split: the fill leaves balances alone
+            base = quote = None
+        if base is not None:
+            bought, sold = (base, quote) if order["side"] == "BUY" else (quote, base)
+            self._balances[bought] = self._balances.get(bought, 0.0) + received
+            self._balances[sold] = self._balances.get(sold, 0.0) - spent
+        self._trades.append(Trade(order_id, order["side"], order["price"], order["qty"], int(time.time() * 1000)))
         
     def cancel_order(self, symbol: str, order_id: str) -> bool:
         if order_id in self._orders and self._orders[order_id]["status"] == "OPEN":
@@ -74,5 +116,30 @@ class MockExchange(ExchangeInterface):
             return True
         return False
 
+    def cancel_replace_order(
+        self, symbol: str, order_id: str, side: str, price: float, qty: float, client_order_id: Optional[str] = None
+    ) -> str:
+        # Fill rules first: an order the price already crossed cannot be replaced
+        if order_id not in self._orders or self.get_order_status(symbol, order_id) != "OPEN":
+            raise ExchangeError(f"Order {order_id} cannot be replaced (not open).")
+        self._orders[order_id]["status"] = "CANCELED"
+        return self.place_limit_order(symbol, side, price, qty, client_order_id)
+
+    def get_open_orders(self, symbol: str) -> List[OpenOrder]:
+        open_orders = []
+        for order_id, order in self._orders.items():
+            if order["symbol"] != symbol:
+                continue
+            self._evaluate_fill(order_id)
+            if order["status"] == "OPEN":
+                open_orders.append(OpenOrder(order_id, order["side"], order["price"], order["qty"]))
+        return open_orders
+
+    def get_recent_trades(self, symbol: str, since_ms: int) -> List[Trade]:
+        return [
+            t for t in self._trades
+            if t.time_ms >= since_ms and self._orders[t.order_id]["symbol"] == symbol
+        ]
+
     def get_balances(self) -> Dict[str, float]:
         return self._balances
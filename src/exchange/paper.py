@@ -0,0 +1,53 @@
+import uuid
+import logging
+from typing import Dict, List, Optional, Tuple
+
+from src.exchange.base import ExchangeInterface, SymbolRules, Kline
+from src.exchange.mock import MockExchange
+
+logger = logging.getLogger(__name__)
+
+class PaperExchange(MockExchange):
+    """
+    In-process paper matching engine for dry-run.
+    Market data (prices, rules, traded ranges) comes from a real exchange through public
+    calls only; orders, fills and balances live here and follow MockExchange's fill
+    rules, widened by the traded range when the market reports one.
+    The book is not persisted: orders from a previous process are reported CANCELED,
+    so a resumed dry-run bot simply re-places its order.
+    """
+
+    def __init__(self, market: ExchangeInterface, balances: Optional[Dict[str, float]] = None):
+        super().__init__(current_price=0.0)
+        self.market = market
+        if balances is not None:
+            self._balances = dict(balances)
+        # Distinguishes this process's orders from those persisted by an earlier run
+        self.order_id_prefix = f"dry_run_{uuid.uuid4().hex[:8]}_"
+
+    def get_price(self, symbol: str) -> float:
+        # Every tick's live price drives the paper book
+        price = self.market.get_price(symbol)
+        self.set_price(price, symbol)
+        return price
+
+    def get_symbol_rules(self, symbol: str) -> SymbolRules:
+        return self.market.get_symbol_rules(symbol)
+
+    def get_klines(self, symbol: str, interval: str, start_ms: int, end_ms: int, limit: int) -> List[Kline]:
+        return self.market.get_klines(symbol, interval, start_ms, end_ms, limit)
+
+    def get_price_range(self, symbol: str, since_ms: int) -> Optional[Tuple[float, float]]:
+        traded = self.market.get_price_range(symbol, since_ms)
+        if traded is not None:
+            # Resting paper orders inside the traded range would have executed
+            for order_id, order in self._orders.items():
+                if order["symbol"] == symbol:
+                    self._evaluate_fill(order_id, *traded)
+        return traded
+
+    def get_order_status(self, symbol: str, order_id: str) -> str:
+        if order_id not in self._orders:
+            logger.info(f"Paper order {order_id} is from an earlier run; treating it as canceled.")
+            return "CANCELED"
+        return super().get_order_status(symbol, order_id)
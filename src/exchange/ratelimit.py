@@ -0,0 +1,130 @@
+import time
+import logging
+import multiprocessing
+from typing import Dict, List, Optional, Tuple
+
+from src.exchange.base import ExchangeInterface, SymbolRules, OpenOrder, Trade, Kline
+
+logger = logging.getLogger(__name__)
+
+# Binance Spot REST request weights for the calls the adapter makes
+REQUEST_WEIGHTS = {
+    "get_price": 2,
+    "get_symbol_rules": 20,
+    "get_price_range": 2,
+    "get_klines": 2,
+    "place_limit_order": 1,
+    "get_order_status": 4,
+    "find_order": 4,
+    "cancel_order": 1,
+    "cancel_replace_order": 1,
+    "get_open_orders": 6,
+    "get_recent_trades": 20,
+    "get_balances": 20,
+}
+
+# Binance REQUEST_WEIGHT limit per IP per minute
+DEFAULT_WEIGHT_PER_MINUTE = 6000
+
+class SharedRateBudget:
+    """
+    Token bucket of request weight held in shared memory, so every process holding a
+    reference (passed at Process creation) draws from one budget per IP.
+    """
+
+    def __init__(self, weight_per_minute: float = DEFAULT_WEIGHT_PER_MINUTE, headroom: float = 0.8):
+        self.capacity = weight_per_minute * headroom
+        self.refill_per_second = self.capacity / 60.0
+        self._tokens = multiprocessing.Value("d", self.capacity, lock=False)
+        self._stamp = multiprocessing.Value("d", time.monotonic(), lock=False)
+        self._lock = multiprocessing.Lock()
+
+    def try_acquire(self, weight: float) -> float:
+        """Takes weight if available and returns 0, else returns the seconds to wait."""
+        with self._lock:
+            now = time.monotonic()
+            elapsed = max(0.0, now - self._stamp.value)
+            self._tokens.value = min(self.capacity, self._tokens.value + elapsed * self.refill_per_second)
+            self._stamp.value = now
+            if self._tokens.value >= weight:
+                self._tokens.value -= weight
+                return 0.0
+            return (weight - self._tokens.value) / self.refill_per_second
+
+    def acquire(self, weight: float) -> float:
+        """Blocks until weight is available. Returns the total time spent waiting."""
+        waited = 0.0
+        while True:
+            wait = self.try_acquire(weight)
+            if wait <= 0:
+                return waited
+            time.sleep(wait)
+            waited += wait
+
+    @property
+    def available(self) -> float:
+        return self._tokens.value
+
+class RateLimitedExchange(ExchangeInterface):
+    """Wraps an exchange so every call is charged against a shared weight budget."""
+
+    def __init__(self, inner: ExchangeInterface, budget: SharedRateBudget):
+        self.inner = inner
+        self.budget = budget
+
+    def _charge(self, call: str):
+        waited = self.budget.acquire(REQUEST_WEIGHTS[call])
+        if waited > 0:
+            logger.debug(f"Rate budget delayed {call} by {waited:.3f}s")
+
+    def get_price(self, symbol: str) -> float:
+        self._charge("get_price")
+        return self.inner.get_price(symbol)
+
+    def get_symbol_rules(self, symbol: str) -> SymbolRules:
+        self._charge("get_symbol_rules")
+        return self.inner.get_symbol_rules(symbol)
+
+    def get_price_range(self, symbol: str, since_ms: int) -> Optional[Tuple[float, float]]:
+        self._charge("get_price_range")
+        return self.inner.get_price_range(symbol, since_ms)
+
+    def get_klines(self, symbol: str, interval: str, start_ms: int, end_ms: int, limit: int) -> List[Kline]:
+        self._charge("get_klines")
+        return self.inner.get_klines(symbol, interval, start_ms, end_ms, limit)
+
+    def place_limit_order(
+        self, symbol: str, side: str, price: float, qty: float, client_order_id: Optional[str] = None
+    ) -> str:
+        self._charge("place_limit_order")
+        return self.inner.place_limit_order(symbol, side, price, qty, client_order_id)
+
+    def find_order(self, symbol: str, client_order_id: str) -> Optional[str]:
+        self._charge("find_order")
+        return self.inner.find_order(symbol, client_order_id)
+
+    def get_order_status(self, symbol: str, order_id: str) -> str:
+        self._charge("get_order_status")
+        return self.inner.get_order_status(symbol, order_id)
+
+    def cancel_order(self, symbol: str, order_id: str) -> bool:
+        self._charge("cancel_order")
+        return self.inner.cancel_order(symbol, order_id)
+
+    def cancel_replace_order(
+        self, symbol: str, order_id: str, side: str, price: float, qty: float, client_order_id: Optional[str] = None
+    ) -> str:
+        self._charge("cancel_replace_order")
+        return self.inner.cancel_replace_order(symbol, order_id, side, price, qty, client_order_id)
+
+    def get_open_orders(self, symbol: str) -> List[OpenOrder]:
+        self._charge("get_open_orders")
+        return self.inner.get_open_orders(symbol)
+
+    def get_recent_trades(self, symbol: str, since_ms: int) -> List[Trade]:
+        self._charge("get_recent_trades")
+        return self.inner.get_recent_trades(symbol, since_ms)
+
+    def get_balances(self) -> Dict[str, float]:
+        self._charge("get_balances")
+        return self.inner.get_balances()
@@ -0,0 +1,178 @@
+"""
+Minimal RFC 6455 WebSocket connection on the standard library: the handshake, text
+messages, ping/pong and close. Enough for request/response JSON APIs; no extensions.
+"""
+import os
+import ssl
+import base64
+import socket
+import struct
+import hashlib
+import threading
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+OP_CONTINUATION = 0x0
+OP_TEXT = 0x1
+OP_BINARY = 0x2
+OP_CLOSE = 0x8
+OP_PING = 0x9
+OP_PONG = 0xA
+
+class WebSocketClosed(ConnectionError):
+    """The connection was closed (by either side) or broke."""
+
+def accept_key(key: str) -> str:
+    """Sec-WebSocket-Accept value the server must answer to Sec-WebSocket-Key `key`."""
+    return base64.b64encode(hashlib.sha1((key + _GUID).encode("ascii")).digest()).decode("ascii")
+
+def encode_frame(opcode: int, payload: bytes, mask: bool) -> bytes:
+    """One final frame. Clients must mask their frames, servers must not."""
+    length = len(payload)
+    if length < 126:
+        header = struct.pack("!BB", 0x80 | opcode, (0x80 if mask else 0) | length)
+    elif length < 1 << 16:
+        header = struct.pack("!BBH", 0x80 | opcode, (0x80 if mask else 0) | 126, length)
+    else:
+        header = struct.pack("!BBQ", 0x80 | opcode, (0x80 if mask else 0) | 127, length)
+    if not mask:
+        return header + payload
+    key = os.urandom(4)
+    return header + key + _apply_mask(payload, key)
+
+def _apply_mask(payload: bytes, key: bytes) -> bytes:
+    # XOR as one big integer: much faster than a per-byte loop
+    repeated = (key * (len(payload) // 4 + 1))[:len(payload)]
+    return (int.from_bytes(payload, "big") ^ int.from_bytes(repeated, "big")).to_bytes(len(payload), "big")
+
+def read_frame(rfile) -> Tuple[bool, int, bytes]:
+    """(fin, opcode, payload) of the next frame, unmasked."""
+    head = _read_exact(rfile, 2)
+    fin, opcode = bool(head[0] & 0x80), head[0] & 0x0F
+    masked, length = bool(head[1] & 0x80), head[1] & 0x7F
+    if length == 126:
+        length = struct.unpack("!H", _read_exact(rfile, 2))[0]
+    elif length == 127:
+        length = struct.unpack("!Q", _read_exact(rfile, 8))[0]
+    key = _read_exact(rfile, 4) if masked else None
+    payload = _read_exact(rfile, length)
+    return fin, opcode, _apply_mask(payload, key) if key else payload
+
+def _read_exact(rfile, n: int) -> bytes:
+    data = rfile.read(n) if n else b""
+    if len(data) < n:
+        raise WebSocketClosed("Connection closed by peer")
+    return data
+
+class WebSocketConnection:
+    """
+    One open WebSocket. send_text may be called from any thread; recv must only be
+    called by a single reader thread. Pings are answered inside recv.
+    """
+
+    def __init__(self, sock: socket.socket, rfile, mask: bool):
+        self.sock = sock
+        self.rfile = rfile
+        self.mask = mask
+        self.closed = False
+        self._send_lock = threading.Lock()
+
+    @classmethod
+    def connect(cls, url: str, timeout_s: float = 5.0, headers: Optional[Dict[str, str]] = None) -> "WebSocketConnection":
+        """Opens a client connection to a ws:// or wss:// URL."""
+        parts = urlsplit(url)
+        secure = parts.scheme == "wss"
+        port = parts.port or (443 if secure else 80)
+        sock = socket.create_connection((parts.hostname, port), timeout=timeout_s)
+        try:
+            # Requests are small and latency-bound: never wait to coalesce them
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            if secure:
+                sock = ssl.create_default_context().wrap_socket(sock, server_hostname=parts.hostname)
+            key = base64.b64encode(os.urandom(16)).decode("ascii")
+            path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+            lines = [
+                f"GET {path} HTTP/1.1",
+                f"Host: {parts.netloc}",
+                "Upgrade: websocket",
+                "Connection: Upgrade",
+                f"Sec-WebSocket-Key: {key}",
+                "Sec-WebSocket-Version: 13",
+            ] + [f"{k}: {v}" for k, v in (headers or {}).items()]
+            sock.sendall(("\r\n".join(lines) + "\r\n\r\n").encode("ascii"))
+
+            rfile = sock.makefile("rb")
+            status = rfile.readline().decode("latin-1")
+            response_headers = read_http_headers(rfile)
+            if " 101 " not in status:
+                raise WebSocketClosed(f"WebSocket handshake refused: {status.strip()}")
+            if response_headers.get("sec-websocket-accept") != accept_key(key):
+                raise WebSocketClosed("WebSocket handshake returned a wrong Sec-WebSocket-Accept")
+            # The reader thread blocks on recv until data arrives or the socket is closed
+            sock.settimeout(None)
+        except BaseException:
+            sock.close()
+            raise
+        return cls(sock, rfile, mask=True)
+
+    def _send(self, opcode: int, payload: bytes):
+        frame = encode_frame(opcode, payload, self.mask)
+        with self._send_lock:
+            if self.closed:
+                raise WebSocketClosed("Connection is closed")
+            try:
+                self.sock.sendall(frame)
+            except OSError as e:
+                self.closed = True
+                raise WebSocketClosed(f"Send failed: {e}") from e
+
+    def send_text(self, text: str):
+        self._send(OP_TEXT, text.encode("utf-8"))
+
+    def recv(self) -> str:
+        """Next text message. Raises WebSocketClosed once the connection is gone."""
+        fragments = []
+        while True:
+            try:
+                fin, opcode, payload = read_frame(self.rfile)
+            except (OSError, ValueError) as e:
+                self.closed = True
+                raise WebSocketClosed(f"Receive failed: {e}") from e
+            if opcode == OP_PING:
+                self._send(OP_PONG, payload)
+                continue
+            if opcode == OP_PONG:
+                continue
+            if opcode == OP_CLOSE:
+                self.close(payload[:2])
+                raise WebSocketClosed("Connection closed by peer")
+            fragments.append(payload)
+            if fin:
+                return b"".join(fragments).decode("utf-8")
+
+    def close(self, code: bytes = struct.pack("!H", 1000)):
+        with self._send_lock:
+            if not self.closed:
+                self.closed = True
+                try:
+                    self.sock.sendall(encode_frame(OP_CLOSE, code, self.mask))
+                except OSError:
+                    pass
+        try:
+            # Unblocks a reader waiting in recv
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.sock.close()
+
+def read_http_headers(rfile) -> Dict[str, str]:
+    """Header lines up to the blank line, with lower-cased names."""
+    headers = {}
+    while True:
+        line = rfile.readline().decode("latin-1").strip()
+        if not line:
+            return headers
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
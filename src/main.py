@@ -1,30 +1,103 @@
+import os
+import time
 import argparse
 import sys
 import logging
-from src.core.config import load_config, ConfigError
+from src.core.eventlog import setup_logging
+from src.core.config import read_config_file, build_config, load_fleet_config, ConfigError
 from src.exchange.binance import BinanceSpotAdapter
 from src.bot.loop import GridBotOrchestrator
+from src.bot.balances import BalanceLedger
+from src.bot.snapshot import snapshot_key, load_snapshot, save_snapshot, StartupSnapshot
+# Optional features (WebSocket orders, archive and reports, shadows, fleet, config
+# watching) are imported in the code paths that use them, to keep one-shot startup fast
 
-def setup_logging():
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S"
+def run_fleet(args, logger):
+    """Runs every grid of the config's fleet section under the multi-process supervisor."""
+    from src.bot.fleet import FleetSupervisor, binance_exchange_factory, binance_ws_exchange_factory
+    try:
+        configs = load_fleet_config(args.config, args.dry_run)
+    except ConfigError as e:
+        logger.error(f"Configuration Error: {e}")
+        sys.exit(1)
+        
+    supervisor = FleetSupervisor(
+        configs, state_dir=args.state_dir, num_workers=args.workers, event_log=args.event_log,
+        tick_workers=args.tick_threads, archive_dir=args.archive_dir,
+        exchange_factory=binance_ws_exchange_factory if args.ws_orders else binance_exchange_factory
+    )
+    if args.watch_config:
+        # Workers hold their shard's configs for life; re-sharding on edits is not supported
+        logger.warning("--watch-config is ignored with --fleet: restart the fleet to apply config changes.")
+    logger.info(f"Starting fleet of {len(configs)} grids (dry run: {configs[0].dry_run})")
+    try:
+        supervisor.run()
+    except KeyboardInterrupt:
+        logger.info("Fleet stopped. Worker state is persisted under " + args.state_dir)
+        sys.exit(0)
+
+def run_report(args):
+    """Prints fill statistics streamed from the archive; no config or exchange needed."""
+    from src.bot.archive import build_report, format_report
+    report = build_report(
+        args.archive_dir, symbols=args.report_symbol, start_day=args.report_from, end_day=args.report_to
     )
+    print(format_report(report))
 
 def main():
-    setup_logging()
-    logger = logging.getLogger("main")
-    
     parser = argparse.ArgumentParser(description="GridBot MVP CLI")
     parser.add_argument("--config", type=str, default="config.yaml", help="Path to configuration file")
     parser.add_argument("--state", type=str, default="state.json", help="Path to the bot state file")
     parser.add_argument("--dry-run", action="store_true", help="Run in dry-run mode (no real orders)")
     parser.add_argument("--run-once", action="store_true", help="Run a single tick and exit (mostly for testing)")
+    parser.add_argument("--snapshot", type=str, default=None, help="Startup snapshot cache for --run-once (default: <state>.snapshot)")
+    parser.add_argument("--watch-config", action="store_true", help="Reload the config file when it changes (SIGHUP always reloads; single-grid mode only)")
+    parser.add_argument("--fleet", action="store_true", help="Run all grids from the config's fleet section in worker processes")
+    parser.add_argument("--workers", type=int, default=None, help="Fleet worker processes (default: one per core)")
+    parser.add_argument("--tick-threads", type=int, default=8, help="Concurrent grid ticks per fleet worker")
+    parser.add_argument("--state-dir", type=str, default="states", help="Directory for per-symbol fleet state files")
+    parser.add_argument("--profile", action="store_true", help="Profile ticks and track allocations; dump reports on exit or SIGUSR1")
+    parser.add_argument("--profile-dir", type=str, default="profiles", help="Directory for profiling reports")
+    parser.add_argument("--profile-ticks", type=int, default=100, help="Number of ticks to run under cProfile")
+    parser.add_argument("--event-log", type=str, default=None, help="Write structured JSON-lines events to this file (rotated)")
+    parser.add_argument("--event-log-max-mb", type=float, default=10.0, help="Rotate the event log at this size")
+    parser.add_argument("--ws-orders", action="store_true", help="Send order calls over a persistent WebSocket API connection (REST fallback)")
+    parser.add_argument("--archive-dir", type=str, default=None, help="Append every order event to a columnar archive in this directory")
+    parser.add_argument("--report", action="store_true", help="Print PnL, fills per level, turnover and fees from --archive-dir and exit")
+    parser.add_argument("--report-symbol", type=str, action="append", default=None, help="Limit the report to this symbol (repeatable)")
+    parser.add_argument("--report-from", type=str, default=None, help="First UTC day (YYYY-MM-DD) of the report")
+    parser.add_argument("--report-to", type=str, default=None, help="Last UTC day (YYYY-MM-DD) of the report")
     args = parser.parse_args()
 
+    if args.report:
+        if not args.archive_dir:
+            parser.error("--report requires --archive-dir")
+        run_report(args)
+        return
+
+    setup_logging(
+        event_log=None if args.fleet else args.event_log,
+        max_bytes=int(args.event_log_max_mb * 1024 * 1024)
+    )
+    logger = logging.getLogger("main")
+
+    if args.fleet:
+        run_fleet(args, logger)
+        return
+
+    # One-shot runs reuse a snapshot of parsed config, symbol rules and grid levels
+    # keyed by the config file hash, skipping YAML parsing and the exchangeInfo call.
+    snapshot = None
+    snapshot_path = args.snapshot or f"{args.state}.snapshot"
     try:
-        config = load_config(args.config, args.dry_run)
+        if args.run_once:
+            key = snapshot_key(args.config)
+            snapshot = load_snapshot(snapshot_path, key)
+            if snapshot is None:
+                snapshot = StartupSnapshot(key=key, created_at=time.time(), raw_config=read_config_file(args.config))
+            config = build_config(snapshot.raw_config, args.dry_run)
+        else:
+            config = build_config(read_config_file(args.config), args.dry_run)
     except ConfigError as e:
         logger.error(f"Configuration Error: {e}")
         sys.exit(1)
@@ -32,22 +105,55 @@ def main():
     logger.info("Starting GridBot MVP")
     logger.info(f"Dry run mode: {config.dry_run}")
     logger.info(f"Grid setup: {config.grid.symbol} ({config.grid.mode}) with {config.grid.grid_intervals} intervals")
+    
+    profiler = None
+    if args.profile:
+        from src.core.profiling import TickProfiler
+        profiler = TickProfiler(args.profile_dir, profile_ticks=args.profile_ticks)
+        profiler.install_signal_handler()
         
     try:
-        exchange = BinanceSpotAdapter(
+        adapter_kwargs = {}
+        adapter_cls = BinanceSpotAdapter
+        if args.ws_orders:
+            from src.exchange.binance_ws import BinanceWebSocketAdapter
+            adapter_cls = BinanceWebSocketAdapter
+            adapter_kwargs["ws_url"] = os.environ.get("EXCHANGE_WS_URL")
+        exchange = adapter_cls(
             api_key=config.api_key or "",
             api_secret=config.api_secret or "",
-            testnet=False # Spot Testnet not natively reliable for all pairs, but could be dynamic
+            testnet=False, # Spot Testnet not natively reliable for all pairs, but could be dynamic
+            base_url=os.environ.get("EXCHANGE_BASE_URL"),
+            **adapter_kwargs
         )
+        if not config.dry_run and not args.run_once:
+            # Keep signed-request timestamps aligned with the exchange clock
+            exchange.start_time_sync()
         
-        bot = GridBotOrchestrator(config, exchange, state_file=args.state)
-        bot.initialize()
+        # Live loops keep account balances locally for pre-trade checks
+        balances = BalanceLedger() if not config.dry_run and not args.run_once else None
+        archive = None
+        if args.archive_dir:
+            from src.bot.archive import FillArchive
+            archive = FillArchive(args.archive_dir)
+        bot = GridBotOrchestrator(config, exchange, state_file=args.state, balances=balances, archive=archive)
+        bot.initialize(snapshot=snapshot)
+        if snapshot:
+            save_snapshot(snapshot, snapshot_path)
+        if profiler:
+            profiler.attach(bot)
         
         if args.run_once:
             logger.info("Running a single tick for validation...")
             bot.execute_tick()
             logger.info("Tick executed successfully.")
         else:
+            if not config.dry_run:
+                from src.bot.reconcile import reconcile_bots
+                reconcile_bots([bot], exchange)
+            from src.bot.reload import ConfigWatcher
+            bot.config_watcher = ConfigWatcher(args.config, args.dry_run, watch_file=args.watch_config)
+            bot.config_watcher.install_signal_handler()
             logger.info("Entering continuous bot loop... (Press Ctrl+C to stop)")
             bot.run_loop()
         
@@ -57,11 +163,18 @@ def main():
             logger.info(f"Final Phase: {bot.state.phase.value}")
             logger.info(f"Realized PnL: {bot.state.realized_pnl:.4f}")
             logger.info(f"Active Order: {bot.state.active_order.order_id if bot.state.active_order else 'None'}")
+            if bot.shadows:
+                from src.bot.shadow import format_shadow_report
+                logger.info("Shadow grids since start:\n" + format_shadow_report(bot.shadow_report()))
         logger.info("Graceful shutdown complete.")
         sys.exit(0)
     except Exception as e:
         logger.error(f"Bot execution failed: {e}", exc_info=True)
         sys.exit(1)
+    finally:
+        if profiler:
+            profiler.dump()
+            profiler.detach()
 
 if __name__ == "__main__":
     main()
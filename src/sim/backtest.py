@@ -0,0 +1,212 @@
+"""
+Single-config backtests on the vectorized engine, with a content-addressed result cache.
+Requires numpy (pip install .[sim]).
+"""
+import os
+import json
+import time
+import hashlib
+import logging
+from dataclasses import dataclass, asdict, field
+from typing import Dict, Optional
+
+import numpy as np
+
+from src.core.config import GridConfig, ConfigError
+from src.sim.vectorized import VectorGridSimulator
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever simulator semantics change so cached results are not reused
+ENGINE_VERSION = "vector-1"
+
+@dataclass
+class BacktestResult:
+    key: str
+    config: GridConfig
+    symbol: str
+    start: int
+    end: int
+    events: int
+    fill_count: int
+    realized_pnl: float
+    fees_paid: float
+    total_pnl: float
+    last_price: float
+    # Simulator arrays at `end`, used to extend the run without replaying the prefix
+    state: Dict[str, np.ndarray] = field(default_factory=dict, repr=False)
+
+def config_fingerprint(config: GridConfig) -> str:
+    payload = json.dumps(asdict(config), sort_keys=True)
+    return hashlib.sha256(f"{ENGINE_VERSION}|{payload}".encode("utf-8")).hexdigest()
+
+def backtest_key(config: GridConfig, symbol: str, start: int, end: int) -> str:
+    """Content address of a run: config, engine version and data range [start, end)."""
+    raw = f"{config_fingerprint(config)}|{symbol}|{start}|{end}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+class BacktestCache:
+    """
+    On-disk result cache with size-bounded LRU eviction.
+    Each result is one .npz file named by its key; index.json tracks size, last access
+    and the (config, symbol, start) series so prefixes of a longer run can be found.
+    """
+
+    INDEX_FILE = "index.json"
+
+    def __init__(self, directory: str, max_bytes: int = 256 * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+        self._index: Dict[str, dict] = self._load_index()
+
+    def _load_index(self) -> Dict[str, dict]:
+        path = os.path.join(self.directory, self.INDEX_FILE)
+        if not os.path.exists(path):
+            return {}
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Backtest cache index unreadable, starting empty: {e}")
+            return {}
+        # Drop entries whose files vanished
+        return {k: v for k, v in index.items() if os.path.exists(self._path(k))}
+
+    def _save_index(self):
+        path = os.path.join(self.directory, self.INDEX_FILE)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._index, f)
+        os.replace(tmp_path, path)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.npz")
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(entry["size"] for entry in self._index.values())
+
+    def get(self, key: str) -> Optional[BacktestResult]:
+        entry = self._index.get(key)
+        if entry is None:
+            return None
+        try:
+            with np.load(self._path(key), allow_pickle=False) as data:
+                meta = json.loads(str(data["__meta__"]))
+                state = {name: data[name] for name in data.files if name != "__meta__"}
+            meta["config"] = GridConfig(**meta["config"])
+            result = BacktestResult(state=state, **meta)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            # TypeError: written by an older GridConfig/BacktestResult schema
+            logger.warning(f"Dropping unreadable backtest cache entry {key}: {e}")
+            self._remove(key)
+            return None
+        entry["last_access"] = time.time()
+        self._save_index()
+        return result
+
+    def find_prefix(self, config: GridConfig, symbol: str, start: int, end: int) -> Optional[BacktestResult]:
+        """Longest cached run of the same config/symbol/start that ends before `end`."""
+        series = config_fingerprint(config)
+        best_key, best_end = None, None
+        for key, entry in self._index.items():
+            if (entry["series"] == series and entry["symbol"] == symbol and entry["start"] == start
+                    and entry["end"] < end and (best_end is None or entry["end"] > best_end)):
+                best_key, best_end = key, entry["end"]
+        return self.get(best_key) if best_key else None
+
+    def put(self, result: BacktestResult):
+        meta = asdict(result)
+        meta.pop("state")
+        path = self._path(result.key)
+        tmp_path = f"{path}.tmp.npz"
+        np.savez(tmp_path, __meta__=np.array(json.dumps(meta)), **result.state)
+        os.replace(tmp_path, path)
+
+        self._index[result.key] = {
+            "series": config_fingerprint(result.config),
+            "symbol": result.symbol,
+            "start": result.start,
+            "end": result.end,
+            "size": os.path.getsize(path),
+            "last_access": time.time(),
+        }
+        self._evict()
+        self._save_index()
+
+    def _remove(self, key: str):
+        self._index.pop(key, None)
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+    def _evict(self):
+        total = self.total_bytes
+        for key in sorted(self._index, key=lambda k: self._index[k]["last_access"]):
+            if total <= self.max_bytes:
+                break
+            total -= self._index[key]["size"]
+            self._remove(key)
+
+def run_backtest(
+    config: GridConfig,
+    symbol: str,
+    timestamps: np.ndarray,
+    prices: np.ndarray,
+    start: int,
+    end: int,
+    cache: Optional[BacktestCache] = None
+) -> BacktestResult:
+    """
+    Backtests one GridConfig over the events with start <= timestamp < end.
+    With a cache, identical runs are returned from disk and a cached run over
+    [start, earlier_end) is resumed instead of replayed. Trailing grids raise ConfigError:
+    the vectorized engine only simulates static grids.
+    """
+    if config.trailing:
+        raise ConfigError("Trailing grids cannot be backtested: the vectorized engine has no trailing.")
+    key = backtest_key(config, symbol, start, end)
+    if cache:
+        cached = cache.get(key)
+        if cached:
+            return cached
+
+    timestamps = np.asarray(timestamps)
+    prices = np.asarray(prices, dtype=np.float64)
+    in_range = (timestamps >= start) & (timestamps < end)
+    window_ts = timestamps[in_range]
+    window_prices = prices[in_range]
+    if window_prices.size == 0:
+        raise ValueError(f"No price data for {symbol} in [{start}, {end}).")
+
+    prefix = cache.find_prefix(config, symbol, start, end) if cache else None
+    if prefix:
+        sim = VectorGridSimulator.from_state_arrays(prefix.state)
+        remaining = window_ts >= prefix.end
+        logger.info(f"Extending cached backtest [{start}, {prefix.end}) to {end}")
+    else:
+        sim = VectorGridSimulator.from_configs([config], p0=float(window_prices[0]))
+        remaining = np.ones(window_prices.size, dtype=bool)
+
+    sim.run(window_prices[remaining])
+
+    last_price = float(window_prices[-1])
+    result = BacktestResult(
+        key=key,
+        config=config,
+        symbol=symbol,
+        start=start,
+        end=end,
+        events=int(window_prices.size),
+        fill_count=int(sim.fill_count[0]),
+        realized_pnl=float(sim.realized_pnl[0]),
+        fees_paid=float(sim.fees_paid[0]),
+        total_pnl=float(sim.total_pnl(last_price)[0]),
+        last_price=last_price,
+        state=sim.state_arrays()
+    )
+    if cache:
+        cache.put(result)
+    return result
@@ -0,0 +1,216 @@
+"""
+Local candle store per symbol/interval, synced incrementally from the exchange.
+Requires numpy (pip install .[sim]).
+"""
+import os
+import json
+import time
+import logging
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.exchange.base import ExchangeInterface
+
+logger = logging.getLogger(__name__)
+
+INTERVAL_MS = {
+    "1m": 60_000,
+    "3m": 180_000,
+    "5m": 300_000,
+    "15m": 900_000,
+    "30m": 1_800_000,
+    "1h": 3_600_000,
+    "2h": 7_200_000,
+    "4h": 14_400_000,
+    "6h": 21_600_000,
+    "8h": 28_800_000,
+    "12h": 43_200_000,
+    "1d": 86_400_000,
+}
+
+# Candles per request (Binance maximum)
+PAGE_LIMIT = 1000
+
+# Column name -> little-endian dtype; one raw file per column
+COLUMNS = {
+    "open_time": "<i8",
+    "open": "<f8",
+    "high": "<f8",
+    "low": "<f8",
+    "close": "<f8",
+    "volume": "<f8",
+}
+
+Span = Tuple[int, int]
+
+def _merge_spans(spans: List[Span]) -> List[Span]:
+    merged: List[Span] = []
+    for start, end in sorted(spans):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+def _subtract_spans(start: int, end: int, covered: List[Span]) -> List[Span]:
+    """Parts of [start, end) not inside any covered span."""
+    missing: List[Span] = []
+    cursor = start
+    for c_start, c_end in covered:
+        if c_end <= cursor:
+            continue
+        if c_start >= end:
+            break
+        if c_start > cursor:
+            missing.append((cursor, c_start))
+        cursor = max(cursor, c_end)
+    if cursor < end:
+        missing.append((cursor, end))
+    return missing
+
+class KlineStore:
+    """
+    Closed candles of one symbol/interval under directory/SYMBOL/INTERVAL, stored
+    column-wise: one raw little-endian file per column, so new candles are plain appends
+    and reads are memory-mapped array slices.
+
+    meta.json records the committed row count and the time spans already downloaded
+    (the exchange may legitimately have no candles in parts of them). A sync only fetches
+    the gaps between covered spans, page by page; pass a RateLimitedExchange to charge
+    those pages to the fleet's shared weight budget. Rows past the committed count (a
+    sync interrupted mid-write) are truncated on open. A backfill before the stored tail
+    rewrites every column into a new generation of files, which meta.json switches to in
+    one replace; files of any other generation are leftovers and are deleted on open.
+    """
+
+    META_FILE = "meta.json"
+
+    def __init__(self, directory: str, symbol: str, interval: str = "1m"):
+        if interval not in INTERVAL_MS:
+            raise ValueError(f"Unsupported kline interval {interval}; expected one of {list(INTERVAL_MS)}")
+        self.symbol = symbol
+        self.interval = interval
+        self.interval_ms = INTERVAL_MS[interval]
+        self.path = os.path.join(directory, symbol, interval)
+        os.makedirs(self.path, exist_ok=True)
+        self.rows = 0
+        self.covered: List[Span] = []
+        # Column files in use; bumped by every backfill rewrite
+        self.generation = 0
+        self._load_meta()
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def _column_path(self, column: str, generation: Optional[int] = None) -> str:
+        generation = self.generation if generation is None else generation
+        name = f"{column}.bin" if generation == 0 else f"{column}.{generation}.bin"
+        return os.path.join(self.path, name)
+
+    def _load_meta(self):
+        path = os.path.join(self.path, self.META_FILE)
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            self.rows = int(meta["rows"])
+            self.covered = [tuple(span) for span in meta["covered"]]
+            self.generation = int(meta.get("generation", 0))
+        current = {os.path.basename(self._column_path(column)) for column in COLUMNS}
+        for name in os.listdir(self.path):
+            if name.endswith((".bin", ".tmp")) and name not in current:
+                # Columns of a rewrite that never committed, or of the one it replaced
+                os.remove(os.path.join(self.path, name))
+        for column, dtype in COLUMNS.items():
+            column_path = self._column_path(column)
+            size = self.rows * np.dtype(dtype).itemsize
+            if not os.path.exists(column_path):
+                open(column_path, "wb").close()
+            if os.path.getsize(column_path) != size:
+                with open(column_path, "r+b") as f:
+                    f.truncate(size)
+
+    def _save_meta(self):
+        path = os.path.join(self.path, self.META_FILE)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"rows": self.rows, "covered": self.covered, "generation": self.generation}, f)
+        os.replace(tmp_path, path)
+
+    def _read_column(self, column: str) -> np.ndarray:
+        if self.rows == 0:
+            return np.empty(0, dtype=COLUMNS[column])
+        return np.memmap(self._column_path(column), dtype=COLUMNS[column], mode="r", shape=(self.rows,))
+
+    def _align(self, ms: int) -> int:
+        return ms - ms % self.interval_ms
+
+    def missing(self, start_ms: int, end_ms: int) -> List[Span]:
+        """Interval-aligned parts of [start_ms, end_ms) not downloaded yet."""
+        return _subtract_spans(self._align(start_ms), self._align(end_ms), self.covered)
+
+    def _append(self, rows: Dict[str, np.ndarray]):
+        count = len(rows["open_time"])
+        if count == 0:
+            return
+        last_time = self._read_column("open_time")[-1] if self.rows else None
+        if last_time is not None and rows["open_time"][0] <= last_time:
+            # Backfill before the tail: merge and rewrite the columns in time order
+            merged = {c: np.concatenate([np.asarray(self._read_column(c)), rows[c]]) for c in COLUMNS}
+            order = np.argsort(merged["open_time"], kind="stable")
+            times = merged["open_time"][order]
+            keep = np.ones(len(times), dtype=bool)
+            keep[1:] = times[1:] != times[:-1]
+            old_generation, new_generation = self.generation, self.generation + 1
+            for column, dtype in COLUMNS.items():
+                merged[column][order][keep].astype(dtype).tofile(self._column_path(column, new_generation))
+            # Commit point: every column switches to the new generation at once
+            self.generation = new_generation
+            self.rows = int(keep.sum())
+            self._save_meta()
+            for column in COLUMNS:
+                os.remove(self._column_path(column, old_generation))
+        else:
+            for column, dtype in COLUMNS.items():
+                with open(self._column_path(column), "ab") as f:
+                    f.write(np.ascontiguousarray(rows[column], dtype=dtype).tobytes())
+            self.rows += count
+
+    def sync(self, exchange: ExchangeInterface, start_ms: int, end_ms: Optional[int] = None) -> int:
+        """
+        Downloads the closed candles of [start_ms, end_ms) (default: up to now) that are
+        not stored yet. Returns the number of new candles.
+        """
+        now_ms = int(time.time() * 1000)
+        # The current candle is still open: only store candles that have closed
+        end_ms = min(now_ms if end_ms is None else end_ms, self._align(now_ms))
+        added = 0
+        for gap_start, gap_end in self.missing(start_ms, end_ms):
+            cursor = gap_start
+            while cursor < gap_end:
+                page = exchange.get_klines(self.symbol, self.interval, cursor, gap_end, PAGE_LIMIT)
+                page = [k for k in page if cursor <= k.open_time_ms < gap_end]
+                page_end = page[-1].open_time_ms + self.interval_ms if len(page) == PAGE_LIMIT else gap_end
+                self._append({
+                    "open_time": np.array([k.open_time_ms for k in page], dtype=np.int64),
+                    "open": np.array([k.open for k in page]),
+                    "high": np.array([k.high for k in page]),
+                    "low": np.array([k.low for k in page]),
+                    "close": np.array([k.close for k in page]),
+                    "volume": np.array([k.volume for k in page]),
+                })
+                # Commit point: rows and coverage are only recorded once the columns are written
+                self.covered = _merge_spans(self.covered + [(cursor, page_end)])
+                self._save_meta()
+                added += len(page)
+                cursor = page_end
+        if added:
+            logger.info(f"Kline store {self.symbol} {self.interval}: +{added} candles ({self.rows} total)")
+        return added
+
+    def load(self, start_ms: Optional[int] = None, end_ms: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """Columns of the stored candles opening in [start_ms, end_ms), as read-only arrays."""
+        times = self._read_column("open_time")
+        lo = 0 if start_ms is None else int(np.searchsorted(times, start_ms, side="left"))
+        hi = self.rows if end_ms is None else int(np.searchsorted(times, end_ms, side="left"))
+        return {column: self._read_column(column)[lo:hi] for column in COLUMNS}
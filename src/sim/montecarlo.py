@@ -0,0 +1,196 @@
+"""
+Monte Carlo stress tests: one grid config run over large batches of synthetic price paths.
+Requires numpy (pip install .[sim]).
+"""
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+from src.core.config import GridConfig
+from src.core.math import MathError
+from src.sim.vectorized import VectorGridSimulator
+
+# Paths simulated together; bounds the (paths, steps) price block held in memory
+DEFAULT_BATCH_PATHS = 4096
+
+DEFAULT_PERCENTILES = (1, 5, 25, 50, 75, 95, 99)
+
+# Price path models. Each one draws a (paths, steps) block of log returns; parameters are
+# per step (one tick or candle), like the simulator's price events.
+
+@dataclass
+class GBM:
+    """Geometric Brownian motion: normal log returns."""
+    sigma: float
+    drift: float = 0.0
+
+    def log_returns(self, rng: np.random.Generator, paths: int, steps: int) -> np.ndarray:
+        return rng.normal(self.drift, self.sigma, (paths, steps))
+
+@dataclass
+class JumpDiffusion:
+    """Merton jump-diffusion: GBM plus Poisson(jump_rate) normal jumps in log price per step."""
+    sigma: float
+    jump_rate: float
+    jump_mean: float = 0.0
+    jump_std: float = 0.05
+    drift: float = 0.0
+
+    def log_returns(self, rng: np.random.Generator, paths: int, steps: int) -> np.ndarray:
+        returns = rng.normal(self.drift, self.sigma, (paths, steps))
+        jumps = rng.poisson(self.jump_rate, (paths, steps))
+        # A sum of k normal jumps is normal(k * mean, sqrt(k) * std)
+        returns += jumps * self.jump_mean + np.sqrt(jumps) * self.jump_std * rng.standard_normal((paths, steps))
+        return returns
+
+@dataclass
+class RegimeSwitching:
+    """
+    Markov-switching GBM: regime i has its own sigma and drift, and
+    transition[i][j] is the probability of moving from regime i to j after a step.
+    Every path starts in initial_regime.
+    """
+    sigmas: Sequence[float]
+    drifts: Sequence[float]
+    transition: Sequence[Sequence[float]]
+    initial_regime: int = 0
+
+    def __post_init__(self):
+        matrix = np.asarray(self.transition, dtype=np.float64)
+        k = len(self.sigmas)
+        if len(self.drifts) != k or matrix.shape != (k, k):
+            raise MathError("Regime switching needs one sigma, drift and transition row per regime.")
+        if np.any(matrix < 0) or not np.allclose(matrix.sum(axis=1), 1.0):
+            raise MathError("Transition rows must be probabilities summing to 1.")
+
+    def regimes(self, rng: np.random.Generator, paths: int, steps: int) -> np.ndarray:
+        """(paths, steps) regime of every step; the chain is sequential in time only."""
+        cumulative = np.cumsum(np.asarray(self.transition, dtype=np.float64), axis=1)
+        cumulative[:, -1] = 1.0
+        draws = rng.random((paths, steps))
+        regimes = np.empty((paths, steps), dtype=np.int64)
+        current = np.full(paths, self.initial_regime, dtype=np.int64)
+        for t in range(steps):
+            regimes[:, t] = current
+            current = (draws[:, t, None] > cumulative[current]).sum(axis=1)
+        return regimes
+
+    def log_returns(self, rng: np.random.Generator, paths: int, steps: int) -> np.ndarray:
+        regimes = self.regimes(rng, paths, steps)
+        sigmas = np.asarray(self.sigmas, dtype=np.float64)
+        drifts = np.asarray(self.drifts, dtype=np.float64)
+        return drifts[regimes] + sigmas[regimes] * rng.standard_normal((paths, steps))
+
+@dataclass
+class Bootstrap:
+    """
+    Block bootstrap of historical log returns: paths are concatenations of random
+    blocks of block_size consecutive returns, which keeps short-range volatility clustering.
+    """
+    returns: np.ndarray
+    block_size: int = 1
+
+    @classmethod
+    def from_prices(cls, prices: Sequence[float], block_size: int = 1) -> "Bootstrap":
+        return cls(np.diff(np.log(np.asarray(prices, dtype=np.float64))), block_size)
+
+    def log_returns(self, rng: np.random.Generator, paths: int, steps: int) -> np.ndarray:
+        history = np.asarray(self.returns, dtype=np.float64)
+        if self.block_size < 1 or history.size < self.block_size:
+            raise MathError("Bootstrap needs at least block_size historical returns.")
+        blocks = -(-steps // self.block_size)
+        starts = rng.integers(0, history.size - self.block_size + 1, (paths, blocks))
+        index = (starts[..., None] + np.arange(self.block_size)).reshape(paths, -1)[:, :steps]
+        return history[index]
+
+def generate_paths(model, paths: int, steps: int, p0: float = 100.0, rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    """(paths, steps + 1) prices starting at p0."""
+    rng = rng or np.random.default_rng()
+    log_prices = np.empty((paths, steps + 1))
+    log_prices[:, 0] = 0.0
+    np.cumsum(model.log_returns(rng, paths, steps), axis=1, out=log_prices[:, 1:])
+    return p0 * np.exp(log_prices)
+
+@dataclass
+class StressResult:
+    """Per-path outcomes; money amounts are in the quote asset, marked at the last price."""
+    pnl: np.ndarray
+    max_drawdown: np.ndarray
+    out_of_range_fraction: np.ndarray
+    fills: np.ndarray
+    fees: np.ndarray = field(repr=False)
+
+    @property
+    def paths(self) -> int:
+        return self.pnl.size
+
+    def percentiles(self, q: Sequence[float] = DEFAULT_PERCENTILES) -> Dict[str, Dict[float, float]]:
+        return {
+            name: dict(zip(q, np.percentile(getattr(self, name), q).tolist()))
+            for name in ("pnl", "max_drawdown", "out_of_range_fraction", "fills")
+        }
+
+    def loss_probability(self) -> float:
+        return float(np.mean(self.pnl < 0))
+
+def simulate_paths(config: GridConfig, prices: np.ndarray) -> StressResult:
+    """
+    Runs config on every row of prices at once: the simulator holds one grid per path,
+    each anchored at its path's first price, and every step is one vectorized update
+    over all paths. Drawdown is the largest fall of marked-to-market PnL from its running
+    peak. Grids do not trail here (VectorGridSimulator has no trailing).
+    """
+    prices = np.asarray(prices, dtype=np.float64)
+    paths = prices.shape[0]
+    sim = VectorGridSimulator(
+        p0=prices[:, 0],
+        range_pct_bottom=config.range_pct_bottom,
+        range_pct_top=config.range_pct_top,
+        grid_intervals=config.grid_intervals,
+        capital=config.initial_capital_amount,
+        fee_rate=config.fee_rate,
+        long_mode=config.mode == "LONG",
+    )
+    peak = np.zeros(paths)
+    max_drawdown = np.zeros(paths)
+    out_of_range = np.zeros(paths, dtype=np.int64)
+    for t in range(prices.shape[1]):
+        price = prices[:, t]
+        sim.step(price)
+        equity = sim.total_pnl(price)
+        np.maximum(peak, equity, out=peak)
+        np.maximum(max_drawdown, peak - equity, out=max_drawdown)
+        out_of_range += (price < sim.p_bottom) | (price > sim.p_top)
+    return StressResult(
+        pnl=sim.total_pnl(prices[:, -1]),
+        max_drawdown=max_drawdown,
+        out_of_range_fraction=out_of_range / prices.shape[1],
+        fills=sim.fill_count,
+        fees=sim.fees_paid,
+    )
+
+def stress_test(
+    config: GridConfig,
+    model,
+    paths: int,
+    steps: int,
+    p0: float = 100.0,
+    seed: Optional[int] = None,
+    batch_paths: int = DEFAULT_BATCH_PATHS
+) -> StressResult:
+    """
+    Draws `paths` price paths of `steps` steps from model and runs config over all of
+    them, batch_paths at a time so memory stays at O(batch_paths * steps).
+    """
+    if paths < 1 or steps < 1:
+        raise MathError("Paths and steps must be >= 1.")
+    rng = np.random.default_rng(seed)
+    results = []
+    for start in range(0, paths, batch_paths):
+        batch = generate_paths(model, min(batch_paths, paths - start), steps, p0, rng)
+        results.append(simulate_paths(config, batch))
+    return StressResult(**{
+        name: np.concatenate([getattr(r, name) for r in results])
+        for name in ("pnl", "max_drawdown", "out_of_range_fraction", "fills", "fees")
+    })
@@ -0,0 +1,196 @@
+"""
+Struct-of-arrays simulator: N grid configurations advanced together on one price feed.
+Requires numpy (pip install .[sim]).
+"""
+from typing import Dict, Iterable, Sequence
+
+import numpy as np
+
+from src.core.config import GridConfig
+from src.core.math import MathError
+
+PHASE_BUY = 0
+PHASE_SELL = 1
+NO_INDEX = -1
+
+class VectorGridSimulator:
+    """
+    Holds the state of N single-order grid bots in NumPy arrays and applies the
+    decision.py rules to all of them per price event:
+    fills are evaluated first (BUY fills at P <= limit, SELL at P >= limit, as in
+    MockExchange), then every idle grid places its next adjacent-level order.
+
+    PnL uses signed average-cost accounting with fees charged when paid. Total PnL
+    (realized + unrealized) therefore matches the FIFO FillLedger; only the split
+    between realized and unrealized can differ while lots are open.
+    """
+
+    def __init__(
+        self,
+        p0,
+        range_pct_bottom,
+        range_pct_top,
+        grid_intervals,
+        capital,
+        fee_rate,
+        long_mode
+    ):
+        p0, bottom_pct, top_pct, n, capital, fee_rate, long_mode = np.broadcast_arrays(
+            np.asarray(p0, dtype=np.float64),
+            np.asarray(range_pct_bottom, dtype=np.float64),
+            np.asarray(range_pct_top, dtype=np.float64),
+            np.asarray(grid_intervals, dtype=np.int64),
+            np.asarray(capital, dtype=np.float64),
+            np.asarray(fee_rate, dtype=np.float64),
+            np.asarray(long_mode, dtype=bool),
+        )
+        if np.any(n < 1):
+            raise MathError("Number of intervals must be at least 1.")
+        if np.any(bottom_pct >= top_pct):
+            raise MathError("Bottom range must be less than top range for every grid.")
+
+        # Grid geometry (same expressions as build_grid)
+        self.p_bottom = p0 * (1 + bottom_pct)
+        self.p_top = p0 * (1 + top_pct)
+        if np.any(self.p_bottom <= 0):
+            raise MathError("Resulting bottom price must be > 0.")
+        self.n_intervals = n.copy()
+        self.ratio = (self.p_top / self.p_bottom) ** (1.0 / n)
+        self._log_ratio = np.log(self.ratio)
+
+        self.capital = capital.copy()
+        self.fee_rate = fee_rate.copy()
+        self.long_mode = long_mode.copy()
+
+        size = p0.size
+        self.size = size
+        # Bot state
+        self.phase = np.where(self.long_mode, PHASE_BUY, PHASE_SELL).astype(np.int8)
+        self.last_filled = np.full(size, NO_INDEX, dtype=np.int64)
+        self.has_order = np.zeros(size, dtype=bool)
+        self.order_price = np.zeros(size)
+        self.order_qty = np.zeros(size)
+        self.order_index = np.full(size, NO_INDEX, dtype=np.int64)
+        # Accounting
+        self.position = np.zeros(size)  # signed base qty
+        self.cost_basis = np.zeros(size)  # signed quote cost of the position
+        self.realized_pnl = np.zeros(size)
+        self.fees_paid = np.zeros(size)
+        self.fill_count = np.zeros(size, dtype=np.int64)
+
+    @classmethod
+    def from_configs(cls, configs: Sequence[GridConfig], p0: float) -> "VectorGridSimulator":
+        return cls(
+            p0=np.full(len(configs), p0),
+            range_pct_bottom=[c.range_pct_bottom for c in configs],
+            range_pct_top=[c.range_pct_top for c in configs],
+            grid_intervals=[c.grid_intervals for c in configs],
+            capital=[c.initial_capital_amount for c in configs],
+            fee_rate=[c.fee_rate for c in configs],
+            long_mode=[c.mode == "LONG" for c in configs],
+        )
+
+    def level_price(self, index: np.ndarray) -> np.ndarray:
+        """Price of level `index` per grid, with exact bounds like build_grid."""
+        price = self.p_bottom * self.ratio ** index
+        price = np.where(index == 0, self.p_bottom, price)
+        return np.where(index == self.n_intervals, self.p_top, price)
+
+    def _initial_index(self, price: float) -> np.ndarray:
+        """Vectorized determine_initial_grid_index."""
+        n = self.n_intervals
+        approx = np.floor(np.log(price / self.p_bottom) / self._log_ratio)
+        approx = np.clip(approx, 0, n).astype(np.int64)
+        # Fix float error at level boundaries: max i with level <= P
+        up = np.minimum(approx + 1, n)
+        below = np.where(self.level_price(up) <= price, up, approx)
+        below = np.where((self.level_price(below) > price) & (below > 0), below - 1, below)
+        # SELL: min i with level >= P
+        above = np.where(self.level_price(below) >= price, below, np.minimum(below + 1, n))
+
+        index = np.where(self.phase == PHASE_BUY, below, above)
+        index = np.where(price < self.p_bottom, 0, index)
+        return np.where(price > self.p_top, n, index)
+
+    def _apply_fills(self, price: float):
+        buy = self.phase == PHASE_BUY
+        filled = self.has_order & np.where(buy, price <= self.order_price, price >= self.order_price)
+        if not filled.any():
+            return
+
+        fill_price = self.order_price
+        dq = np.where(buy, self.order_qty, -self.order_qty) * filled
+        fee = fill_price * np.abs(dq) * self.fee_rate
+
+        # Signed average-cost position update
+        same_side = (self.position == 0) | (np.sign(dq) == np.sign(self.position))
+        closing_qty = np.where(same_side, 0.0, np.minimum(np.abs(dq), np.abs(self.position)))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            avg_cost = np.where(self.position != 0, self.cost_basis / self.position, 0.0)
+        pos_sign = np.sign(self.position)
+        self.realized_pnl += closing_qty * (fill_price - avg_cost) * pos_sign - fee
+        self.position -= pos_sign * closing_qty
+        self.cost_basis = avg_cost * self.position
+        opening = dq - np.sign(dq) * closing_qty
+        self.position += opening
+        self.cost_basis += fill_price * opening
+        self.fees_paid += fee
+        self.fill_count += filled
+
+        # transition_state_on_fill
+        self.last_filled = np.where(filled, self.order_index, self.last_filled)
+        self.phase = np.where(filled, 1 - self.phase, self.phase).astype(np.int8)
+        self.has_order &= ~filled
+
+    def _place_orders(self, price: float):
+        idle = ~self.has_order
+        if not idle.any():
+            return
+
+        adjacent = np.where(self.phase == PHASE_BUY, self.last_filled - 1, self.last_filled + 1)
+        first = self.last_filled == NO_INDEX
+        # Only grids that never filled need the (costlier) initial level search
+        target = np.where(first, self._initial_index(price), adjacent) if (idle & first).any() else adjacent
+        place = idle & (target >= 0) & (target <= self.n_intervals)
+
+        order_price = self.level_price(np.clip(target, 0, self.n_intervals))
+        # calculate_order_qty: LONG splits quote capital, SHORT_INVERTED splits base capital
+        per_grid = self.capital / self.n_intervals
+        qty = np.where(self.long_mode, per_grid / order_price, per_grid)
+
+        self.order_price = np.where(place, order_price, self.order_price)
+        self.order_qty = np.where(place, qty, self.order_qty)
+        self.order_index = np.where(place, target, self.order_index)
+        self.has_order |= place
+
+    def state_arrays(self) -> Dict[str, np.ndarray]:
+        """All geometry and state arrays, enough to resume the simulation later."""
+        return {name: value.copy() for name, value in vars(self).items() if isinstance(value, np.ndarray)}
+
+    @classmethod
+    def from_state_arrays(cls, arrays: Dict[str, np.ndarray]) -> "VectorGridSimulator":
+        sim = cls.__new__(cls)
+        for name, value in arrays.items():
+            setattr(sim, name, np.array(value))
+        sim.size = sim.p_bottom.size
+        return sim
+
+    def step(self, price):
+        """
+        Advances every grid by one price event (one orchestrator tick each). price is
+        one price for all grids, or an array with each grid's own price (e.g. one grid
+        per Monte Carlo path).
+        """
+        self._apply_fills(price)
+        self._place_orders(price)
+
+    def run(self, prices: Iterable[float]) -> "VectorGridSimulator":
+        for price in prices:
+            self.step(float(price))
+        return self
+
+    def unrealized_pnl(self, mark_price: float) -> np.ndarray:
+        return self.position * mark_price - self.cost_basis
+
+    def total_pnl(self, mark_price: float) -> np.ndarray:
+        return self.realized_pnl + self.unrealized_pnl(mark_price)
@@ -0,0 +1,387 @@
+"""
+Minimal local stand-in for the Binance Spot REST and WebSocket APIs.
+Used by tests and benchmarks to exercise the real HTTP and WebSocket paths of the
+Binance adapters without touching the network.
+"""
+import json
+import time
+import hmac
+import socket
+import hashlib
+import threading
+import socketserver
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qsl
+from typing import Dict, Any, Optional, Tuple
+
+from src.exchange.websocket import WebSocketConnection, WebSocketClosed, accept_key, read_http_headers
+
+# WebSocket API methods served, with the REST route that implements each
+WS_ROUTES = {
+    "order.place": ("POST", "/api/v3/order"),
+    "order.cancel": ("DELETE", "/api/v3/order"),
+    "order.status": ("GET", "/api/v3/order"),
+    "order.cancelReplace": ("POST", "/api/v3/order/cancelReplace"),
+}
+
+class BinanceStandIn:
+    """
+    Serves a small subset of /api/v3 on 127.0.0.1 with signature and recvWindow
+    checks that mirror the real exchange closely enough for adapter testing, plus the
+    order methods of the WebSocket API on a second port (ws_url), backed by the same book.
+    WebSocket requests are answered from their own threads, so answers can overtake
+    each other as on the real API.
+    """
+
+    def __init__(
+        self,
+        api_secret: str = "secret",
+        price: float = 100.0,
+        clock_skew_ms: int = 0,
+        latency_s: float = 0.0,
+    ):
+        self.api_secret = api_secret
+        self.price = price
+        # Server clock = local clock + skew. Positive skew means the local clock is behind.
+        self.clock_skew_ms = clock_skew_ms
+        self.latency_s = latency_s
+
+        self.orders: Dict[str, dict] = {}
+        self.balances: Dict[str, Dict[str, float]] = {
+            "BTC": {"free": 1.0, "locked": 0.0},
+            "USDT": {"free": 1000.0, "locked": 0.0},
+        }
+        self.request_count = 0
+        self.rejected_timestamp = 0
+        self.rejected_signature = 0
+        self.paths: list = []
+        # Klines as [openTime, open, high, low, close(, volume)]; empty means one flat 1m kline at `price`
+        self.klines: list = []
+        self.trades: list = []
+        # Order placements that are executed but answered with 503 -1007 / answered late
+        self.lost_order_responses = 0
+        self.order_response_delay_s = 0.0
+        # Requests of any kind answered with 503 before being processed
+        self.server_error_responses = 0
+
+        self._order_counter = 0
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self._ws_server: Optional[socketserver.ThreadingTCPServer] = None
+        self._ws_connections: list = []
+        self.ws_url: Optional[str] = None
+
+    # --- lifecycle ---
+
+    def start(self) -> str:
+        """Starts serving on an ephemeral port and returns the base URL."""
+        standin = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _handle(self):
+                status, body = standin.dispatch(self.command, self.path)
+                payload = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            do_GET = _handle
+            do_POST = _handle
+            do_DELETE = _handle
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        self.ws_url = self._start_ws()
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def _start_ws(self) -> str:
+        standin = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                self.rfile.readline()
+                headers = read_http_headers(self.rfile)
+                self.wfile.write((
+                    "HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+                    f"Sec-WebSocket-Accept: {accept_key(headers['sec-websocket-key'])}\r\n\r\n"
+                ).encode("ascii"))
+                self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                conn = WebSocketConnection(self.request, self.rfile, mask=False)
+                with standin._lock:
+                    standin._ws_connections.append(conn)
+                try:
+                    while True:
+                        message = conn.recv()
+                        threading.Thread(target=standin._answer_ws, args=(conn, message), daemon=True).start()
+                except WebSocketClosed:
+                    pass
+                finally:
+                    with standin._lock:
+                        standin._ws_connections.remove(conn)
+
+        self._ws_server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), Handler)
+        self._ws_server.daemon_threads = True
+        threading.Thread(target=self._ws_server.serve_forever, daemon=True).start()
+        return f"ws://127.0.0.1:{self._ws_server.server_address[1]}/ws-api/v3"
+
+    def drop_ws_connections(self):
+        """Test helper: closes every WebSocket connection, as on a network failure."""
+        with self._lock:
+            connections = list(self._ws_connections)
+        for conn in connections:
+            conn.close()
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._ws_server:
+            self.drop_ws_connections()
+            self._ws_server.shutdown()
+            self._ws_server.server_close()
+            self._ws_server = None
+
+    def __enter__(self) -> "BinanceStandIn":
+        self.base_url = self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    # --- request handling ---
+
+    def server_time_ms(self) -> int:
+        return int(time.time() * 1000) + self.clock_skew_ms
+
+    def dispatch(self, method: str, raw_path: str) -> Tuple[int, Any]:
+        if self.latency_s > 0:
+            time.sleep(self.latency_s)
+
+        parts = urlsplit(raw_path)
+        path = parts.path
+        params = dict(parse_qsl(parts.query, keep_blank_values=True))
+
+        with self._lock:
+            self.request_count += 1
+            self.paths.append((method, path))
+            if self.server_error_responses > 0:
+                self.server_error_responses -= 1
+                return 503, {"code": -1001, "msg": "Internal error; unable to process your request."}
+
+        route = (method, path)
+        if route == ("GET", "/api/v3/time"):
+            return 200, {"serverTime": self.server_time_ms()}
+        if route == ("GET", "/api/v3/ticker/price"):
+            return 200, {"symbol": params.get("symbol"), "price": f"{self.price:.8f}"}
+        if route == ("GET", "/api/v3/exchangeInfo"):
+            return 200, self._exchange_info(params.get("symbol", "BTCUSDT"))
+        if route == ("GET", "/api/v3/klines"):
+            return 200, self._klines(params)
+
+        payload, _, signature = parts.query.rpartition("&signature=")
+        error = self._verify_signed(payload, signature, params)
+        if error:
+            return 400, error
+        return self._dispatch_signed(route, params)
+
+    def dispatch_ws(self, message: dict) -> dict:
+        """Answers one WebSocket API request message."""
+        if self.latency_s > 0:
+            time.sleep(self.latency_s)
+
+        method = message.get("method")
+        params = {k: str(v) for k, v in message.get("params", {}).items()}
+        with self._lock:
+            self.request_count += 1
+            self.paths.append(("WS", method))
+
+        route = WS_ROUTES.get(method)
+        if route is None:
+            status, body = 400, {"code": -1, "msg": f"Unknown method {method}"}
+        else:
+            # WebSocket API signatures cover the other parameters sorted by name
+            payload = "&".join(f"{k}={params[k]}" for k in sorted(params) if k != "signature")
+            error = self._verify_signed(payload, params.get("signature", ""), params)
+            status, body = (400, error) if error else self._dispatch_signed(route, params)
+        answer = {"id": message.get("id"), "status": status}
+        answer["result" if status == 200 else "error"] = body
+        return answer
+
+    def _answer_ws(self, conn: WebSocketConnection, message: str):
+        try:
+            conn.send_text(json.dumps(self.dispatch_ws(json.loads(message))))
+        except WebSocketClosed:
+            pass
+
+    def _dispatch_signed(self, route: Tuple[str, str], params: Dict[str, str]) -> Tuple[int, Any]:
+        method, path = route
+        if route == ("POST", "/api/v3/order"):
+            return self._place_order(params)
+        if route == ("POST", "/api/v3/order/cancelReplace"):
+            return self._cancel_replace(params)
+        if route == ("GET", "/api/v3/order"):
+            return self._query_order(params)
+        if route == ("DELETE", "/api/v3/order"):
+            return self._cancel_order(params)
+        if route == ("GET", "/api/v3/openOrders"):
+            return 200, [
+                dict(o) for o in self.orders.values()
+                if o["status"] == "NEW" and o["symbol"] == params.get("symbol")
+            ]
+        if route == ("GET", "/api/v3/myTrades"):
+            start = int(params.get("startTime", 0))
+            return 200, [
+                t for t in self.trades
+                if t["symbol"] == params.get("symbol") and t["time"] >= start
+            ][-int(params.get("limit", 500)):]
+        if route == ("GET", "/api/v3/account"):
+            return 200, {
+                "balances": [
+                    {"asset": a, "free": f"{b['free']:.8f}", "locked": f"{b['locked']:.8f}"}
+                    for a, b in self.balances.items()
+                ]
+            }
+        return 404, {"code": -1, "msg": f"Unknown route {method} {path}"}
+
+    def _verify_signed(self, payload: str, signature: str, params: Dict[str, str]) -> Optional[dict]:
+        if "signature" not in params:
+            return {"code": -1102, "msg": "Mandatory parameter 'signature' was not sent."}
+
+        expected = hmac.new(
+            self.api_secret.encode("utf-8"), payload.encode("utf-8"), hashlib.sha256
+        ).hexdigest()
+        if not hmac.compare_digest(expected, signature):
+            with self._lock:
+                self.rejected_signature += 1
+            return {"code": -1022, "msg": "Signature for this request is not valid."}
+
+        timestamp = int(params.get("timestamp", 0))
+        recv_window = int(params.get("recvWindow", 5000))
+        now = self.server_time_ms()
+        if timestamp >= now + 1000 or now - timestamp > recv_window:
+            with self._lock:
+                self.rejected_timestamp += 1
+            return {
+                "code": -1021,
+                "msg": "Timestamp for this request is outside of the recvWindow.",
+            }
+        return None
+
+    def _exchange_info(self, symbol: str) -> dict:
+        return {
+            "symbols": [{
+                "symbol": symbol,
+                # Three-letter base assets only (BTCUSDT, ETHGBP, ...)
+                "baseAsset": symbol[:3],
+                "quoteAsset": symbol[3:],
+                "filters": [
+                    {"filterType": "PRICE_FILTER", "tickSize": "0.01"},
+                    {"filterType": "LOT_SIZE", "stepSize": "0.00001", "minQty": "0.00001"},
+                    {"filterType": "NOTIONAL", "minNotional": "5.0"},
+                ],
+            }]
+        }
+
+    def _klines(self, params: Dict[str, str]) -> list:
+        klines = self.klines
+        if not klines:
+            minute = self.server_time_ms() // 60_000 * 60_000
+            klines = [[minute, self.price, self.price, self.price, self.price]]
+        start = int(params.get("startTime", 0))
+        end = int(params.get("endTime", 2**62))
+        limit = int(params.get("limit", 500))
+        rows = [k for k in klines if start <= k[0] <= end][:limit]
+        # Binance returns prices as strings plus volume/close-time columns
+        return [
+            [k[0]] + [f"{v:.8f}" for v in k[1:5]] + [f"{k[5] if len(k) > 5 else 0:.8f}", k[0] + 59_999]
+            for k in rows
+        ]
+
+    def fill_order(self, order_id: str):
+        """Test helper: executes a resting order in full, as if matched on the book."""
+        with self._lock:
+            order = self.orders[order_id]
+            order["status"] = "FILLED"
+            self.trades.append({
+                "symbol": order["symbol"],
+                "orderId": order["orderId"],
+                "price": order["price"],
+                "qty": order["origQty"],
+                "isBuyer": order["side"] == "BUY",
+                "time": self.server_time_ms(),
+            })
+
+    def _place_order(self, params: Dict[str, str]) -> Tuple[int, Any]:
+        with self._lock:
+            client_id = params.get("newClientOrderId")
+            if client_id and any(
+                o["clientOrderId"] == client_id and o["status"] == "NEW" for o in self.orders.values()
+            ):
+                return 400, {"code": -2010, "msg": "Duplicate order sent."}
+            self._order_counter += 1
+            order_id = str(self._order_counter)
+            self.orders[order_id] = {
+                "orderId": int(order_id),
+                "clientOrderId": client_id or f"standin_{order_id}",
+                "symbol": params.get("symbol"),
+                "side": params.get("side"),
+                "price": params.get("price"),
+                "origQty": params.get("quantity"),
+                "status": "NEW",
+            }
+            lost = self.lost_order_responses > 0
+            if lost:
+                self.lost_order_responses -= 1
+        if lost:
+            return 503, {
+                "code": -1007,
+                "msg": "Timeout waiting for response from backend server. "
+                       "Send status unknown; execution status unknown.",
+            }
+        if self.order_response_delay_s > 0:
+            time.sleep(self.order_response_delay_s)
+        return 200, dict(self.orders[order_id])
+
+    def _cancel_replace(self, params: Dict[str, str]) -> Tuple[int, Any]:
+        order = self.orders.get(params.get("cancelOrderId", ""))
+        if order is None or order["status"] != "NEW":
+            return 409, {
+                "code": -2022,
+                "msg": "Order cancel-replace failed.",
+                "data": {"cancelResult": "FAILURE", "newOrderResult": "NOT_ATTEMPTED"},
+            }
+        order["status"] = "CANCELED"
+        _, new_order = self._place_order(params)
+        return 200, {
+            "cancelResult": "SUCCESS",
+            "newOrderResult": "SUCCESS",
+            "cancelResponse": dict(order),
+            "newOrderResponse": new_order,
+        }
+
+    def _query_order(self, params: Dict[str, str]) -> Tuple[int, Any]:
+        if "origClientOrderId" in params:
+            order = next(
+                (o for o in self.orders.values() if o["clientOrderId"] == params["origClientOrderId"]), None
+            )
+        else:
+            order = self.orders.get(params.get("orderId", ""))
+        if order is None:
+            return 400, {"code": -2013, "msg": "Order does not exist."}
+        return 200, dict(order)
+
+    def _cancel_order(self, params: Dict[str, str]) -> Tuple[int, Any]:
+        order = self.orders.get(params.get("orderId", ""))
+        if order is None or order["status"] != "NEW":
+            return 400, {"code": -2011, "msg": "Unknown order sent."}
+        order["status"] = "CANCELED"
+        return 200, dict(order)
@@ -0,0 +1,109 @@
+import os
+import pytest
+from src.core.config import AppConfig, GridConfig
+from src.exchange.mock import MockExchange
+from src.bot.loop import GridBotOrchestrator
+from src.bot.archive import FillArchive, build_report, format_report, iter_chunks, partition_rows
+
+DAY_MS = 86_400_000
+# 2024-01-01T00:00:00Z
+T0 = 1_704_067_200_000
+
+def test_report_totals_per_symbol(tmp_path):
+    archive = FillArchive(str(tmp_path))
+    archive.record("BTCUSDT", "placed", "BUY", 100.0, 0.5, 2, time_ms=T0)
+    archive.record("BTCUSDT", "filled", "BUY", 100.0, 0.5, 2, fee=0.05, time_ms=T0 + 1)
+    archive.record("BTCUSDT", "filled", "SELL", 105.0, 0.5, 3, fee=0.0525, realized_pnl=2.3975, time_ms=T0 + 2)
+    archive.record("BTCUSDT", "repriced", "BUY", 101.0, 0.5, 2, time_ms=T0 + 3)
+    archive.record("ETHUSDT", "filled", "SELL", 10.0, 2.0, -1, fee=0.02, time_ms=T0 + 4)
+    archive.record("ETHUSDT", "closed", "BUY", 9.5, 2.0, -2, time_ms=T0 + 5)
+
+    report = build_report(str(tmp_path))
+    btc = report.symbols["BTCUSDT"]
+    assert (btc.fills, btc.buys, btc.sells) == (2, 1, 1)
+    assert (btc.placed, btc.repriced, btc.closed) == (1, 1, 0)
+    assert btc.turnover == pytest.approx(50.0 + 52.5)
+    assert btc.fees == pytest.approx(0.1025)
+    assert btc.realized_pnl == pytest.approx(2.3975)
+    assert btc.fills_per_level == {2: 1, 3: 1}
+    assert report.symbols["ETHUSDT"].fills_per_level == {-1: 1}
+    assert report.symbols["ETHUSDT"].closed == 1
+
+    only_eth = build_report(str(tmp_path), symbols=["ETHUSDT"])
+    assert list(only_eth.symbols) == ["ETHUSDT"]
+    text = format_report(report)
+    assert "TOTAL" in text and "BTCUSDT fills per level: 2:1 3:1" in text
+
+def test_days_are_partitioned_and_pnl_is_cumulative(tmp_path):
+    archive = FillArchive(str(tmp_path))
+    for day, pnl in enumerate([1.0, -0.5, 2.0]):
+        archive.record("BTCUSDT", "filled", "SELL", 100.0, 1.0, 0, realized_pnl=pnl, time_ms=T0 + day * DAY_MS)
+        archive.record("ETHUSDT", "filled", "SELL", 10.0, 1.0, 0, realized_pnl=pnl, time_ms=T0 + day * DAY_MS + 1)
+
+    assert sorted(os.listdir(tmp_path / "BTCUSDT")) == ["2024-01-01", "2024-01-02", "2024-01-03"]
+    report = build_report(str(tmp_path))
+    assert report.pnl_curve == [
+        ("2024-01-01", pytest.approx(2.0)), ("2024-01-02", pytest.approx(1.0)), ("2024-01-03", pytest.approx(5.0))
+    ]
+
+    ranged = build_report(str(tmp_path), start_day="2024-01-02", end_day="2024-01-02")
+    assert ranged.pnl_curve == [("2024-01-02", pytest.approx(-1.0))]
+
+def test_streams_in_bounded_chunks(tmp_path):
+    archive = FillArchive(str(tmp_path))
+    for i in range(25):
+        archive.record("BTCUSDT", "filled", "BUY", 100.0 + i, 1.0, i % 3, time_ms=T0 + i)
+
+    path = str(tmp_path / "BTCUSDT" / "2024-01-01")
+    chunks = list(iter_chunks(path, ["price", "level"], chunk_rows=10))
+    assert [len(c["price"]) for c in chunks] == [10, 10, 5]
+    assert chunks[2]["price"][-1] == 124.0
+
+    report = build_report(str(tmp_path), chunk_rows=4)
+    assert report.symbols["BTCUSDT"].fills_per_level == {0: 9, 1: 8, 2: 8}
+    assert report.symbols["BTCUSDT"].turnover == pytest.approx(sum(100.0 + i for i in range(25)))
+
+def test_partial_row_from_a_crash_is_dropped(tmp_path):
+    FillArchive(str(tmp_path)).record("BTCUSDT", "filled", "BUY", 100.0, 1.0, 0, time_ms=T0)
+    path = tmp_path / "BTCUSDT" / "2024-01-01"
+    # A crash after appending only some columns of the second row
+    with open(path / "time_ms.bin", "ab") as f:
+        f.write((T0 + 1).to_bytes(8, "little"))
+    with open(path / "event.bin", "ab") as f:
+        f.write(b"\x01")
+    assert partition_rows(str(path)) == 1
+    assert build_report(str(tmp_path)).symbols["BTCUSDT"].fills == 1
+
+    # The next writer truncates the partial row before appending
+    FillArchive(str(tmp_path)).record("BTCUSDT", "filled", "SELL", 101.0, 1.0, 1, time_ms=T0 + 2)
+    assert os.path.getsize(path / "time_ms.bin") == 16
+    report = build_report(str(tmp_path))
+    assert report.symbols["BTCUSDT"].fills_per_level == {0: 1, 1: 1}
+
+def test_orchestrator_archives_round_trip(tmp_path):
+    config = AppConfig(grid=GridConfig(
+        symbol="BTCUSDT",
+        mode="LONG",
+        initial_capital_amount=100.0,
+        range_pct_bottom=-0.10,
+        range_pct_top=0.10,
+        grid_intervals=4,
+        fee_rate=0.001
+    ), dry_run=False)
+    exchange = MockExchange(current_price=100.0)
+    archive_dir = str(tmp_path / "archive")
+    bot = GridBotOrchestrator(config, exchange, state_file=str(tmp_path / "state.json"), archive=FillArchive(archive_dir))
+    bot.initialize()
+
+    bot.execute_tick()  # BUY at level 2
+    exchange.set_price(99.0)
+    bot.execute_tick()  # BUY fills, SELL at level 3 placed
+    exchange.set_price(bot.levels[3])
+    bot.execute_tick()  # SELL fills
+
+    report = build_report(archive_dir).symbols["BTCUSDT"]
+    assert report.placed >= 2
+    assert (report.fills, report.buys, report.sells) == (2, 1, 1)
+    assert report.fills_per_level == {2: 1, 3: 1}
+    assert report.realized_pnl == pytest.approx(bot.state.realized_pnl)
+    assert report.fees == pytest.approx(report.turnover * 0.001)
@@ -0,0 +1,96 @@
+import random
+import pytest
+from dataclasses import replace
+
+np = pytest.importorskip("numpy")
+
+from src.core.config import GridConfig, ConfigError  # noqa: E402
+from src.sim import backtest  # noqa: E402
+from src.sim.backtest import BacktestCache, run_backtest, backtest_key  # noqa: E402
+
+CONFIG = GridConfig(mode="LONG", grid_intervals=8, range_pct_bottom=-0.05, range_pct_top=0.05)
+
+def _feed(n=600, seed=11):
+    rng = random.Random(seed)
+    prices = [100.0]
+    for _ in range(n - 1):
+        prices.append(prices[-1] * (1 + rng.gauss(0, 0.005)))
+    return np.arange(n, dtype=np.int64) * 60_000, np.array(prices)
+
+def test_cache_hit_skips_simulation(tmp_path, monkeypatch):
+    ts, prices = _feed()
+    cache = BacktestCache(str(tmp_path))
+    first = run_backtest(CONFIG, "BTCUSDT", ts, prices, 0, int(ts[-1]) + 1, cache=cache)
+    assert first.fill_count > 0
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("simulator should not run on a cache hit")
+    monkeypatch.setattr(backtest.VectorGridSimulator, "from_configs", _fail)
+    # A fresh cache object on the same directory reads the persisted index
+    again = run_backtest(CONFIG, "BTCUSDT", ts, prices, 0, int(ts[-1]) + 1, cache=BacktestCache(str(tmp_path)))
+    assert again.key == first.key
+    assert again.total_pnl == first.total_pnl
+    assert again.config == CONFIG
+
+def test_key_depends_on_config_and_range():
+    base = backtest_key(CONFIG, "BTCUSDT", 0, 100)
+    assert backtest_key(CONFIG, "BTCUSDT", 0, 101) != base
+    assert backtest_key(CONFIG, "ETHUSDT", 0, 100) != base
+    other = GridConfig(mode="LONG", grid_intervals=9, range_pct_bottom=-0.05, range_pct_top=0.05)
+    assert backtest_key(other, "BTCUSDT", 0, 100) != base
+
+def test_extended_range_resumes_cached_prefix(tmp_path):
+    ts, prices = _feed()
+    cache = BacktestCache(str(tmp_path))
+    middle = int(ts[300])
+    end = int(ts[-1]) + 1
+    run_backtest(CONFIG, "BTCUSDT", ts, prices, 0, middle, cache=cache)
+    extended = run_backtest(CONFIG, "BTCUSDT", ts, prices, 0, end, cache=cache)
+    full = run_backtest(CONFIG, "BTCUSDT", ts, prices, 0, end)
+
+    assert extended.events == full.events
+    assert extended.fill_count == full.fill_count
+    assert extended.realized_pnl == pytest.approx(full.realized_pnl)
+    assert extended.total_pnl == pytest.approx(full.total_pnl)
+
+def test_lru_eviction_bounds_disk_usage(tmp_path):
+    ts, prices = _feed(n=200)
+    cache = BacktestCache(str(tmp_path))
+    first = run_backtest(CONFIG, "BTCUSDT", ts, prices, 0, int(ts[100]), cache=cache)
+    entry_size = cache.total_bytes
+    cache.max_bytes = int(entry_size * 2.5)
+
+    second = run_backtest(CONFIG, "ETHUSDT", ts, prices, 0, int(ts[100]), cache=cache)
+    cache.get(first.key)  # first is now more recently used than second
+    third = run_backtest(CONFIG, "SOLUSDT", ts, prices, 0, int(ts[100]), cache=cache)
+
+    assert cache.total_bytes <= cache.max_bytes
+    assert cache.get(second.key) is None
+    assert cache.get(first.key) is not None
+    assert cache.get(third.key) is not None
+
+def test_entry_from_an_older_config_schema_is_a_miss(tmp_path):
+    import json
+    ts, prices = _feed(n=200)
+    cache = BacktestCache(str(tmp_path))
+    first = run_backtest(CONFIG, "BTCUSDT", ts, prices, 0, int(ts[-1]) + 1, cache=cache)
+    # Rewrite the entry as if a GridConfig field had since been removed
+    path = cache._path(first.key)
+    with np.load(path, allow_pickle=False) as data:
+        arrays = {name: data[name] for name in data.files}
+    meta = json.loads(str(arrays["__meta__"]))
+    meta["config"]["retired_option"] = 1
+    arrays["__meta__"] = np.array(json.dumps(meta))
+    with open(path, "wb") as f:
+        np.savez(f, **arrays)
+
+    assert cache.get(first.key) is None
+    again = run_backtest(CONFIG, "BTCUSDT", ts, prices, 0, int(ts[-1]) + 1, cache=cache)
+    assert again.total_pnl == pytest.approx(first.total_pnl)
+    assert cache.get(first.key) is not None
+
+def test_trailing_config_is_rejected(tmp_path):
+    ts, prices = _feed()
+    with pytest.raises(ConfigError, match="Trailing"):
+        run_backtest(replace(CONFIG, trailing=True), "BTCUSDT", ts, prices, 0, int(ts[-1]) + 1,
+                     cache=BacktestCache(str(tmp_path)))
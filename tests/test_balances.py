@@ -0,0 +1,88 @@
+import pytest
+from src.core.config import AppConfig, GridConfig
+from src.exchange.mock import MockExchange
+from src.exchange.base import SymbolRules
+from src.bot.loop import GridBotOrchestrator
+from src.bot.balances import BalanceLedger
+from src.bot.reconcile import reconcile_bots
+
+def test_ledger_reserve_fill_release():
+    ledger = BalanceLedger()
+    ledger.reconcile({"BTC": 1.0, "USDT": 1000.0})
+    
+    ledger.reserve("o1", "BTC", "USDT", "BUY", 100.0, 2.0)
+    assert ledger.free("USDT") == pytest.approx(800.0)
+    assert ledger.locked("USDT") == pytest.approx(200.0)
+    ledger.fill("o1", "BTC", "USDT", "BUY", 100.0, 2.0, fee_rate=0.001)
+    assert ledger.locked("USDT") == pytest.approx(0.0)
+    assert ledger.free("BTC") == pytest.approx(1.0 + 2.0 * 0.999)
+    
+    ledger.reserve("o2", "BTC", "USDT", "SELL", 110.0, 1.5)
+    assert ledger.free("BTC") == pytest.approx(1.498)
+    ledger.release("o2")
+    assert ledger.free("BTC") == pytest.approx(2.998)
+    assert ledger.totals() == pytest.approx({"BTC": 2.998, "USDT": 800.0})
+
+def test_ledger_reconcile_reports_drift_and_keeps_reservations():
+    ledger = BalanceLedger(reconcile_interval_s=60)
+    ledger.reconcile({"BTC": 1.0, "USDT": 1000.0})
+    ledger.reserve("o1", "BTC", "USDT", "BUY", 100.0, 1.0)
+    assert not ledger.reconcile_due(now=ledger._last_reconcile + 30)
+    assert ledger.reconcile_due(now=ledger._last_reconcile + 61)
+    
+    drift = ledger.reconcile({"BTC": 1.0, "USDT": 990.0})
+    assert drift == {"USDT": pytest.approx(-10.0)}
+    assert ledger.locked("USDT") == pytest.approx(100.0)
+    assert ledger.free("USDT") == pytest.approx(890.0)
+    
+    ledger.mark_stale()
+    assert ledger.reconcile_due()
+
+class _AccountCountingExchange(MockExchange):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.balance_calls = 0
+
+    def get_balances(self):
+        self.balance_calls += 1
+        return dict(super().get_balances())
+
+def _live_bot(tmp_path, exchange, capital=100.0, symbol="BTCUSDT"):
+    config = AppConfig(
+        grid=GridConfig(symbol=symbol, mode="LONG", grid_intervals=4, fee_rate=0.0,
+                        initial_capital_amount=capital),
+        dry_run=False, api_key="key", api_secret="secret"
+    )
+    bot = GridBotOrchestrator(config, exchange, state_file=str(tmp_path / "s.json"), balances=BalanceLedger())
+    bot.initialize()
+    reconcile_bots([bot], exchange)
+    return bot
+
+def test_orchestrator_tracks_balances_without_account_calls(tmp_path):
+    exchange = _AccountCountingExchange(current_price=100.0)
+    bot = _live_bot(tmp_path, exchange)
+    for price in (100.0, 99.0, 103.0, 101.0, 98.0, 97.0, 101.0):
+        exchange.set_price(price)
+        bot.execute_tick()
+    
+    assert bot.state.realized_pnl != 0 or bot.ledger.open_lots()
+    assert exchange.balance_calls == 1
+    assert bot.state.estimated_balances == pytest.approx(exchange.get_balances())
+
+def test_orchestrator_skips_unfunded_intent(tmp_path):
+    exchange = MockExchange(current_price=100.0)
+    exchange._balances["USDT"] = 10.0
+    bot = _live_bot(tmp_path, exchange, capital=1000.0)
+    bot.execute_tick()
+    assert bot.state.active_order is None
+    assert exchange.get_open_orders("BTCUSDT") == []
+
+def test_orchestrator_funds_pairs_by_their_exchange_assets(tmp_path):
+    exchange = MockExchange(current_price=100.0)
+    exchange.add_symbol_rules("BTCBRL", SymbolRules(0.01, 0.00001, 0.0, 0.0, base_asset="BTC", quote_asset="BRL"))
+    exchange._balances["BRL"] = 500.0
+    bot = _live_bot(tmp_path, exchange, symbol="BTCBRL")
+    bot.execute_tick()
+    order = bot.state.active_order
+    assert order.side == "BUY"
+    assert bot.balances.locked("BRL") == pytest.approx(order.price * order.qty)
@@ -3,7 +3,7 @@ from unittest.mock import patch, MagicMock
 from src.exchange.binance import BinanceSpotAdapter
 from src.exchange.base import ExchangeError
 
-@patch("src.exchange.binance.requests.get")
+@patch("requests.get")
 def test_binance_get_price(mock_get):
     adapter = BinanceSpotAdapter()
     
@@ -20,7 +20,7 @@ def test_binance_get_price(mock_get):
     assert "ticker/price" in args[0]
     assert kwargs["params"]["symbol"] == "BTCUSDT"
 
-@patch("src.exchange.binance.requests.get")
+@patch("requests.get")
 def test_binance_get_symbol_rules(mock_get):
     adapter = BinanceSpotAdapter()
     
@@ -28,6 +28,8 @@ def test_binance_get_symbol_rules(mock_get):
     mock_response.status_code = 200
     mock_response.json.return_value = {
         "symbols": [{
+            "baseAsset": "BTC",
+            "quoteAsset": "USDT",
             "filters": [
                 {"filterType": "PRICE_FILTER", "tickSize": "0.01"},
                 {"filterType": "LOT_SIZE", "stepSize": "0.00001", "minQty": "0.00001"},
@@ -41,12 +43,13 @@ def test_binance_get_symbol_rules(mock_get):
     assert rules.tick_size == 0.01
     assert rules.step_size == 0.00001
     assert rules.min_notional == 10.0
+    assert (rules.base_asset, rules.quote_asset) == ("BTC", "USDT")
     
     # Should cache it, calling again shouldn't hit network
     adapter.get_symbol_rules("BTCUSDT")
     assert mock_get.call_count == 1
 
-@patch("src.exchange.binance.requests.post")
+@patch("requests.post")
 def test_binance_place_limit_order(mock_post):
     adapter = BinanceSpotAdapter(api_key="key", api_secret="secret")
     
@@ -65,7 +68,7 @@ def test_binance_place_limit_order(mock_post):
     assert "signature" in params
     assert "timestamp" in params
 
-@patch("src.exchange.binance.requests.get")
+@patch("requests.get")
 def test_binance_get_order_status(mock_get):
     adapter = BinanceSpotAdapter(api_key="key", api_secret="secret")
     
@@ -82,3 +85,194 @@ def test_binance_unsigned_post_raises():
     # No keys provided
     with pytest.raises(ExchangeError, match="API keys required"):
         adapter.place_limit_order("BTC", "BUY", 10, 1)
+
+@patch("requests.post")
+def test_binance_signature_covers_sent_query(mock_post):
+    import hmac
+    import hashlib
+    from urllib.parse import urlencode
+    adapter = BinanceSpotAdapter(api_key="key", api_secret="secret", recv_window_ms=3000)
+    
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = {"orderId": 1}
+    mock_post.return_value = mock_response
+    
+    adapter.place_limit_order("BTCUSDT", "SELL", price=50000.0, qty=0.5)
+    
+    params = dict(mock_post.call_args.kwargs["params"])
+    signature = params.pop("signature")
+    assert params["recvWindow"] == 3000
+    expected = hmac.new(b"secret", urlencode(params).encode(), hashlib.sha256).hexdigest()
+    assert signature == expected
+
+def test_binance_time_offset_applied_to_timestamp():
+    from tests.binance_standin import BinanceStandIn
+    with BinanceStandIn(clock_skew_ms=60_000) as standin:
+        adapter = BinanceSpotAdapter(api_key="key", api_secret="secret", base_url=standin.base_url)
+        offset = adapter.sync_time()
+        assert offset == pytest.approx(60_000, abs=500)
+        
+        order_id = adapter.place_limit_order("BTCUSDT", "BUY", price=90.0, qty=0.1)
+        assert adapter.get_order_status("BTCUSDT", order_id) == "OPEN"
+        assert standin.rejected_timestamp == 0
+        assert standin.rejected_signature == 0
+
+def test_binance_resyncs_and_retries_on_timestamp_rejection():
+    from tests.binance_standin import BinanceStandIn
+    with BinanceStandIn(clock_skew_ms=-30_000) as standin:
+        adapter = BinanceSpotAdapter(api_key="key", api_secret="secret", base_url=standin.base_url)
+        
+        # Local clock is ahead of the server: first attempt is rejected, retry succeeds
+        order_id = adapter.place_limit_order("BTCUSDT", "BUY", price=90.0, qty=0.1)
+        assert order_id == "1"
+        assert standin.rejected_timestamp == 1
+        assert ("GET", "/api/v3/time") in standin.paths
+        
+        # Subsequent calls use the learned offset
+        adapter.get_order_status("BTCUSDT", order_id)
+        assert standin.rejected_timestamp == 1
+
+def test_binance_background_time_sync():
+    import time
+    from tests.binance_standin import BinanceStandIn
+    with BinanceStandIn(clock_skew_ms=10_000) as standin:
+        adapter = BinanceSpotAdapter(base_url=standin.base_url, time_sync_interval_s=0.05)
+        adapter.start_time_sync()
+        try:
+            deadline = time.time() + 2
+            while adapter._last_time_sync is None and time.time() < deadline:
+                time.sleep(0.01)
+            assert adapter._time_offset_ms == pytest.approx(10_000, abs=500)
+        finally:
+            adapter.stop_time_sync()
+
+def test_build_query_string_matches_urlencode():
+    from urllib.parse import urlencode
+    from src.exchange.binance import build_query_string
+    params = {"symbol": "BTCUSDT", "price": "1.50000000", "newClientOrderId": "a b/c", "timestamp": 1}
+    assert build_query_string(params) == urlencode(params)
+
+def test_binance_cancel_replace_order():
+    from tests.binance_standin import BinanceStandIn
+    with BinanceStandIn() as standin:
+        adapter = BinanceSpotAdapter(api_key="key", api_secret="secret", base_url=standin.base_url)
+        order_id = adapter.place_limit_order("BTCUSDT", "BUY", price=90.0, qty=0.1)
+        
+        new_id = adapter.cancel_replace_order("BTCUSDT", order_id, "BUY", price=91.0, qty=0.1)
+        assert new_id != order_id
+        assert adapter.get_order_status("BTCUSDT", order_id) == "CANCELED"
+        assert standin.orders[new_id]["price"] == "91.00000000"
+        
+        # Replacing an order that is no longer open fails as a whole
+        with pytest.raises(ExchangeError, match="cancel-replace failed") as exc:
+            adapter.cancel_replace_order("BTCUSDT", order_id, "BUY", price=92.0, qty=0.1)
+        assert exc.value.code == -2022
+
+def test_binance_get_price_range_from_klines():
+    from tests.binance_standin import BinanceStandIn
+    from src.exchange.binance import KLINES_LIMIT
+    with BinanceStandIn() as standin:
+        adapter = BinanceSpotAdapter(base_url=standin.base_url)
+        standin.klines = [
+            [60_000, 100.0, 101.0, 99.5, 100.5],
+            [120_000, 100.5, 103.0, 100.0, 102.0],
+            [180_000, 102.0, 102.5, 97.0, 98.0],
+        ]
+        assert adapter.get_price_range("BTCUSDT", since_ms=125_000) == (97.0, 103.0)
+        assert adapter.get_price_range("BTCUSDT", since_ms=0) == (97.0, 103.0)
+        assert adapter.get_price_range("BTCUSDT", since_ms=240_000) is None
+        
+        # A full page may be truncated, so the range cannot be trusted
+        standin.klines = [[i * 60_000, 1.0, 1.0, 1.0, 1.0] for i in range(KLINES_LIMIT + 5)]
+        assert adapter.get_price_range("BTCUSDT", since_ms=0) is None
+
+def test_binance_hedges_slow_reads_to_another_endpoint():
+    import time
+    from tests.binance_standin import BinanceStandIn
+    with BinanceStandIn(price=100.0, latency_s=1.0) as slow, BinanceStandIn(price=101.0) as fast:
+        adapter = BinanceSpotAdapter(base_url=f"{slow.base_url},{fast.base_url}")
+        
+        started = time.monotonic()
+        assert adapter.get_price("BTCUSDT") == 101.0
+        assert time.monotonic() - started < 0.9
+        assert fast.request_count == 1
+        
+        # The fast endpoint is now preferred, so the next read goes there first
+        assert adapter.endpoints.ranked()[0] == fast.base_url
+        started = time.monotonic()
+        assert adapter.get_price("BTCUSDT") == 101.0
+        assert time.monotonic() - started < 0.2
+        assert fast.request_count == 2
+
+def test_binance_hedges_only_cheap_reads():
+    from tests.binance_standin import BinanceStandIn
+    with BinanceStandIn(latency_s=0.3) as slow, BinanceStandIn() as fast:
+        adapter = BinanceSpotAdapter(api_key="key", api_secret="secret", base_url=f"{slow.base_url},{fast.base_url}")
+        adapter.endpoints.hedge_delay = lambda: 0.01
+        # Weight-20 account read: one request only, however slow
+        assert adapter.get_balances()["BTC"] == 1.0
+        assert (slow.request_count, fast.request_count) == (1, 0)
+
+def test_binance_reads_fail_over_on_server_errors():
+    from tests.binance_standin import BinanceStandIn
+    with BinanceStandIn(price=98.0) as failing, BinanceStandIn(price=99.0) as live:
+        failing.server_error_responses = 10
+        adapter = BinanceSpotAdapter(base_url=f"{failing.base_url},{live.base_url}", hedge_reads=False)
+        assert adapter.get_price("BTCUSDT") == 99.0
+        adapter = BinanceSpotAdapter(base_url=f"{failing.base_url},{live.base_url}")
+        adapter.endpoints.hedge_delay = lambda: 10.0
+        assert adapter.get_price("BTCUSDT") == 99.0
+
+def test_binance_fails_over_from_unreachable_endpoint():
+    from tests.binance_standin import BinanceStandIn
+    dead = BinanceStandIn()
+    dead_url = dead.start()
+    dead.stop()
+    with BinanceStandIn(price=99.0) as live:
+        adapter = BinanceSpotAdapter(base_url=f"{dead_url},{live.base_url}", hedge_reads=False)
+        assert adapter.get_price("BTCUSDT") == 99.0
+        assert adapter.endpoints.ranked() == [live.base_url, dead_url]
+        
+        # Writes are not re-sent, but go straight to the endpoint that is healthy
+        adapter = BinanceSpotAdapter(api_key="key", api_secret="secret", base_url=f"{dead_url},{live.base_url}")
+        with pytest.raises(ExchangeError, match="Network error"):
+            adapter.place_limit_order("BTCUSDT", "BUY", price=90.0, qty=0.1)
+        assert adapter.place_limit_order("BTCUSDT", "BUY", price=90.0, qty=0.1) == "1"
+
+def test_binance_resolves_lost_order_response_by_client_id():
+    from tests.binance_standin import BinanceStandIn
+    with BinanceStandIn() as standin:
+        adapter = BinanceSpotAdapter(api_key="key", api_secret="secret", base_url=standin.base_url)
+        # Executed, but answered with 503 "execution status unknown"
+        standin.lost_order_responses = 1
+        order_id = adapter.place_limit_order("BTCUSDT", "BUY", price=90.0, qty=0.1, client_order_id="gb_BTCUSDT_3_7")
+        assert list(standin.orders) == [order_id]
+        assert standin.orders[order_id]["clientOrderId"] == "gb_BTCUSDT_3_7"
+        assert adapter.find_order("BTCUSDT", "gb_BTCUSDT_3_7") == order_id
+        assert adapter.find_order("BTCUSDT", "gb_BTCUSDT_3_8") is None
+
+def test_binance_order_timeout_does_not_duplicate():
+    from tests.binance_standin import BinanceStandIn
+    from src.exchange.base import OrderStatusUnknown
+    with BinanceStandIn() as standin:
+        adapter = BinanceSpotAdapter(
+            api_key="key", api_secret="secret", base_url=standin.base_url, order_timeout_s=0.2
+        )
+        standin.order_response_delay_s = 0.5
+        order_id = adapter.place_limit_order("BTCUSDT", "SELL", price=110.0, qty=0.1, client_order_id="gb_x_1_1")
+        assert len(standin.orders) == 1
+        assert standin.orders[order_id]["clientOrderId"] == "gb_x_1_1"
+        
+        # Still open under that id: a second placement resolves to the same order
+        standin.order_response_delay_s = 0.0
+        assert adapter.place_limit_order("BTCUSDT", "SELL", price=110.0, qty=0.1, client_order_id="gb_x_1_1") == order_id
+        assert len(standin.orders) == 1
+        
+        # Unresolvable placements surface as OrderStatusUnknown, never as a plain failure
+        with patch.object(adapter, "find_order", side_effect=ExchangeError("lookup down")):
+            standin.lost_order_responses = 3
+            with pytest.raises(OrderStatusUnknown):
+                adapter.place_limit_order("BTCUSDT", "BUY", price=90.0, qty=0.1, client_order_id="gb_x_0_2")
+        # Retries under the same id were rejected as duplicates of the first attempt
+        assert len(standin.orders) == 2
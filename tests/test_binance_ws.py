@@ -0,0 +1,106 @@
+import io
+import time
+import socket
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from src.exchange.websocket import WebSocketConnection, encode_frame, read_frame, OP_TEXT, OP_PING
+from src.exchange.binance_ws import BinanceWebSocketAdapter
+from tests.binance_standin import BinanceStandIn
+
+def _adapter(standin, **kwargs):
+    return BinanceWebSocketAdapter(
+        api_key="key", api_secret="secret", base_url=standin.base_url, ws_url=standin.ws_url, **kwargs
+    )
+
+@pytest.mark.parametrize("size", [0, 125, 126, 65535, 70000])
+@pytest.mark.parametrize("mask", [True, False])
+def test_frames_round_trip(size, mask):
+    payload = bytes(i % 251 for i in range(size))
+    frame = encode_frame(OP_TEXT, payload, mask)
+    assert read_frame(io.BytesIO(frame)) == (True, OP_TEXT, payload)
+
+def test_order_calls_share_one_websocket_connection():
+    with BinanceStandIn() as standin:
+        adapter = _adapter(standin)
+        order_id = adapter.place_limit_order("BTCUSDT", "BUY", price=90.0, qty=0.1, client_order_id="gb_BTCUSDT_2_1")
+        assert adapter.get_order_status("BTCUSDT", order_id) == "OPEN"
+        assert adapter.find_order("BTCUSDT", "gb_BTCUSDT_2_1") == order_id
+        new_id = adapter.cancel_replace_order("BTCUSDT", order_id, "BUY", 91.0, 0.1, client_order_id="gb_BTCUSDT_2_2")
+        assert standin.orders[order_id]["status"] == "CANCELED"
+        assert adapter.cancel_order("BTCUSDT", new_id) is True
+        assert adapter.cancel_order("BTCUSDT", new_id) is False
+
+        # Market data stays on REST; every order call went over the one connection
+        assert adapter.get_price("BTCUSDT") == 100.0
+        assert [p for p in standin.paths if p[0] != "WS"] == [("GET", "/api/v3/ticker/price")]
+        assert adapter.ws_requests == 6
+        assert adapter.session.connects == 1
+        assert standin.rejected_signature == 0
+        adapter.close()
+
+def test_concurrent_requests_are_multiplexed():
+    with BinanceStandIn(latency_s=0.2) as standin:
+        adapter = _adapter(standin)
+        adapter.place_limit_order("BTCUSDT", "BUY", price=90.0, qty=0.1)
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=10) as pool:
+            ids = list(pool.map(
+                lambda i: adapter.place_limit_order("BTCUSDT", "BUY", price=80.0 + i, qty=0.1, client_order_id=f"gb_m_{i}"),
+                range(10)
+            ))
+        # Ten 0.2 s requests in flight at once on one connection
+        assert time.monotonic() - started < 1.0
+        assert adapter.session.connects == 1
+        # Every caller got the answer to its own request
+        assert [standin.orders[i]["clientOrderId"] for i in ids] == [f"gb_m_{i}" for i in range(10)]
+        adapter.close()
+
+def test_reconnects_after_connection_loss():
+    with BinanceStandIn() as standin:
+        adapter = _adapter(standin, ws_reconnect_backoff_s=0.0)
+        first = adapter.place_limit_order("BTCUSDT", "BUY", price=90.0, qty=0.1)
+        standin.drop_ws_connections()
+        deadline = time.monotonic() + 2
+        while adapter.session.connected and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert adapter.get_order_status("BTCUSDT", first) == "OPEN"
+        assert adapter.session.connects == 2
+        assert adapter.rest_fallbacks == 0
+        adapter.close()
+
+def test_falls_back_to_rest_when_websocket_is_down():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        closed_port = s.getsockname()[1]
+    with BinanceStandIn() as standin:
+        adapter = BinanceWebSocketAdapter(
+            api_key="key", api_secret="secret", base_url=standin.base_url,
+            ws_url=f"ws://127.0.0.1:{closed_port}/ws-api/v3", ws_reconnect_backoff_s=60.0
+        )
+        order_id = adapter.place_limit_order("BTCUSDT", "BUY", price=90.0, qty=0.1)
+        # While the reconnect backs off, requests go straight to REST
+        assert adapter.get_order_status("BTCUSDT", order_id) == "OPEN"
+        assert adapter.rest_fallbacks == 2
+        assert standin.paths == [("POST", "/api/v3/order"), ("GET", "/api/v3/order")]
+
+def test_unanswered_placement_is_resolved_without_duplicates():
+    with BinanceStandIn() as standin:
+        adapter = _adapter(standin, order_timeout_s=0.2)
+        standin.lost_order_responses = 1
+        order_id = adapter.place_limit_order("BTCUSDT", "BUY", price=90.0, qty=0.1, client_order_id="gb_BTCUSDT_3_7")
+        assert list(standin.orders) == [order_id]
+
+        standin.order_response_delay_s = 0.5
+        late_id = adapter.place_limit_order("BTCUSDT", "SELL", price=110.0, qty=0.1, client_order_id="gb_x_1_1")
+        assert len(standin.orders) == 2
+        assert standin.orders[late_id]["clientOrderId"] == "gb_x_1_1"
+        adapter.close()
+
+def test_answers_server_pings():
+    frame = encode_frame(OP_PING, b"hb", mask=False) + encode_frame(OP_TEXT, b'{"id": "1"}', mask=False)
+    server, client = socket.socketpair()
+    with server, client:
+        conn = WebSocketConnection(client, client.makefile("rb"), mask=True)
+        server.sendall(frame)
+        assert conn.recv() == '{"id": "1"}'
+        assert read_frame(server.makefile("rb")) == (True, 0xA, b"hb")
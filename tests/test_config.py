@@ -42,3 +42,25 @@ def test_invalid_range():
         from src.core.config import AppConfig, GridConfig, validate_config
         cfg = AppConfig(grid=GridConfig(range_pct_bottom=0.20, range_pct_top=0.10))
         validate_config(cfg)
+
+def test_bottom_range_must_keep_prices_positive():
+    from src.core.config import AppConfig, GridConfig, validate_config
+    with pytest.raises(ConfigError, match="must be > -1"):
+        validate_config(AppConfig(grid=GridConfig(range_pct_bottom=-1.5, range_pct_top=0.10)))
+
+def test_shadow_grids_override_the_grid_section(tmp_path):
+    config_file = tmp_path / "shadows.yaml"
+    config_file.write_text(yaml.dump({
+        "grid": {"symbol": "ETHUSDT", "grid_intervals": 10, "fee_rate": 0.0005},
+        "shadows": [{"name": "narrow", "grid_intervals": 40}, {"trailing": True}],
+    }))
+    config = load_config(str(config_file), cli_dry_run=True)
+    assert list(config.shadows) == ["narrow", "shadow2"]
+    assert config.shadows["narrow"].grid_intervals == 40
+    assert config.shadows["narrow"].symbol == "ETHUSDT"
+    assert config.shadows["narrow"].fee_rate == 0.0005
+    assert config.shadows["shadow2"].trailing is True
+
+    config_file.write_text(yaml.dump({"grid": {"symbol": "ETHUSDT"}, "shadows": [{"symbol": "BTCUSDT"}]}))
+    with pytest.raises(ConfigError, match="must trade ETHUSDT"):
+        load_config(str(config_file), cli_dry_run=True)
@@ -1,6 +1,6 @@
 import pytest
 from src.bot.state import GridState, BotPhase, BotStateRole
-from src.bot.decision import get_next_order_intent, transition_state_on_fill
+from src.bot.decision import get_next_order_intent, transition_state_on_fill, is_order_funded
 from src.core.math import build_grid
 
 def test_initial_long_order_intent():
@@ -52,3 +52,48 @@ def test_out_of_bounds_blocks_intent():
     
     intent2 = get_next_order_intent(state2, current_price=100.0, levels=levels, mode="LONG", capital=100.0)
     assert intent2 is None
+
+def test_trailing_shift_when_blocked_at_edges():
+    from src.bot.decision import calculate_trailing_shift
+    levels = build_grid(100.0, -0.10, 0.10, 4)
+    ratio = levels[1] / levels[0]
+    
+    # Bought at top, price still in range: shift one level up
+    state = transition_state_on_fill(GridState(phase=BotPhase.BUY, state=BotStateRole.IDLE), filled_index=4)
+    assert calculate_trailing_shift(state, 109.0, levels, ratio) == 1
+    # Price ran well above top: shift enough levels to bring it back in range
+    assert calculate_trailing_shift(state, 110.0 * ratio ** 2.5, levels, ratio) == 3
+    
+    # Sold at bottom with price below range: shift down
+    state2 = transition_state_on_fill(GridState(phase=BotPhase.SELL, state=BotStateRole.IDLE), filled_index=0)
+    assert calculate_trailing_shift(state2, 90.0 / ratio ** 1.5, levels, ratio) == -2
+    
+    # Not blocked: no shift
+    state3 = transition_state_on_fill(GridState(phase=BotPhase.BUY, state=BotStateRole.IDLE), filled_index=2)
+    assert calculate_trailing_shift(state3, 200.0, levels, ratio) == 0
+
+def test_is_order_funded():
+    assert is_order_funded(BotPhase.BUY, 100.0, 1.0, free_base=0.0, free_quote=100.0)
+    assert not is_order_funded(BotPhase.BUY, 100.0, 1.0, free_base=5.0, free_quote=99.0)
+    assert is_order_funded(BotPhase.SELL, 100.0, 1.0, free_base=1.0, free_quote=0.0)
+    assert not is_order_funded(BotPhase.SELL, 100.0, 1.5, free_base=1.0, free_quote=1e6)
+
+def test_client_order_ids_are_deterministic_and_valid():
+    import re
+    from src.bot.decision import make_client_order_id
+    assert make_client_order_id("BTCUSDT", 3, 17) == "gb_BTCUSDT_3_17"
+    assert make_client_order_id("BTCUSDT", 3, 17) != make_client_order_id("BTCUSDT", 3, 18)
+    
+    long_id = make_client_order_id("LONGSYMBOLNAMEFDUSD", -12, 1760000000)
+    assert long_id == make_client_order_id("LONGSYMBOLNAMEFDUSD", -12, 1760000000)
+    for client_id in (long_id, make_client_order_id("ETHBTC", -1, 0)):
+        assert re.fullmatch(r"[.A-Z:/a-z0-9_-]{1,36}", client_id)
+
+def test_fresh_states_do_not_share_client_order_ids(monkeypatch):
+    import time
+    from src.bot.decision import initial_order_seq
+    # Created within the same millisecond
+    monkeypatch.setattr(time, "time", lambda: 1_760_000_000.0005)
+    first, second = initial_order_seq(), initial_order_seq()
+    assert first != second
+    assert first // 1_000_000 == second // 1_000_000 == 1_760_000_000_000
@@ -0,0 +1,37 @@
+import pytest
+from src.exchange.endpoints import EndpointPool
+
+def test_pool_ranks_by_latency_then_unknown_then_cooling_down():
+    pool = EndpointPool(["http://a", "http://b", "http://c", "http://d"])
+    assert pool.ranked() == ["http://a", "http://b", "http://c", "http://d"]
+    
+    pool.record_success("http://c", 0.05)
+    pool.record_success("http://b", 0.20)
+    pool.record_failure("http://a")
+    assert pool.ranked() == ["http://c", "http://b", "http://d", "http://a"]
+    
+    # A success clears the cooldown
+    pool.record_success("http://a", 0.01)
+    assert pool.ranked()[0] == "http://a"
+
+def test_failure_cooldown_backs_off():
+    pool = EndpointPool(["http://a"], failure_cooldown_s=1.0, max_cooldown_s=3.0)
+    health = pool.endpoints["http://a"]
+    pool.record_failure("http://a")
+    first = health.cooldown_until
+    pool.record_failure("http://a")
+    pool.record_failure("http://a")
+    assert health.cooldown_until - first == pytest.approx(2.0, abs=0.1)
+
+def test_hedge_delay_is_p95_after_warmup():
+    pool = EndpointPool(["http://a", "http://b"], default_hedge_delay_s=0.3, min_samples=20)
+    for _ in range(10):
+        pool.record_success("http://a", 0.01)
+    assert pool.hedge_delay() == 0.3
+    
+    for i in range(90):
+        pool.record_success("http://b", 0.01)
+    for _ in range(10):
+        pool.record_success("http://a", 0.5)
+    # 110 samples, the slowest 10 at 0.5s: p95 sits in the slow tail
+    assert pool.hedge_delay() == 0.5
@@ -0,0 +1,66 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.core.config import GridConfig  # noqa: E402
+from src.core.math import MathError  # noqa: E402
+from src.sim.estimator import VolatilityStats, estimate, estimate_configs  # noqa: E402
+from src.sim.vectorized import VectorGridSimulator  # noqa: E402
+
+def _gbm_paths(paths, steps, sigma_per_step, seed=5):
+    rng = np.random.default_rng(seed)
+    log_returns = rng.normal(0, sigma_per_step, (paths, steps))
+    return 100.0 * np.exp(np.hstack([np.zeros((paths, 1)), np.cumsum(log_returns, axis=1)]))
+
+def test_volatility_from_prices():
+    sigma_per_step = 0.002
+    prices = _gbm_paths(1, 20_000, sigma_per_step)[0]
+    stats = VolatilityStats.from_prices(prices, seconds_per_step=60)
+    assert stats.sigma_per_day == pytest.approx(sigma_per_step * np.sqrt(1440), rel=0.03)
+
+    with pytest.raises(MathError):
+        VolatilityStats.from_prices([100.0, 101.0], seconds_per_step=60)
+
+@pytest.mark.parametrize("intervals,long_mode", [(10, True), (4, True), (6, False)])
+def test_expected_fills_match_simulation(intervals, long_mode):
+    # 2 days of 5-minute prices, daily volatility 3%
+    sigma, step_s, days = 0.03, 300, 2
+    steps = days * 86400 // step_s
+    paths = _gbm_paths(100, steps, sigma * np.sqrt(step_s / 86400))
+
+    fills = []
+    for prices in paths:
+        sim = VectorGridSimulator(100.0, -0.05, 0.05, intervals, 100.0, 0.001, long_mode).run(prices)
+        fills.append(sim.fill_count[0])
+
+    est = estimate(-0.05, 0.05, intervals, 100.0, 0.001, long_mode, VolatilityStats(sigma), days,
+                   sample_interval_s=step_s)
+    assert est.fills_per_day * days == pytest.approx(np.mean(fills), rel=0.25)
+
+def test_profit_and_fees_per_round_trip():
+    est = estimate(-0.1, 0.1, 10, 1000.0, [0.0, 0.001, 0.02], True, VolatilityStats(0.02), 1.0)
+    ratio = (1.1 / 0.9) ** 0.1
+
+    assert est.profit_per_round_trip[0] == pytest.approx(100.0 * (ratio - 1))
+    assert est.fees_per_round_trip[1] == pytest.approx(2 * 100.0 * 0.001)
+    # Fees above the level spacing make every round trip a loss
+    assert est.expected_pnl[2] < 0 < est.expected_pnl[1] < est.expected_pnl[0]
+    assert np.all(est.capital_utilization == 0.1)
+
+def test_scores_configs_vectorized():
+    configs = [
+        GridConfig(mode="LONG", grid_intervals=4),
+        GridConfig(mode="SHORT_INVERTED", initial_capital_amount=1.0, grid_intervals=20),
+    ]
+    stats = VolatilityStats(0.03)
+    est = estimate_configs(configs, stats, horizon_days=7)
+
+    assert est.fills_per_day.shape == (2,)
+    # Narrower spacing trades more often
+    assert est.fills_per_day[1] > est.fills_per_day[0]
+    # A wider range keeps the price inside it more of the time
+    wide = estimate([-0.05, -0.5], [0.05, 0.5], 10, 100.0, 0.001, True, stats, 30)
+    assert wide.in_range_fraction[1] > wide.in_range_fraction[0]
+
+    with pytest.raises(MathError):
+        estimate(0.1, -0.1, 10, 100.0, 0.001, True, stats, 1)
@@ -0,0 +1,78 @@
+import json
+import queue
+import logging
+import threading
+import pytest
+
+from src.core.eventlog import setup_logging, log_event, BoundedQueueHandler
+
+@pytest.fixture
+def restore_root_logging():
+    root = logging.getLogger()
+    handlers, level = list(root.handlers), root.level
+    yield
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    for handler in handlers:
+        root.addHandler(handler)
+    root.setLevel(level)
+
+def test_events_written_as_json_lines(tmp_path, restore_root_logging):
+    path = tmp_path / "events.jsonl"
+    listener = setup_logging(event_log=str(path))
+    logger = logging.getLogger("test.events")
+    
+    log_event(logger, "order_placed", symbol="BTCUSDT", price=100.5, qty=0.01)
+    logger.warning("plain %s", "message")
+    listener.stop()
+    
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert lines[0]["event"] == "order_placed"
+    assert lines[0]["symbol"] == "BTCUSDT"
+    assert lines[0]["price"] == 100.5
+    assert lines[0]["level"] == "INFO"
+    assert lines[1]["msg"] == "plain message"
+
+def test_formatting_happens_off_the_calling_thread(tmp_path, restore_root_logging):
+    formatted_on = []
+
+    class Probe:
+        def __str__(self):
+            formatted_on.append(threading.get_ident())
+            return "probe"
+
+    listener = setup_logging(level=logging.INFO, event_log=str(tmp_path / "events.jsonl"))
+    logger = logging.getLogger("test.lazy")
+    logger.debug("skipped %s", Probe())
+    logger.info("kept %s", Probe())
+    listener.stop()
+    
+    assert len(formatted_on) >= 1
+    assert threading.get_ident() not in formatted_on
+
+def test_full_queue_drops_instead_of_blocking():
+    handler = BoundedQueueHandler(queue.Queue(maxsize=4))
+    record = logging.LogRecord("x", logging.INFO, __file__, 0, "m", None, None)
+    for _ in range(7):
+        handler.emit(record)
+    assert handler.queue.qsize() == 4
+    assert handler.dropped == 3
+    
+    # Once the listener catches up, the loss is reported
+    for _ in range(4):
+        handler.queue.get_nowait()
+    handler.emit(record)
+    reported = [handler.queue.get_nowait(), handler.queue.get_nowait()]
+    assert reported[1].getMessage() == "Log queue overflowed; dropped 3 records"
+    assert handler.dropped == 0
+
+def test_event_log_rotates(tmp_path, restore_root_logging):
+    path = tmp_path / "events.jsonl"
+    listener = setup_logging(event_log=str(path), max_bytes=500, backup_count=2)
+    logger = logging.getLogger("test.rotate")
+    for i in range(50):
+        log_event(logger, "tick", n=i)
+    listener.stop()
+    
+    assert (tmp_path / "events.jsonl.1").exists()
+    assert not (tmp_path / "events.jsonl.3").exists()
@@ -51,3 +51,30 @@ def test_mock_exchange_balances():
     balances_end = ex.get_balances()
     assert balances_end["USDT"] == 910.0
     assert balances_end["BTC"] == 2.0
+
+def test_mock_exchange_cancel_replace():
+    import pytest
+    from src.exchange.base import ExchangeError
+    ex = MockExchange(current_price=100.0)
+    
+    order_id = ex.place_limit_order("BTCUSDT", "BUY", price=90.0, qty=1.0)
+    new_id = ex.cancel_replace_order("BTCUSDT", order_id, "BUY", price=95.0, qty=1.0)
+    
+    assert new_id != order_id
+    assert ex.get_order_status("BTCUSDT", order_id) == "CANCELED"
+    assert ex.get_order_status("BTCUSDT", new_id) == "OPEN"
+    
+    # A filled order cannot be replaced
+    ex.set_price(95.0)
+    with pytest.raises(ExchangeError):
+        ex.cancel_replace_order("BTCUSDT", new_id, "BUY", price=94.0, qty=1.0)
+    assert ex.get_order_status("BTCUSDT", new_id) == "FILLED"
+
+def test_mock_exchange_client_order_id_is_idempotent():
+    ex = MockExchange(current_price=100.0)
+    order_id = ex.place_limit_order("BTCUSDT", "BUY", price=90.0, qty=1.0, client_order_id="gb_BTCUSDT_1_1")
+    
+    # A retry under the same client id returns the order already accepted
+    assert ex.place_limit_order("BTCUSDT", "BUY", price=90.0, qty=1.0, client_order_id="gb_BTCUSDT_1_1") == order_id
+    assert len(ex.get_open_orders("BTCUSDT")) == 1
+    assert ex.find_order("BTCUSDT", "gb_BTCUSDT_1_1") == order_id
@@ -0,0 +1,99 @@
+import os
+import time
+import multiprocessing
+import pytest
+import yaml
+from src.core.config import AppConfig, GridConfig, load_fleet_config, ConfigError
+from src.exchange.mock import MockExchange
+from src.exchange.ratelimit import SharedRateBudget, RateLimitedExchange
+from src.bot.persistence import load_state
+from src.bot.fleet import FleetSupervisor, shard_configs, state_file_for
+
+def mock_exchange_factory(config):
+    return MockExchange(current_price=100.0)
+
+def _configs(symbols):
+    return [
+        AppConfig(grid=GridConfig(symbol=s, grid_intervals=4), dry_run=False)
+        for s in symbols
+    ]
+
+def _drain(budget, weight, count):
+    for _ in range(count):
+        budget.acquire(weight)
+
+def test_shared_budget_is_enforced_across_processes():
+    # 60 weight/min at full headroom -> 1 weight/s refill, 60 capacity
+    budget = SharedRateBudget(weight_per_minute=60, headroom=1.0)
+    workers = [multiprocessing.Process(target=_drain, args=(budget, 10, 3)) for _ in range(2)]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join(10)
+    
+    # Both processes drew from the same 60-weight bucket
+    assert budget.available < 1.0
+    assert budget.try_acquire(2) == pytest.approx(2.0, abs=0.2)
+
+def test_rate_limited_exchange_charges_weights():
+    budget = SharedRateBudget(weight_per_minute=100, headroom=1.0)
+    exchange = RateLimitedExchange(MockExchange(), budget)
+    exchange.get_price("BTCUSDT")
+    exchange.place_limit_order("BTCUSDT", "BUY", 90.0, 1.0)
+    assert budget.available == pytest.approx(97.0, abs=0.1)
+
+def test_shard_configs_round_robin():
+    shards = shard_configs(_configs(["A", "B", "C", "D", "E"]), 2)
+    assert [[c.grid.symbol for c in s] for s in shards] == [["A", "C", "E"], ["B", "D"]]
+    assert len(shard_configs(_configs(["A"]), 8)) == 1
+
+def test_load_fleet_config_merges_base_grid(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text(yaml.dump({
+        "grid": {"grid_intervals": 10, "fee_rate": 0.002},
+        "fleet": [{"symbol": "BTCUSDT"}, {"symbol": "ETHUSDT", "grid_intervals": 6}]
+    }))
+    configs = load_fleet_config(str(path), cli_dry_run=True)
+    assert [(c.grid.symbol, c.grid.grid_intervals, c.grid.fee_rate) for c in configs] == [
+        ("BTCUSDT", 10, 0.002), ("ETHUSDT", 6, 0.002)
+    ]
+    
+    path.write_text(yaml.dump({"fleet": [{"symbol": "BTCUSDT"}, {"symbol": "BTCUSDT"}]}))
+    with pytest.raises(ConfigError, match="unique"):
+        load_fleet_config(str(path), cli_dry_run=True)
+
+def _wait_for(predicate, timeout=10.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.05)
+    return False
+
+def test_supervisor_runs_shards_and_restarts_failed_worker(tmp_path):
+    state_dir = str(tmp_path / "states")
+    symbols = ["AAAUSDT", "BBBUSDT", "CCCUSDT"]
+    supervisor = FleetSupervisor(
+        _configs(symbols), state_dir, num_workers=2,
+        exchange_factory=mock_exchange_factory, restart_backoff_seconds=0.0
+    )
+    supervisor.start()
+    try:
+        files = [state_file_for(state_dir, s) for s in symbols]
+        assert _wait_for(lambda: all(os.path.exists(f) for f in files))
+        # First ticks are spread over the scheduler's startup window
+        assert _wait_for(lambda: load_state(files[0]).active_order is not None)
+        first_order = load_state(files[0]).active_order
+        assert first_order is not None
+        
+        supervisor.processes[0].kill()
+        supervisor.processes[0].join(5)
+        supervisor.supervise_once()
+        
+        assert supervisor.restarts[0] == 1
+        assert supervisor.processes[0].is_alive()
+        # The restarted worker resumed the persisted GridState instead of starting over
+        time.sleep(0.5)
+        assert load_state(files[0]).active_order.order_id == first_order.order_id
+    finally:
+        supervisor.stop()
@@ -0,0 +1,125 @@
+import os
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.exchange.binance import BinanceSpotAdapter  # noqa: E402
+from src.exchange.ratelimit import SharedRateBudget, RateLimitedExchange  # noqa: E402
+from src.sim.klines import KlineStore  # noqa: E402
+from tests.binance_standin import BinanceStandIn  # noqa: E402
+
+MINUTE = 60_000
+T0 = 1_600_000_000_000 - 1_600_000_000_000 % MINUTE
+
+def _candles(start, count, skip=()):
+    return [
+        [start + i * MINUTE, 100.0 + i, 101.0 + i, 99.0 + i, 100.5 + i, float(i)]
+        for i in range(count) if i not in skip
+    ]
+
+def _klines_requests(standin):
+    return sum(1 for _, path in standin.paths if path == "/api/v3/klines")
+
+def test_sync_paginates_and_only_fetches_gaps(tmp_path):
+    with BinanceStandIn() as standin:
+        exchange = BinanceSpotAdapter(base_url=standin.base_url)
+        standin.klines = _candles(T0, 2500)
+        store = KlineStore(str(tmp_path), "BTCUSDT", "1m")
+        
+        assert store.sync(exchange, T0 + 500 * MINUTE, T0 + 2500 * MINUTE) == 2000
+        assert _klines_requests(standin) == 2
+        # Already covered: no request at all
+        assert store.sync(exchange, T0 + 600 * MINUTE, T0 + 2000 * MINUTE) == 0
+        assert _klines_requests(standin) == 2
+        
+        # Extending backwards fetches only the missing head and keeps time order
+        assert store.missing(T0, T0 + 2500 * MINUTE) == [(T0, T0 + 500 * MINUTE)]
+        assert store.sync(exchange, T0, T0 + 2500 * MINUTE) == 500
+        assert _klines_requests(standin) == 3
+        
+    data = store.load()
+    assert len(store) == 2500
+    assert np.array_equal(data["open_time"], T0 + np.arange(2500) * MINUTE)
+    assert data["volume"][-1] == 2499.0
+    
+    window = store.load(T0 + 10 * MINUTE, T0 + 20 * MINUTE)
+    assert window["close"].tolist() == [100.5 + i for i in range(10, 20)]
+
+def test_exchange_gaps_are_remembered(tmp_path):
+    with BinanceStandIn() as standin:
+        exchange = BinanceSpotAdapter(base_url=standin.base_url)
+        # Exchange downtime: no candles for minutes 10-19
+        standin.klines = _candles(T0, 60, skip=range(10, 20))
+        store = KlineStore(str(tmp_path), "BTCUSDT", "1m")
+        assert store.sync(exchange, T0, T0 + 60 * MINUTE) == 50
+        
+        reopened = KlineStore(str(tmp_path), "BTCUSDT", "1m")
+        assert reopened.missing(T0, T0 + 60 * MINUTE) == []
+        assert reopened.sync(exchange, T0, T0 + 60 * MINUTE) == 0
+        assert _klines_requests(standin) == 1
+
+def test_interrupted_append_is_truncated_on_open(tmp_path):
+    with BinanceStandIn() as standin:
+        standin.klines = _candles(T0, 30)
+        store = KlineStore(str(tmp_path), "ETHUSDT", "1m")
+        store.sync(BinanceSpotAdapter(base_url=standin.base_url), T0, T0 + 30 * MINUTE)
+    
+    # A crash after writing some columns but before meta.json recorded the rows
+    with open(os.path.join(store.path, "close.bin"), "ab") as f:
+        f.write(np.zeros(3).tobytes())
+    reopened = KlineStore(str(tmp_path), "ETHUSDT", "1m")
+    assert len(reopened) == 30
+    assert len(reopened.load()["close"]) == 30
+
+def test_interrupted_backfill_keeps_columns_aligned(tmp_path, monkeypatch):
+    with BinanceStandIn() as standin:
+        exchange = BinanceSpotAdapter(base_url=standin.base_url)
+        standin.klines = _candles(T0, 15)
+        store = KlineStore(str(tmp_path), "BTCUSDT", "1m")
+        store.sync(exchange, T0 + 10 * MINUTE, T0 + 15 * MINUTE)
+        
+        # A crash after the rewritten columns are on disk, before meta.json switches to them
+        def crash():
+            raise OSError("disk full")
+        monkeypatch.setattr(store, "_save_meta", crash)
+        with pytest.raises(OSError):
+            store.sync(exchange, T0, T0 + 3 * MINUTE)
+        
+        reopened = KlineStore(str(tmp_path), "BTCUSDT", "1m")
+        data = reopened.load()
+        assert data["open_time"].tolist() == [T0 + i * MINUTE for i in range(10, 15)]
+        assert data["open"].tolist() == [100.0 + i for i in range(10, 15)]
+        assert sorted(os.listdir(reopened.path)) == sorted([f"{c}.bin" for c in data] + ["meta.json"])
+        
+        # The retried backfill commits every column together
+        assert reopened.sync(exchange, T0, T0 + 3 * MINUTE) == 3
+        data = KlineStore(str(tmp_path), "BTCUSDT", "1m").load()
+        assert data["open_time"].tolist() == [T0 + i * MINUTE for i in (0, 1, 2, 10, 11, 12, 13, 14)]
+        assert data["open"].tolist() == [100.0 + i for i in (0, 1, 2, 10, 11, 12, 13, 14)]
+
+class _RecordingBudget(SharedRateBudget):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.charged = []
+
+    def acquire(self, weight):
+        self.charged.append(weight)
+        return super().acquire(weight)
+
+def test_pages_are_charged_to_the_rate_budget(tmp_path):
+    with BinanceStandIn() as standin:
+        standin.klines = _candles(T0, 1500)
+        budget = _RecordingBudget(weight_per_minute=1000, headroom=1.0)
+        exchange = RateLimitedExchange(BinanceSpotAdapter(base_url=standin.base_url), budget)
+        KlineStore(str(tmp_path), "BTCUSDT", "1m").sync(exchange, T0, T0 + 1500 * MINUTE)
+    # Two pages of weight 2; the budget refills while they run, so count what was charged
+    assert budget.charged == [2, 2]
+
+def test_open_candle_is_not_stored(tmp_path):
+    import time
+    now_minute = int(time.time() * 1000) // MINUTE * MINUTE
+    with BinanceStandIn() as standin:
+        standin.klines = _candles(now_minute - 5 * MINUTE, 6)
+        store = KlineStore(str(tmp_path), "BTCUSDT", "1m")
+        assert store.sync(BinanceSpotAdapter(base_url=standin.base_url), now_minute - 5 * MINUTE) == 5
+    assert store.load()["open_time"][-1] == now_minute - MINUTE
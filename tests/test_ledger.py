@@ -0,0 +1,60 @@
+import pytest
+from src.bot.state import BotPhase
+from src.bot.ledger import FillLedger
+
+def test_round_trip_realizes_pnl_net_of_fees():
+    ledger = FillLedger(fee_rate=0.001)
+    
+    # Opening buy realizes nothing; its fee stays on the lot
+    assert ledger.record_fill(BotPhase.BUY, 100.0, 1.0, grid_index=2) == 0.0
+    assert ledger.inventory == 1.0
+    
+    pnl = ledger.record_fill(BotPhase.SELL, 110.0, 1.0, grid_index=3)
+    # 10 gross - 0.1 entry fee - 0.11 exit fee
+    assert pnl == pytest.approx(9.79)
+    assert ledger.realized_pnl == pytest.approx(9.79)
+    assert ledger.fees_paid == pytest.approx(0.21)
+    assert ledger.inventory == 0.0
+    assert len(ledger) == 2
+    assert list(ledger.realized) == pytest.approx([0.0, 9.79])
+
+def test_closing_fill_prefers_adjacent_level_lot():
+    ledger = FillLedger()
+    ledger.record_fill(BotPhase.BUY, 90.0, 1.0, grid_index=0)   # exits at 1
+    ledger.record_fill(BotPhase.BUY, 100.0, 1.0, grid_index=2)  # exits at 3
+    
+    # Sell at level 3 closes the level-2 lot, not the older level-0 one
+    assert ledger.record_fill(BotPhase.SELL, 105.0, 1.0, grid_index=3) == pytest.approx(5.0)
+    # A sell at an unrelated level falls back to the oldest open lot
+    assert ledger.record_fill(BotPhase.SELL, 95.0, 1.0, grid_index=5) == pytest.approx(5.0)
+    assert ledger.inventory == 0.0
+    assert ledger.open_lots() == []
+
+def test_partial_close_and_flip_to_short():
+    ledger = FillLedger()
+    ledger.record_fill(BotPhase.BUY, 100.0, 1.0, grid_index=2)
+    
+    pnl = ledger.record_fill(BotPhase.SELL, 104.0, 1.5, grid_index=3)
+    assert pnl == pytest.approx(4.0)
+    assert ledger.inventory == pytest.approx(-0.5)
+    
+    lots = ledger.open_lots()
+    assert len(lots) == 1
+    assert lots[0].side == BotPhase.SELL
+    assert lots[0].exit_index == 2
+    
+    # Short lot marked below entry is in profit
+    assert ledger.unrealized_pnl(100.0) == pytest.approx(2.0)
+
+def test_unrealized_pnl_includes_entry_fees():
+    ledger = FillLedger(fee_rate=0.01)
+    ledger.record_fill(BotPhase.BUY, 100.0, 2.0, grid_index=1)
+    assert ledger.unrealized_pnl(110.0) == pytest.approx(20.0 - 2.0)
+
+def test_rebuild_from_open_lots():
+    ledger = FillLedger(fee_rate=0.001)
+    ledger.record_fill(BotPhase.BUY, 100.0, 1.0, grid_index=2)
+    
+    restored = FillLedger.from_open_lots(0.001, ledger.open_lots())
+    assert restored.inventory == 1.0
+    assert restored.record_fill(BotPhase.SELL, 110.0, 1.0, grid_index=3) == pytest.approx(9.79)
@@ -1,4 +1,5 @@
 import pytest
+from dataclasses import replace
 from src.core.config import AppConfig, GridConfig
 from src.exchange.mock import MockExchange
 from src.exchange.base import SymbolRules
@@ -101,3 +102,234 @@ def test_orchestrator_execute_tick_live_mock(tmp_path):
     assert bot.state.active_order.side == "SELL"
     # Buy filled at index 2 (100.0). Sell should be index 3 (approx 104.88)
     assert bot.state.active_order.grid_index == 3
+
+def test_orchestrator_realizes_pnl_on_round_trip(tmp_path):
+    from src.bot.persistence import load_state
+    state_file = str(tmp_path / "state.json")
+    
+    config = AppConfig(grid=GridConfig(
+        symbol="BTCUSDT",
+        mode="LONG",
+        initial_capital_amount=100.0,
+        range_pct_bottom=-0.10,
+        range_pct_top=0.10,
+        grid_intervals=4,
+        fee_rate=0.001
+    ), dry_run=False)
+    
+    exchange = MockExchange(current_price=100.0)
+    bot = GridBotOrchestrator(config, exchange, state_file=state_file)
+    bot.initialize()
+    
+    bot.execute_tick()  # BUY at level 2
+    exchange.set_price(99.0)
+    bot.execute_tick()  # BUY fills, SELL at level 3 placed
+    assert bot.state.realized_pnl == 0.0
+    assert len(load_state(state_file).open_lots) == 1
+    
+    buy_price = bot.levels[2]
+    sell_price = bot.levels[3]
+    # LONG sizes every order at capital / N quote, so the sell closes part of the lot
+    sell_qty = 25.0 / sell_price
+    exchange.set_price(sell_price)
+    bot.execute_tick()  # SELL fills
+    
+    expected = (sell_price - buy_price) * sell_qty - (buy_price + sell_price) * sell_qty * 0.001
+    assert bot.state.realized_pnl == pytest.approx(expected)
+    assert load_state(state_file).open_lots[0].qty == pytest.approx(25.0 / buy_price - sell_qty)
+
+def test_orchestrator_reprices_when_grid_level_moves(tmp_path):
+    config = AppConfig(grid=GridConfig(
+        symbol="BTCUSDT",
+        mode="LONG",
+        initial_capital_amount=100.0,
+        range_pct_bottom=-0.10,
+        range_pct_top=0.10,
+        grid_intervals=4
+    ), dry_run=False)
+    
+    exchange = MockExchange(current_price=100.0)
+    exchange.add_symbol_rules("BTCUSDT", SymbolRules(0.01, 0.00001, 0.0, 0.0))
+    bot = GridBotOrchestrator(config, exchange, state_file=str(tmp_path / "state.json"))
+    bot.initialize()
+    bot.execute_tick()
+    old_id = bot.state.active_order.order_id
+    
+    # Unchanged grid: the resting order is left alone
+    bot.execute_tick()
+    assert bot.state.active_order.order_id == old_id
+    
+    # Grid shifted under the order: one cancel-replace moves it
+    bot.levels = [p * 0.98 for p in bot.levels]
+    bot.execute_tick()
+    
+    order = bot.state.active_order
+    assert order.order_id != old_id
+    assert order.price == pytest.approx(bot.levels[2], abs=0.01)
+    assert exchange.get_order_status("BTCUSDT", old_id) == "CANCELED"
+
+def test_orchestrator_trailing_grid_follows_price(tmp_path):
+    from src.bot.persistence import load_state
+    state_file = str(tmp_path / "state.json")
+    config = AppConfig(grid=GridConfig(
+        symbol="BTCUSDT",
+        mode="LONG",
+        initial_capital_amount=100.0,
+        range_pct_bottom=-0.10,
+        range_pct_top=0.10,
+        grid_intervals=4,
+        trailing=True
+    ), dry_run=False)
+    
+    exchange = MockExchange(current_price=100.0)
+    bot = GridBotOrchestrator(config, exchange, state_file=state_file)
+    bot.initialize()
+    
+    # Start by buying at the top level, then let the price run away upwards
+    exchange.set_price(111.0)
+    bot.execute_tick()
+    assert bot.state.active_order.grid_index == 4
+    exchange.set_price(110.0)
+    bot.execute_tick()
+    
+    # Instead of idling, the grid shifted up and a sell one level above the buy is resting
+    assert bot.state.grid_offset == 1
+    assert bot.state.active_order is not None
+    assert bot.state.active_order.side == "SELL"
+    assert bot.state.active_order.price == pytest.approx(110.0 * bot.levels.ratio)
+    assert bot.levels[-1] == pytest.approx(110.0 * bot.levels.ratio)
+    
+    # A restart replays the offset
+    bot2 = GridBotOrchestrator(config, exchange, state_file=state_file)
+    bot2.initialize()
+    assert load_state(state_file).grid_offset == 1
+    assert list(bot2.levels) == pytest.approx(list(bot.levels))
+
+class _CountingExchange(MockExchange):
+    def __init__(self, *args, price_range=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.price_range = price_range
+        self.status_calls = 0
+
+    def get_order_status(self, symbol, order_id):
+        self.status_calls += 1
+        return super().get_order_status(symbol, order_id)
+
+    def get_price_range(self, symbol, since_ms):
+        return self.price_range
+
+def _gated_bot(tmp_path, exchange, forced_minutes=30.0):
+    config = AppConfig(grid=GridConfig(
+        symbol="BTCUSDT",
+        mode="LONG",
+        range_pct_bottom=-0.10,
+        range_pct_top=0.10,
+        grid_intervals=4,
+        forced_status_check_minutes=forced_minutes
+    ), dry_run=False)
+    bot = GridBotOrchestrator(config, exchange, state_file=str(tmp_path / "state.json"))
+    bot.initialize()
+    return bot
+
+def test_orchestrator_skips_status_lookup_until_price_reaches_order(tmp_path):
+    exchange = _CountingExchange(current_price=100.0)
+    bot = _gated_bot(tmp_path, exchange)
+    bot.execute_tick()
+    assert bot.state.active_order.price < 100.0
+    
+    for p in (100.0, 101.0, 102.5, 99.6):
+        exchange.set_price(p)
+        bot.execute_tick()
+    assert exchange.status_calls == 0
+    
+    exchange.set_price(99.0)
+    bot.execute_tick()
+    assert exchange.status_calls == 1
+    assert bot.state.active_order.side == "SELL"
+
+def test_orchestrator_polls_when_klines_show_a_wick(tmp_path):
+    exchange = _CountingExchange(current_price=100.0, price_range=(100.5, 102.0))
+    bot = _gated_bot(tmp_path, exchange)
+    bot.execute_tick()
+    exchange.set_price(101.0)
+    bot.execute_tick()
+    baseline = exchange.status_calls
+    
+    # Tick prices stayed above the BUY near 99.5, but a kline traded through it
+    exchange.price_range = (99.0, 101.5)
+    exchange.set_price(101.0)
+    bot.execute_tick()
+    assert exchange.status_calls == baseline + 1
+
+def test_orchestrator_forces_periodic_status_lookup(tmp_path):
+    exchange = _CountingExchange(current_price=100.0)
+    bot = _gated_bot(tmp_path, exchange, forced_minutes=0)
+    bot.execute_tick()
+    for p in (101.0, 102.0, 103.0):
+        exchange.set_price(p)
+        bot.execute_tick()
+    assert exchange.status_calls == 3
+
+def test_orchestrator_rechecks_order_after_failed_cancel_replace(tmp_path):
+    exchange = _CountingExchange(current_price=100.0)
+    bot = _gated_bot(tmp_path, exchange)
+    bot.execute_tick()
+    old_id = bot.state.active_order.order_id
+    # Cancelled behind the bot's back, then a geometry change moves its level
+    exchange.cancel_order("BTCUSDT", old_id)
+    bot.apply_config(AppConfig(grid=replace(bot.config.grid, grid_intervals=5), dry_run=False))
+
+    bot.execute_tick()  # cancel-replace fails: the order is not open
+    assert bot.state.active_order.order_id == old_id
+    bot.execute_tick()  # looked up although the price never reached it, then replaced
+    assert bot.state.active_order.order_id != old_id
+    assert exchange.get_order_status("BTCUSDT", bot.state.active_order.order_id) == "OPEN"
+
+class _LossyExchange(MockExchange):
+    """Executes placements but loses the answer to the next `lose` of them."""
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lose = 0
+        self.placements = []
+
+    def place_limit_order(self, symbol, side, price, qty, client_order_id=None):
+        from src.exchange.base import OrderStatusUnknown
+        order_id = super().place_limit_order(symbol, side, price, qty, client_order_id)
+        self.placements.append(client_order_id)
+        if self.lose:
+            self.lose -= 1
+            raise OrderStatusUnknown("execution status unknown")
+        return order_id
+
+def test_orchestrator_resolves_unanswered_placement_by_client_id(tmp_path):
+    from src.bot.persistence import load_state
+    exchange = _LossyExchange(current_price=100.0)
+    bot = _gated_bot(tmp_path, exchange)
+    exchange.lose = 1
+    bot.execute_tick()
+    
+    order = load_state(bot.state_file).active_order
+    assert order.status == "UNKNOWN" and order.order_id == ""
+    assert order.client_order_id == f"gb_BTCUSDT_{order.grid_index}_{bot.state.order_seq - 1}"
+    
+    # Next tick finds the order under its client id instead of placing another one
+    bot.execute_tick()
+    assert bot.state.active_order.order_id == "mock_1"
+    assert bot.state.active_order.status == "OPEN"
+    assert len(exchange.placements) == 1
+
+def test_orchestrator_replaces_placement_that_never_arrived(tmp_path):
+    exchange = _LossyExchange(current_price=100.0)
+    bot = _gated_bot(tmp_path, exchange)
+    exchange.lose = 1
+    bot.execute_tick()
+    lost_id = bot.state.active_order.client_order_id
+    # The exchange never had it
+    exchange._client_ids.clear()
+    exchange._orders.clear()
+    
+    bot.execute_tick()
+    assert bot.state.active_order.status == "OPEN"
+    # A fresh sequence number: the new order never shares the lost one's id
+    assert exchange.placements == [lost_id, bot.state.active_order.client_order_id]
+    assert bot.state.active_order.client_order_id != lost_id
@@ -72,3 +72,24 @@ def test_rounding_tick_size():
     assert round_tick_size(100.126, 0.01) == 100.13
     assert round_tick_size(100.999, 0.1) == 101.0
     assert round_tick_size(100.0, 0.0) == 100.0
+
+def test_grid_ladder_shift_matches_extended_grid():
+    from src.core.math import GridLadder
+    base = build_grid(100.0, -0.10, 0.10, 4)
+    ladder = GridLadder(base)
+    assert list(ladder) == base
+    assert ladder[-1] == base[-1]
+    
+    ladder.shift(2)
+    assert ladder.offset == 2
+    assert list(ladder) == pytest.approx(base[2:] + [base[-1] * ladder.ratio, base[-1] * ladder.ratio ** 2])
+    
+    ladder.shift(-3)
+    assert list(ladder) == pytest.approx([base[0] / ladder.ratio] + base[:-1])
+    
+    # Shifts larger than the window recompute it, and a replayed offset gives the same levels
+    ladder.shift(10)
+    assert list(ladder) == pytest.approx(list(GridLadder(base, offset=9)))
+    
+    with pytest.raises(IndexError):
+        ladder[5]
@@ -0,0 +1,72 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.core.config import GridConfig  # noqa: E402
+from src.core.math import MathError  # noqa: E402
+from src.sim.vectorized import VectorGridSimulator  # noqa: E402
+from src.sim.montecarlo import (  # noqa: E402
+    GBM, JumpDiffusion, RegimeSwitching, Bootstrap, generate_paths, simulate_paths, stress_test
+)
+
+CONFIG = GridConfig(mode="LONG", grid_intervals=6, range_pct_bottom=-0.05, range_pct_top=0.05)
+
+def test_batched_paths_match_single_path_runs():
+    prices = generate_paths(GBM(0.01), paths=5, steps=300, rng=np.random.default_rng(2))
+    for config in (CONFIG, GridConfig(mode="SHORT_INVERTED", initial_capital_amount=1.0, grid_intervals=4)):
+        result = simulate_paths(config, prices)
+        for i, path in enumerate(prices):
+            single = VectorGridSimulator.from_configs([config], p0=path[0]).run(path)
+            assert result.fills[i] == single.fill_count[0]
+            assert result.pnl[i] == pytest.approx(single.total_pnl(path[-1])[0])
+
+def test_drawdown_and_time_out_of_range():
+    # Up one level, back down, then far above the range
+    prices = np.array([[100.0, 101.0, 99.0, 104.0, 120.0, 130.0]])
+    result = simulate_paths(CONFIG, prices)
+    assert result.out_of_range_fraction[0] == pytest.approx(2 / 6)
+    assert result.max_drawdown[0] >= 0
+
+    stats = stress_test(CONFIG, GBM(0.005), paths=500, steps=200, seed=1)
+    assert stats.paths == 500
+    assert np.all((stats.out_of_range_fraction >= 0) & (stats.out_of_range_fraction <= 1))
+    pct = stats.percentiles((5, 50, 95))
+    assert pct["pnl"][5] <= pct["pnl"][50] <= pct["pnl"][95]
+    assert pct["max_drawdown"][5] >= 0
+    wide = stress_test(GridConfig(grid_intervals=6, range_pct_bottom=-0.5, range_pct_top=0.5),
+                       GBM(0.005), paths=500, steps=200, seed=1)
+    assert wide.out_of_range_fraction.mean() < stats.out_of_range_fraction.mean()
+
+def test_stress_test_is_reproducible_and_batched():
+    a = stress_test(CONFIG, GBM(0.004), paths=1000, steps=100, seed=7, batch_paths=300)
+    b = stress_test(CONFIG, GBM(0.004), paths=1000, steps=100, seed=7, batch_paths=300)
+    assert a.pnl.shape == (1000,)
+    np.testing.assert_array_equal(a.pnl, b.pnl)
+    with pytest.raises(MathError):
+        stress_test(CONFIG, GBM(0.004), paths=0, steps=100)
+
+def test_path_models():
+    rng = np.random.default_rng(3)
+    assert GBM(0.01).log_returns(rng, 200, 500).std() == pytest.approx(0.01, rel=0.05)
+
+    jumps = JumpDiffusion(0.01, jump_rate=0.05, jump_mean=-0.02, jump_std=0.03).log_returns(rng, 400, 500)
+    assert jumps.mean() == pytest.approx(0.05 * -0.02, abs=2e-4)
+    assert jumps.var() == pytest.approx(0.01 ** 2 + 0.05 * (0.02 ** 2 + 0.03 ** 2), rel=0.05)
+
+    # Calm regime 0 never leaves, so every path stays calm; regime 1 always switches to 0
+    model = RegimeSwitching(sigmas=[0.001, 0.05], drifts=[0.0, 0.0], transition=[[1.0, 0.0], [1.0, 0.0]], initial_regime=1)
+    regimes = model.regimes(rng, 50, 20)
+    assert np.all(regimes[:, 0] == 1) and np.all(regimes[:, 1:] == 0)
+    sticky = RegimeSwitching([0.001, 0.05], [0.0, 0.0], [[0.9, 0.1], [0.2, 0.8]])
+    # Stationary share of regime 1 is 0.1 / (0.1 + 0.2)
+    assert sticky.regimes(rng, 200, 2000)[:, 500:].mean() == pytest.approx(1 / 3, abs=0.02)
+    with pytest.raises(MathError):
+        RegimeSwitching([0.01, 0.02], [0.0, 0.0], [[0.5, 0.6], [0.5, 0.5]])
+
+    history = np.arange(10, dtype=float)
+    sample = Bootstrap(history, block_size=4).log_returns(rng, 30, 9)
+    assert sample.shape == (30, 9)
+    # Blocks are runs of consecutive history entries
+    assert np.all(np.diff(sample[:, :4], axis=1) == 1)
+    prices = generate_paths(Bootstrap.from_prices([100.0, 101.0, 99.0, 102.0]), 10, 50, p0=50.0, rng=rng)
+    assert prices.shape == (10, 51) and np.all(prices[:, 0] == 50.0)
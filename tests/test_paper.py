@@ -0,0 +1,90 @@
+import pytest
+from src.core.config import AppConfig, GridConfig
+from src.exchange.mock import MockExchange
+from src.exchange.paper import PaperExchange
+from src.bot.loop import GridBotOrchestrator
+from src.bot.state import BotPhase
+
+def _dry_run_config(symbol="BTCUSDT"):
+    return AppConfig(grid=GridConfig(symbol=symbol, mode="LONG", grid_intervals=4), dry_run=True)
+
+def test_dry_run_uses_only_public_market_data(tmp_path):
+    from tests.binance_standin import BinanceStandIn
+    from src.exchange.binance import BinanceSpotAdapter
+    with BinanceStandIn(price=100.0) as standin:
+        adapter = BinanceSpotAdapter(base_url=standin.base_url)
+        bot = GridBotOrchestrator(_dry_run_config(), adapter, state_file=str(tmp_path / "s.json"))
+        bot.initialize()
+        bot.execute_tick()
+        buy = bot.state.active_order
+        assert buy.order_id.startswith("dry_run_")
+        
+        standin.price = buy.price - 0.5
+        bot.execute_tick()
+        assert bot.state.phase == BotPhase.SELL
+        assert bot.state.active_order.side == "SELL"
+    
+    public = {"/api/v3/ticker/price", "/api/v3/exchangeInfo", "/api/v3/klines"}
+    assert {path for _, path in standin.paths} <= public
+    assert standin.orders == {}
+
+def test_paper_order_fills_on_traded_range():
+    market = MockExchange(current_price=100.0)
+    paper = PaperExchange(market)
+    paper.get_price("BTCUSDT")
+    order_id = paper.place_limit_order("BTCUSDT", "BUY", 99.0, 0.1)
+    assert paper.get_order_status("BTCUSDT", order_id) == "OPEN"
+    
+    # Price is back at 100, but the market traded down to 98.5 in between
+    market.get_price_range = lambda symbol, since_ms: (98.5, 100.5)
+    paper.get_price_range("BTCUSDT", 0)
+    assert paper.get_order_status("BTCUSDT", order_id) == "FILLED"
+    assert paper.get_balances()["BTC"] == pytest.approx(1.1)
+
+def test_paper_orders_from_an_earlier_run_are_replaced(tmp_path):
+    market = MockExchange(current_price=100.0)
+    state_file = str(tmp_path / "s.json")
+    first = GridBotOrchestrator(_dry_run_config(), market, state_file=state_file)
+    first.initialize()
+    first.execute_tick()
+    old_id = first.state.active_order.order_id
+    
+    restarted = GridBotOrchestrator(_dry_run_config(), market, state_file=state_file)
+    restarted.initialize()
+    restarted.execute_tick()  # unknown paper order -> canceled -> IDLE
+    restarted.execute_tick()
+    assert restarted.state.active_order is not None
+    assert restarted.state.active_order.order_id != old_id
+
+def test_paper_grids_track_prices_per_symbol(tmp_path):
+    market = MockExchange()
+    market.set_price(100.0, "BTCUSDT")
+    market.set_price(10.0, "ETHUSDT")
+    paper = PaperExchange(market)
+    bots = []
+    for symbol in ("BTCUSDT", "ETHUSDT"):
+        bot = GridBotOrchestrator(_dry_run_config(symbol), paper, state_file=str(tmp_path / f"{symbol}.json"))
+        bot.initialize()
+        bot.execute_tick()
+        bots.append(bot)
+    
+    market.set_price(9.0, "ETHUSDT")
+    for bot in bots:
+        bot.execute_tick()
+    assert bots[0].state.phase == BotPhase.BUY
+    assert bots[1].state.phase == BotPhase.SELL
+
+def test_dry_run_trades_pairs_with_any_quote_asset(tmp_path):
+    from tests.binance_standin import BinanceStandIn
+    from src.exchange.binance import BinanceSpotAdapter
+    with BinanceStandIn(price=100.0) as standin:
+        adapter = BinanceSpotAdapter(base_url=standin.base_url)
+        bot = GridBotOrchestrator(_dry_run_config("BTCBRL"), adapter, state_file=str(tmp_path / "s.json"))
+        bot.initialize()
+        bot.execute_tick()
+        standin.price = bot.state.active_order.price - 0.5
+        bot.execute_tick()
+        assert bot.state.active_order.side == "SELL"
+        # Assets come from exchangeInfo, not from a list of known quote assets
+        balances = bot.exchange.get_balances()
+        assert balances["BTC"] > 1.0 and balances["BRL"] < 0.0
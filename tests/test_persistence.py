@@ -1,5 +1,5 @@
 import os
-from src.bot.state import GridState, BotPhase, BotStateRole, ActiveOrder
+from src.bot.state import GridState, BotPhase, BotStateRole, ActiveOrder, OpenLot
 from src.bot.persistence import save_state, load_state
 
 def test_save_and_load_state_empty(tmp_path):
@@ -56,3 +56,60 @@ def test_save_and_load_state_full(tmp_path):
 def test_load_nonexistent_state():
     loaded = load_state("does_not_exist.json")
     assert loaded is None
+
+def _full_state():
+    return GridState(
+        phase=BotPhase.SELL,
+        state=BotStateRole.WAITING_ORDER_FILL,
+        p0_reference_price=50000.0,
+        active_order=ActiveOrder("12345", BotPhase.SELL, 50000.0, 1.5, 4, "OPEN", "gb_BTCUSDT_2_41"),
+        last_filled_index=3,
+        realized_pnl=15.5,
+        estimated_balances={"BTC": 0.5, "USDT": 1000.0},
+        open_lots=[OpenLot(BotPhase.BUY, 1.5, 48000.0, 48.0, 4)],
+        grid_offset=-2,
+        order_seq=42
+    )
+
+def test_client_order_ids_round_trip_as_json(tmp_path):
+    filepath = str(tmp_path / "state.json")
+    state = _full_state()
+    save_state(state, filepath)
+    assert load_state(filepath) == state
+
+def test_save_and_load_state_binary(tmp_path):
+    filepath = str(tmp_path / "state.bin")
+    state = _full_state()
+    
+    save_state(state, filepath)
+    with open(filepath, "rb") as f:
+        assert f.read(4) == b"GRDS"
+    
+    assert load_state(filepath) == state
+
+def test_binary_state_skips_unknown_fields():
+    import struct
+    from src.bot.persistence import encode_state, decode_state
+    state = _full_state()
+    # A newer writer appended a field this reader does not know
+    payload = encode_state(state) + struct.pack("<BI", 200, 3) + b"xyz"
+    assert decode_state(payload) == state
+
+def test_binary_state_rejects_newer_version():
+    import struct
+    import pytest
+    from src.bot.persistence import encode_state, decode_state, StateFormatError
+    payload = bytearray(encode_state(_full_state()))
+    struct.pack_into("<H", payload, 4, 99)
+    with pytest.raises(StateFormatError, match="newer"):
+        decode_state(bytes(payload))
+
+def test_export_binary_state_to_json(tmp_path):
+    import json
+    from src.bot.persistence import export_state_json
+    save_state(_full_state(), str(tmp_path / "state.bin"))
+    export_state_json(str(tmp_path / "state.bin"), str(tmp_path / "state.json"))
+    
+    data = json.loads((tmp_path / "state.json").read_text())
+    assert data["active_order"]["order_id"] == "12345"
+    assert load_state(str(tmp_path / "state.json")) == _full_state()
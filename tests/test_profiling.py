@@ -0,0 +1,54 @@
+import tracemalloc
+from pathlib import Path
+from src.core.profiling import TickProfiler
+
+class _FakeBot:
+    def __init__(self):
+        self.ticks = 0
+        self.buffer = []
+
+    def execute_tick(self):
+        self.ticks += 1
+        self.buffer.append(bytearray(1024))
+
+def test_profiler_wraps_only_first_n_ticks(tmp_path):
+    bot = _FakeBot()
+    original = bot.execute_tick
+    profiler = TickProfiler(str(tmp_path), profile_ticks=3)
+    profiler.attach(bot)
+    
+    assert bot.execute_tick != original
+    for _ in range(5):
+        bot.execute_tick()
+        
+    assert bot.ticks == 5
+    assert profiler.ticks_profiled == 3
+    assert profiler.ticks_total == 5
+    profiler.detach()
+
+def test_profiler_dump_writes_reports(tmp_path):
+    bot = _FakeBot()
+    profiler = TickProfiler(str(tmp_path), profile_ticks=2)
+    profiler.attach(bot)
+    bot.execute_tick()
+    
+    report_dir = Path(profiler.dump(reason="test"))
+    profiler.detach()
+    
+    assert (report_dir / "ticks.pstats").exists()
+    assert "Profiled ticks: 1 of 1" in (report_dir / "ticks.txt").read_text(encoding="utf-8")
+    assert "Top 25 allocation changes" in (report_dir / "allocations.txt").read_text(encoding="utf-8")
+
+def test_detach_restores_tick_and_stops_tracing(tmp_path):
+    bot = _FakeBot()
+    original = bot.execute_tick
+    was_tracing = tracemalloc.is_tracing()
+    profiler = TickProfiler(str(tmp_path))
+    profiler.attach(bot)
+    assert tracemalloc.is_tracing()
+    
+    profiler.detach()
+    assert bot.execute_tick == original
+    bot.execute_tick()
+    assert profiler.ticks_total == 0
+    assert tracemalloc.is_tracing() == was_tracing
@@ -0,0 +1,157 @@
+import pytest
+import threading
+from src.core.config import AppConfig, GridConfig
+from src.exchange.mock import MockExchange
+from src.bot.loop import GridBotOrchestrator
+from src.bot.state import BotPhase, BotStateRole
+from src.bot.persistence import load_state
+from src.bot.reconcile import initialize_bots, reconcile_bots
+
+def _config(symbol="BTCUSDT", dry_run=False):
+    return AppConfig(
+        grid=GridConfig(symbol=symbol, mode="LONG", grid_intervals=4),
+        dry_run=dry_run, api_key="key", api_secret="secret"
+    )
+
+def _resting_bot(tmp_path, exchange, symbol="BTCUSDT"):
+    """Runs one tick so a BUY rests on the exchange, then returns a freshly restarted bot."""
+    state_file = str(tmp_path / f"{symbol}.json")
+    first = GridBotOrchestrator(_config(symbol), exchange, state_file=state_file)
+    first.initialize()
+    first.execute_tick()
+    restarted = GridBotOrchestrator(_config(symbol), exchange, state_file=state_file)
+    restarted.initialize()
+    return first.state.active_order, restarted
+
+class _CountingExchange(MockExchange):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.status_calls = 0
+
+    def get_order_status(self, symbol, order_id):
+        self.status_calls += 1
+        return super().get_order_status(symbol, order_id)
+
+def test_fill_while_down_is_booked_from_trades(tmp_path):
+    exchange = _CountingExchange(current_price=100.0)
+    order, bot = _resting_bot(tmp_path, exchange)
+    exchange.set_price(order.price - 1)
+    exchange.get_open_orders("BTCUSDT")  # the matching engine runs while the bot is down
+    
+    reports = reconcile_bots([bot], exchange)
+    assert reports[0].outcome == "filled"
+    assert exchange.status_calls == 0
+    state = load_state(bot.state_file)
+    assert state.phase == BotPhase.SELL
+    assert state.state == BotStateRole.IDLE
+    assert state.last_filled_index == order.grid_index
+    assert len(state.open_lots) == 1
+    assert state.estimated_balances["BTC"] > 1.0
+
+def test_open_order_kept_and_unknown_orders_reported(tmp_path):
+    exchange = MockExchange(current_price=100.0)
+    order, bot = _resting_bot(tmp_path, exchange)
+    stray = exchange.place_limit_order("BTCUSDT", "SELL", 150.0, 0.1)
+    
+    report = reconcile_bots([bot], exchange)[0]
+    assert report.outcome == "open"
+    assert report.unknown_open_orders == [stray]
+    assert bot.state.active_order.order_id == order.order_id
+    assert exchange.get_order_status("BTCUSDT", stray) == "OPEN"
+
+def test_order_canceled_while_down_goes_idle(tmp_path):
+    exchange = MockExchange(current_price=100.0)
+    order, bot = _resting_bot(tmp_path, exchange)
+    exchange.cancel_order("BTCUSDT", order.order_id)
+    
+    assert reconcile_bots([bot], exchange)[0].outcome == "closed"
+    assert bot.state.active_order is None
+    assert bot.state.state == BotStateRole.IDLE
+
+def test_dry_run_bots_are_skipped(tmp_path):
+    exchange = MockExchange()
+    bot = GridBotOrchestrator(_config(dry_run=True), exchange, state_file=str(tmp_path / "s.json"))
+    bot.initialize()
+    assert reconcile_bots([bot], exchange)[0].outcome == "skipped"
+
+class _ConcurrencyProbe(MockExchange):
+    """
+    Holds every startup lookup until `target` of them are in flight at once (or a
+    timeout passes), so peak shows how many requests the caller really overlaps.
+    """
+
+    def __init__(self, target, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.target = target
+        self.probing = False
+        self.in_flight = 0
+        self.peak = 0
+        self._cond = threading.Condition()
+
+    def _probe(self):
+        if not self.probing:
+            return
+        with self._cond:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+            self._cond.notify_all()
+            self._cond.wait_for(lambda: self.peak >= self.target, timeout=5.0)
+            self.in_flight -= 1
+
+    def get_symbol_rules(self, symbol):
+        self._probe()
+        return super().get_symbol_rules(symbol)
+
+    def get_open_orders(self, symbol):
+        self._probe()
+        return super().get_open_orders(symbol)
+
+    def get_recent_trades(self, symbol, since_ms):
+        self._probe()
+        return super().get_recent_trades(symbol, since_ms)
+
+def test_fleet_restart_is_reconciled_concurrently(tmp_path):
+    symbols = [f"SYM{i}USDT" for i in range(50)]
+    exchange = _ConcurrencyProbe(target=8, current_price=100.0)
+    orders = {}
+    for symbol in symbols:
+        bot = GridBotOrchestrator(_config(symbol), exchange, state_file=str(tmp_path / f"{symbol}.json"))
+        bot.initialize()
+        bot.execute_tick()
+        orders[symbol] = bot.state.active_order
+    # Half of the grids fill while the fleet is down
+    for symbol in symbols[::2]:
+        exchange.set_price(orders[symbol].price - 1, symbol)
+        exchange.get_open_orders(symbol)
+    
+    restarted = [
+        GridBotOrchestrator(_config(s), exchange, state_file=str(tmp_path / f"{s}.json")) for s in symbols
+    ]
+    exchange.probing = True
+    initialize_bots(restarted)
+    assert exchange.peak >= 8
+    exchange.peak = 0
+    reports = reconcile_bots(restarted, exchange)
+    assert exchange.peak >= 8
+    
+    outcomes = [r.outcome for r in reports]
+    assert outcomes.count("filled") == 25
+    assert outcomes.count("open") == 25
+
+def test_unanswered_placement_is_resolved_by_client_id(tmp_path):
+    from src.bot.persistence import save_state
+    from src.bot.balances import BalanceLedger
+    exchange = MockExchange(current_price=100.0)
+    order, bot = _resting_bot(tmp_path, exchange)
+    # The process died after sending the order but before learning its id
+    bot.state.active_order.order_id = ""
+    bot.state.active_order.status = "UNKNOWN"
+    save_state(bot.state, bot.state_file)
+    restarted = GridBotOrchestrator(_config(), exchange, state_file=bot.state_file, balances=BalanceLedger())
+    restarted.initialize()
+    
+    assert reconcile_bots([restarted], exchange)[0].outcome == "open"
+    assert restarted.state.active_order.order_id == order.order_id
+    assert load_state(bot.state_file).active_order.status == "OPEN"
+    # Reserved once, not once per lookup
+    assert restarted.balances.locked("USDT") == pytest.approx(order.price * order.qty)
@@ -0,0 +1,144 @@
+import os
+import time
+import threading
+import pytest
+import yaml
+from dataclasses import replace
+from src.core.config import AppConfig, GridConfig, ConfigError
+from src.exchange.mock import MockExchange
+from src.bot.loop import GridBotOrchestrator
+from src.bot.reload import ConfigWatcher, check_reload, diff_configs
+
+def _config(**grid_overrides) -> AppConfig:
+    grid = GridConfig(symbol="BTCUSDT", mode="LONG", initial_capital_amount=100.0, grid_intervals=4)
+    return AppConfig(grid=replace(grid, **grid_overrides), dry_run=False)
+
+def test_diff_and_unsafe_changes_are_rejected():
+    old = _config()
+    assert diff_configs(old, _config()) == []
+    
+    changes = check_reload(old, _config(fee_rate=0.002, check_interval_minutes=1))
+    assert {c.field for c in changes} == {"fee_rate", "check_interval_minutes"}
+    
+    with pytest.raises(ConfigError, match="symbol: changing the symbol"):
+        check_reload(old, _config(symbol="ETHUSDT"))
+    with pytest.raises(ConfigError, match="dry_run"):
+        check_reload(old, replace(old, dry_run=True))
+
+def test_apply_safe_changes_in_place(tmp_path):
+    exchange = MockExchange(current_price=100.0)
+    bot = GridBotOrchestrator(_config(), exchange, state_file=str(tmp_path / "state.json"))
+    bot.initialize()
+    levels_before = bot.levels
+    
+    bot.apply_config(_config(fee_rate=0.002, check_interval_minutes=1))
+    
+    assert bot.ledger.fee_rate == 0.002
+    assert bot.config.grid.check_interval_minutes == 1
+    assert bot.levels is levels_before  # no geometry change, no rebuild
+
+def test_rejected_reload_leaves_bot_untouched(tmp_path):
+    bot = GridBotOrchestrator(_config(), MockExchange(), state_file=str(tmp_path / "state.json"))
+    bot.initialize()
+    with pytest.raises(ConfigError):
+        bot.apply_config(_config(mode="SHORT_INVERTED", fee_rate=0.5))
+    assert bot.config.grid.fee_rate == 0.001
+
+def test_geometry_change_rebuilds_grid_and_moves_resting_order(tmp_path):
+    exchange = MockExchange(current_price=100.0)
+    bot = GridBotOrchestrator(_config(), exchange, state_file=str(tmp_path / "state.json"))
+    bot.initialize()
+    bot.execute_tick()  # BUY resting at level 2 (~99.5)
+    exchange.set_price(99.0)
+    bot.execute_tick()  # filled, SELL resting at level 3
+    old_sell_id = bot.state.active_order.order_id
+    
+    bot.apply_config(_config(grid_intervals=8))
+    
+    assert len(bot.levels) == 9
+    # Old level 2 (buy) and 3 (resting sell, lot exit) are new levels 4 and 6
+    assert bot.state.last_filled_index == 4
+    assert bot.state.active_order.grid_index == 6
+    assert bot.state.open_lots[0].exit_index == 6
+    
+    # Same prices on the finer grid: nothing to reprice
+    bot.execute_tick()
+    assert bot.state.active_order.order_id == old_sell_id
+    
+    # A wider range moves every level: the resting sell is cancel-replaced onto its new level
+    bot.apply_config(_config(grid_intervals=8, range_pct_top=0.20))
+    index = bot.state.active_order.grid_index
+    bot.execute_tick()
+    assert bot.state.active_order.order_id != old_sell_id
+    assert bot.state.active_order.price == pytest.approx(bot.levels[index], abs=0.01)
+    assert exchange.get_order_status("BTCUSDT", old_sell_id) == "CANCELED"
+
+def test_rejected_grid_rebuild_leaves_the_bot_untouched(tmp_path):
+    bot = GridBotOrchestrator(_config(), MockExchange(current_price=100.0), state_file=str(tmp_path / "state.json"))
+    bot.initialize()
+    config, levels = bot.config, bot.levels
+    
+    # Skips config validation, as a programmatic caller could: build_grid rejects it
+    with pytest.raises(ConfigError, match="bottom price must be > 0"):
+        bot.apply_config(_config(range_pct_bottom=-1.5, grid_intervals=8, fee_rate=0.002))
+    assert bot.config is config
+    assert bot.levels is levels
+    assert bot.ledger.fee_rate == config.grid.fee_rate
+
+def test_config_watcher_detects_file_change_and_signal(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text(yaml.dump({"grid": {"fee_rate": 0.001}}))
+    watcher = ConfigWatcher(str(path), cli_dry_run=True)
+    assert watcher.poll() is None
+    
+    path.write_text(yaml.dump({"grid": {"fee_rate": 0.002}}))
+    os.utime(path, (time.time() + 5, time.time() + 5))
+    assert watcher.poll().grid.fee_rate == 0.002
+    assert watcher.poll() is None
+    
+    watcher.request_reload()
+    assert watcher.poll() is not None
+
+@pytest.mark.parametrize("text", ["grid: [unclosed", "grid:\n  grid_intervals: abc\n"])
+def test_broken_config_edit_keeps_the_bot_running(tmp_path, text):
+    path = tmp_path / "config.yaml"
+    path.write_text(yaml.dump({"grid": {"symbol": "BTCUSDT", "grid_intervals": 4}}))
+    bot = GridBotOrchestrator(_config(), MockExchange(current_price=100.0), state_file=str(tmp_path / "state.json"))
+    bot.initialize()
+    bot.config_watcher = ConfigWatcher(str(path), cli_dry_run=False)
+
+    path.write_text(text)
+    bot.config_watcher.request_reload()
+    with pytest.raises(ConfigError):
+        bot.config_watcher.poll()
+    bot.config_watcher.request_reload()
+    bot._check_config_reload()
+    assert bot.config.grid.grid_intervals == 4
+
+def test_run_loop_applies_a_config_edit_without_waiting_for_the_next_tick(tmp_path):
+    grid = {"symbol": "BTCUSDT", "grid_intervals": 4, "initial_capital_amount": 100.0}
+    path = tmp_path / "config.yaml"
+    path.write_text(yaml.dump({"grid": grid}))
+    config = replace(_config(), dry_run=True)
+    bot = GridBotOrchestrator(config, MockExchange(current_price=100.0), state_file=str(tmp_path / "state.json"))
+    bot.initialize()
+    bot.config_watcher = ConfigWatcher(str(path), cli_dry_run=True)
+    ticks = []
+    bot.execute_tick = lambda: ticks.append(time.monotonic())
+    
+    loop = threading.Thread(target=bot.run_loop, daemon=True)
+    loop.start()
+    try:
+        path.write_text(yaml.dump({"grid": {**grid, "fee_rate": 0.002}}))
+        os.utime(path, (time.time() + 5, time.time() + 5))
+        deadline = time.monotonic() + 5
+        while bot.ledger.fee_rate != 0.002 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert bot.ledger.fee_rate == 0.002
+        # Applied by the watcher thread's wakeup; the check interval was not cut short
+        assert len(ticks) == 1
+    finally:
+        bot.running = False
+        bot.config_watcher.request_reload()
+        loop.join(timeout=5)
+    assert not loop.is_alive()
@@ -0,0 +1,113 @@
+import time
+import threading
+
+from src.bot.scheduler import TickScheduler
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+def test_first_ticks_are_spread_and_dispatched_in_due_order():
+    clock = _Clock()
+    scheduler = TickScheduler(max_workers=1, startup_spread_s=10.0, clock=clock, seed=1)
+    ran = []
+    for i in range(200):
+        scheduler.add(f"g{i}", lambda i=i: ran.append(i), lambda: 60.0)
+    try:
+        first = scheduler.next_due()
+        assert clock.now <= first < clock.now + 10.0
+
+        clock.now += 5.0
+        while scheduler.run_pending():
+            scheduler.wait_idle(5)
+        # Roughly half the grids were due after half the spread window
+        assert 60 < len(ran) < 140
+        assert scheduler.next_due() > clock.now
+    finally:
+        scheduler.shutdown()
+
+def test_reschedules_with_jitter_after_each_tick():
+    clock = _Clock()
+    scheduler = TickScheduler(max_workers=2, jitter=0.1, clock=clock, seed=2)
+    scheduler.add("a", lambda: None, lambda: 100.0, first_due=clock.now)
+    try:
+        assert scheduler.run_pending() == 1
+        scheduler.wait_idle(5)
+        # Not due again until about one interval later
+        assert scheduler.run_pending() == 0
+        assert clock.now + 90.0 <= scheduler.next_due() <= clock.now + 110.0
+    finally:
+        scheduler.shutdown()
+
+def test_failing_tick_keeps_its_schedule():
+    clock = _Clock()
+    scheduler = TickScheduler(clock=clock)
+    calls = []
+
+    def fail():
+        calls.append(1)
+        raise RuntimeError("boom")
+
+    scheduler.add("a", fail, lambda: 60.0, first_due=clock.now)
+    try:
+        scheduler.run_pending()
+        scheduler.wait_idle(5)
+        clock.now += 70.0
+        scheduler.run_pending()
+        scheduler.wait_idle(5)
+        assert len(calls) == 2
+    finally:
+        scheduler.shutdown()
+
+def test_pool_is_bounded_and_lag_is_reported():
+    clock = _Clock()
+    scheduler = TickScheduler(max_workers=2, clock=clock)
+    release = threading.Event()
+    for key in "abc":
+        scheduler.add(key, lambda: release.wait(5), lambda: 60.0, first_due=clock.now)
+    try:
+        assert scheduler.run_pending() == 2
+        # No slot is free for the third due tick until one finishes
+        assert scheduler.run_pending() == 0
+        clock.now += 3.0
+        release.set()
+        scheduler.wait_idle(5)
+        assert scheduler.run_pending() == 1
+        scheduler.wait_idle(5)
+
+        stats = scheduler.lag_stats()
+        assert stats["ticks"] == 3
+        assert stats["max_s"] >= 3.0
+    finally:
+        scheduler.shutdown()
+
+def test_removed_task_is_not_rescheduled():
+    clock = _Clock()
+    scheduler = TickScheduler(clock=clock)
+    scheduler.add("a", lambda: None, lambda: 60.0, first_due=clock.now)
+    scheduler.add("b", lambda: None, lambda: 60.0, first_due=clock.now + 1)
+    scheduler.remove("a")
+    try:
+        assert len(scheduler) == 1
+        assert scheduler.next_due() == clock.now + 1
+    finally:
+        scheduler.shutdown()
+
+def test_run_until_stopped():
+    scheduler = TickScheduler(max_workers=4, startup_spread_s=0.0)
+    counts = {k: 0 for k in ("a", "b", "c")}
+
+    def tick(key):
+        counts[key] += 1
+
+    for key in counts:
+        scheduler.add(key, lambda key=key: tick(key), lambda: 0.01)
+    deadline = time.monotonic() + 0.3
+    try:
+        scheduler.run(lambda: time.monotonic() >= deadline, poll_s=0.05)
+    finally:
+        scheduler.shutdown()
+    assert all(c >= 5 for c in counts.values())
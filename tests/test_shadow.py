@@ -0,0 +1,77 @@
+import math
+import pytest
+from src.core.config import AppConfig, GridConfig
+from src.exchange.mock import MockExchange
+from src.exchange.base import SymbolRules
+from src.bot.loop import GridBotOrchestrator
+from src.bot.shadow import ShadowGrid, format_shadow_report
+
+class _CountingExchange:
+    """Forwards to a MockExchange and counts every method call."""
+
+    def __init__(self, inner):
+        self.inner = inner
+        self.calls = 0
+
+    def __getattr__(self, name):
+        attr = getattr(self.inner, name)
+        if not callable(attr):
+            return attr
+
+        def counted(*args, **kwargs):
+            self.calls += 1
+            return attr(*args, **kwargs)
+        return counted
+
+def _grid(**overrides):
+    fields = dict(symbol="BTCUSDT", mode="LONG", initial_capital_amount=100.0, range_pct_bottom=-0.10,
+                  range_pct_top=0.10, grid_intervals=4, fee_rate=0.001, forced_status_check_minutes=0.0)
+    fields.update(overrides)
+    return GridConfig(**fields)
+
+def _prices(steps=400):
+    # Oscillates across several levels of the 4-interval grid
+    return [100.0 * (1 + 0.08 * math.sin(i / 7.0)) for i in range(steps)]
+
+def _run(tmp_path, shadows):
+    config = AppConfig(grid=_grid(), dry_run=False, shadows=shadows)
+    exchange = _CountingExchange(MockExchange(current_price=100.0))
+    bot = GridBotOrchestrator(config, exchange, state_file=str(tmp_path / f"state{len(shadows)}.json"))
+    bot.initialize()
+    for price in _prices():
+        exchange.inner.set_price(price)
+        bot.execute_tick()
+    return bot, exchange
+
+def test_shadow_of_the_live_config_tracks_the_live_grid(tmp_path):
+    bot, _ = _run(tmp_path, {"same": _grid()})
+    live, same = bot.shadow_report()
+    assert same.name == "same"
+    assert same.fills == live.fills > 4
+    assert same.realized_pnl == pytest.approx(live.realized_pnl)
+    assert same.unrealized_pnl == pytest.approx(live.unrealized_pnl)
+    assert "same" in format_shadow_report(bot.shadow_report())
+
+def test_shadows_issue_no_exchange_calls(tmp_path):
+    _, plain = _run(tmp_path, {})
+    bot, shadowed = _run(tmp_path, {"narrow": _grid(grid_intervals=16), "short": _grid(mode="SHORT_INVERTED", initial_capital_amount=1.0)})
+    assert shadowed.calls == plain.calls
+    live, narrow, short = bot.shadow_report()
+    # A finer grid trades the same oscillation more often
+    assert narrow.fills > live.fills
+    assert short.fills > 0
+
+def test_trailing_shadow_follows_price_out_of_range():
+    rules = SymbolRules(0.01, 0.00001, 0.0, 0.0)
+    fixed = ShadowGrid("fixed", _grid(), rules, p0=100.0)
+    trailing = ShadowGrid("trailing", _grid(trailing=True), rules, p0=100.0)
+    # Buy at the top level, then the price runs away upwards
+    for price in [111.0, 110.0, 116.0]:
+        fixed.on_price(price)
+        trailing.on_price(price)
+    assert trailing.state.grid_offset >= 1
+    assert trailing.result().fills == 2
+    assert trailing.result().realized_pnl > 0
+    # The fixed grid bought at the top and has nothing left to sell into
+    assert fixed.result().fills == 1
+    assert fixed.state.active_order is None
@@ -0,0 +1,63 @@
+import random
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.core.config import AppConfig, GridConfig  # noqa: E402
+from src.exchange.mock import MockExchange  # noqa: E402
+from src.bot.loop import GridBotOrchestrator  # noqa: E402
+from src.bot.state import BotPhase  # noqa: E402
+from src.sim.vectorized import VectorGridSimulator, PHASE_BUY  # noqa: E402
+
+CONFIGS = [
+    GridConfig(mode="LONG", grid_intervals=4, range_pct_bottom=-0.10, range_pct_top=0.10),
+    GridConfig(mode="LONG", grid_intervals=10, range_pct_bottom=-0.05, range_pct_top=0.15, fee_rate=0.002),
+    GridConfig(mode="SHORT_INVERTED", initial_capital_amount=1.0, grid_intervals=6),
+    GridConfig(mode="SHORT_INVERTED", initial_capital_amount=2.0, grid_intervals=3,
+               range_pct_bottom=-0.02, range_pct_top=0.02),
+]
+
+def _price_path(n=400, seed=3):
+    rng = random.Random(seed)
+    prices = [100.0]
+    for _ in range(n):
+        prices.append(prices[-1] * (1 + rng.gauss(0, 0.01)))
+    return prices
+
+def test_vectorized_matches_orchestrator(tmp_path):
+    prices = _price_path()
+    
+    sim = VectorGridSimulator.from_configs(CONFIGS, p0=prices[0])
+    sim.run(prices)
+    
+    for i, grid in enumerate(CONFIGS):
+        exchange = MockExchange(current_price=prices[0])
+        bot = GridBotOrchestrator(AppConfig(grid=grid, dry_run=False), exchange, state_file=str(tmp_path / f"{i}.json"))
+        bot.initialize()
+        for p in prices:
+            exchange.set_price(p)
+            bot.execute_tick()
+        
+        assert sim.fill_count[i] == len(bot.ledger)
+        assert sim.last_filled[i] == (-1 if bot.state.last_filled_index is None else bot.state.last_filled_index)
+        assert (sim.phase[i] == PHASE_BUY) == (bot.state.phase == BotPhase.BUY)
+        assert sim.has_order[i] == (bot.state.active_order is not None)
+        if bot.state.active_order:
+            assert sim.order_price[i] == pytest.approx(bot.state.active_order.price)
+        total = bot.ledger.realized_pnl + bot.ledger.unrealized_pnl(prices[-1])
+        assert sim.total_pnl(prices[-1])[i] == pytest.approx(total, abs=1e-9)
+
+def test_vectorized_grid_sweep_shapes():
+    n = 1000
+    sim = VectorGridSimulator(
+        p0=100.0,
+        range_pct_bottom=np.linspace(-0.30, -0.02, n),
+        range_pct_top=0.10,
+        grid_intervals=np.arange(n) % 40 + 2,
+        capital=100.0,
+        fee_rate=0.001,
+        long_mode=True,
+    )
+    sim.run(_price_path(200))
+    assert sim.realized_pnl.shape == (n,)
+    assert sim.fill_count.sum() > 0
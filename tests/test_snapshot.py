@@ -0,0 +1,60 @@
+import time
+from src.core.config import AppConfig, GridConfig
+from src.exchange.base import SymbolRules
+from src.exchange.mock import MockExchange
+from src.bot.loop import GridBotOrchestrator
+from src.bot.snapshot import StartupSnapshot, snapshot_key, load_snapshot, save_snapshot
+
+def test_snapshot_roundtrip_and_key_invalidation(tmp_path):
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("grid:\n  symbol: BTCUSDT\n")
+    path = str(tmp_path / "state.json.snapshot")
+    
+    key = snapshot_key(str(config_file))
+    snap = StartupSnapshot(
+        key=key,
+        created_at=time.time(),
+        raw_config={"grid": {"symbol": "BTCUSDT"}},
+        rules=SymbolRules(0.01, 0.0001, 5.0, 0.0001),
+        p0_reference_price=100.0,
+        levels=[90.0, 100.0, 110.0]
+    )
+    save_snapshot(snap, path)
+    
+    assert load_snapshot(path, key) == snap
+    
+    config_file.write_text("grid:\n  symbol: ETHUSDT\n")
+    assert load_snapshot(path, snapshot_key(str(config_file))) is None
+
+def test_snapshot_expires(tmp_path):
+    path = str(tmp_path / "snap")
+    save_snapshot(StartupSnapshot(key="k", created_at=time.time() - 100, raw_config={}), path)
+    assert load_snapshot(path, "k", max_age_seconds=10) is None
+    assert load_snapshot(path, "k", max_age_seconds=1000) is not None
+
+class _CountingExchange(MockExchange):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.rules_calls = 0
+
+    def get_symbol_rules(self, symbol):
+        self.rules_calls += 1
+        return super().get_symbol_rules(symbol)
+
+def test_orchestrator_initialize_uses_snapshot(tmp_path):
+    config = AppConfig(grid=GridConfig(grid_intervals=4), dry_run=True)
+    exchange = _CountingExchange(current_price=100.0)
+    snap = StartupSnapshot(key="k", created_at=time.time(), raw_config={})
+    
+    # Cold: rules are fetched and the snapshot is filled in
+    bot = GridBotOrchestrator(config, exchange, state_file=str(tmp_path / "s1.json"))
+    bot.initialize(snapshot=snap)
+    assert exchange.rules_calls == 1
+    assert snap.rules == bot.rules
+    assert snap.levels == list(bot.levels)
+    
+    # Warm: no rules call, levels reused for the same P0
+    bot2 = GridBotOrchestrator(config, exchange, state_file=str(tmp_path / "s2.json"))
+    bot2.initialize(snapshot=snap)
+    assert exchange.rules_calls == 1
+    assert list(bot2.levels) == snap.levels